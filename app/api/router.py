@@ -2,11 +2,21 @@
 from fastapi import APIRouter
 
 from app.api.routes.auth import router as auth_router
+from app.api.routes.properties import router as properties_router
 from app.api.routes.rooms import router as rooms_router
 from app.api.routes.bookings import router as bookings_router
+from app.api.routes.holds import router as holds_router
+from app.api.routes.rates import router as rates_router
+from app.api.routes.blackouts import router as blackouts_router
+from app.api.routes.reports import router as reports_router
 
 api_router = APIRouter()
 
 api_router.include_router(auth_router)
+api_router.include_router(properties_router)
 api_router.include_router(rooms_router)
 api_router.include_router(bookings_router)
+api_router.include_router(holds_router)
+api_router.include_router(rates_router)
+api_router.include_router(blackouts_router)
+api_router.include_router(reports_router)
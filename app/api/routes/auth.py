@@ -1,12 +1,17 @@
 # app/api/routes/auth.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.security import create_access_token, get_current_user
-from app.db.session import get_db
+from app.db.partitions import get_property_read_db
+from app.db.session import get_db, get_read_db
 from app.schemas.auth import LoginRequest, TokenResponse
+from app.schemas.booking import BookingPublic
 from app.schemas.user import UserCreate, UserPublic
 from app.services.auth_service import authenticate_user, create_user
+from app.services.booking_service import list_user_bookings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -22,7 +27,7 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
+def login(data: LoginRequest, db: Session = Depends(get_read_db)):
     user = authenticate_user(db, data.email, data.password)
     if not user:
         raise HTTPException(
@@ -37,3 +42,20 @@ def login(data: LoginRequest, db: Session = Depends(get_db)):
 @router.get("/me", response_model=UserPublic)
 def me(current_user=Depends(get_current_user)):
     return current_user
+
+
+@router.get("/me/bookings", response_model=List[BookingPublic])
+def my_bookings(
+    when: str = Query(default="upcoming", description="upcoming | past | all"),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    The user's bookings at the request's property (accounts are shared by all properties).
+    """
+    try:
+        return list_user_bookings(db, current_user.id, when=when, limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,46 @@
+# app/api/routes/blackouts.py
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.db.partitions import get_property_db, get_property_read_db
+from app.schemas.blackout import BlackoutCreate, BlackoutPublic
+from app.services.blackout_service import create_blackout, delete_blackout, list_blackouts
+
+router = APIRouter(prefix="/blackouts", tags=["blackouts"])
+
+
+@router.get("/", response_model=List[BlackoutPublic])
+def get_blackouts(
+    room_type: Optional[str] = Query(default=None, max_length=30),
+    include_past: bool = Query(default=False, description="Set true to include finished blackouts"),
+    db: Session = Depends(get_property_read_db),
+):
+    return list_blackouts(db, room_type=room_type, include_past=include_past)
+
+
+@router.post("/", response_model=BlackoutPublic, status_code=status.HTTP_201_CREATED)
+def add_blackout(data: BlackoutCreate, db: Session = Depends(get_property_db)):
+    """
+    Withholds units of a room type for a date range (existing bookings are kept).
+    Later we can protect this as an admin-only endpoint.
+    """
+    try:
+        return create_blackout(db, data)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating blackout: {str(e)}")
+
+
+@router.delete("/{blackout_id}", response_model=BlackoutPublic)
+def remove_blackout(blackout_id: int, db: Session = Depends(get_property_db)):
+    try:
+        return delete_blackout(db, blackout_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting blackout: {str(e)}")
@@ -1,10 +1,14 @@
 # app/api/routes/bookings.py
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.security import get_optional_user
+from app.db.partitions import get_property_code, get_property_db, get_property_read_db
+from app.db.session import property_of
 from app.schemas.booking import (
     AvailabilityCheck,
     AvailabilityResponse,
@@ -12,21 +16,37 @@ from app.schemas.booking import (
     BookingCreateResponse,
     BookingPublic,
 )
-from app.services.booking_service import cancel_booking, check_availability, create_booking, list_bookings
+from app.schemas.booking_change import BookingChangesPage
+from app.services.booking_service import (
+    booking_to_public,
+    cancel_booking,
+    cancel_booking_staged,
+    check_availability,
+    create_booking,
+    create_booking_staged,
+    get_booking,
+    list_bookings,
+    lookup_bookings,
+)
+from app.services.change_feed import change_feed_hub, list_changes
+from app.services.write_pipeline import PipelineUnavailable, get_booking_pipeline
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
 
 @router.get("/", response_model=List[BookingPublic])
-def get_all_bookings(db: Session = Depends(get_db)):
+def get_all_bookings(
+    include_archived: bool = Query(default=False, description="Set true to include archived bookings"),
+    db: Session = Depends(get_property_read_db),
+):
     try:
-        return list_bookings(db)
+        return list_bookings(db, include_archived=include_archived)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching bookings: {str(e)}")
 
 
 @router.post("/check-availability", response_model=AvailabilityResponse)
-def availability(data: AvailabilityCheck, db: Session = Depends(get_db)):
+def availability(data: AvailabilityCheck, db: Session = Depends(get_property_read_db)):
     try:
         return check_availability(db, data.room_type, data.check_in, data.check_out)
     except ValueError as e:
@@ -35,54 +55,141 @@ def availability(data: AvailabilityCheck, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error checking availability: {str(e)}")
 
 
+@router.get("/changes", response_model=BookingChangesPage)
+def get_changes(
+    since: Optional[int] = Query(default=None, description="Last seq you have; omit to get the current seq"),
+    limit: int = Query(default=500, ge=1, le=500),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Booking events (created, cancelled, expired) after `since`, oldest first.
+    Dashboards load GET /bookings/ once, then follow this (or the stream).
+    """
+    try:
+        return list_changes(db, since=since, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching booking changes: {str(e)}")
+
+
+@router.get("/changes/stream")
+async def stream_changes(
+    since: Optional[int] = Query(default=None, ge=0),
+    last_event_id: Optional[str] = Header(default=None),
+    property_code: str = Depends(get_property_code),
+):
+    """
+    Server-sent events: one event per booking change (id = seq). Reconnecting
+    clients resume from Last-Event-ID; a "reset" event means reload the list.
+    """
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    if not change_feed_hub.running:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Change feed is not running")
+    try:
+        broadcaster = await change_feed_hub.broadcaster(property_code)
+        body = broadcaster.stream(since)
+        # Subscribe now, so a full server answers 503 instead of an empty stream
+        first = await body.__anext__()
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    async def events():
+        try:
+            yield first
+            async for message in body:
+                yield message
+        finally:
+            # Unsubscribes now on disconnect, not whenever the generator is collected
+            await body.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/lookup", response_model=List[BookingPublic])
+def lookup(
+    email: str = Query(default=None, max_length=254),
+    phone: str = Query(default=None, max_length=30),
+    booking_id: str = Query(default=None, max_length=20),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Front-desk guest lookup by exactly one of email, phone or booking code.
+    """
+    try:
+        return lookup_bookings(db, email=email, phone=phone, booking_id=booking_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error looking up bookings: {str(e)}")
+
+
 @router.post("/", response_model=BookingCreateResponse, status_code=status.HTTP_201_CREATED)
-def add_booking(data: BookingCreate, db: Session = Depends(get_db)):
+def add_booking(data: BookingCreate, db: Session = Depends(get_property_db), current_user=Depends(get_optional_user)):
     try:
-        booking = create_booking(db, data)
-
-        # Return full booking (room_type/room_name included via list_bookings formatting style)
-        # We’ll reuse list_bookings logic pattern for consistent output
-        # Minimal approach: build response dict here.
-        room_type = booking.room.room_type if booking.room else "Unknown"
-        room_name = booking.room.name if booking.room else None
-
-        booking_public = {
-            "id": booking.id,
-            "booking_id": booking.booking_id,
-            "name": booking.name,
-            "email": booking.email,
-            "phone": booking.phone,
-            "room_type": room_type,
-            "room_name": room_name,
-            "check_in": booking.check_in,
-            "check_out": booking.check_out,
-            "guests": booking.guests,
-            "price_per_night": booking.price_per_night,
-            "total_nights": booking.total_nights,
-            "total_price": booking.total_price,
-            "status": booking.status,
-            "special_requests": booking.special_requests,
-            "created_at": booking.created_at,
-        }
+        # Logged-in guests get the booking linked to their account
+        user_id = current_user.id if current_user else None
+
+        pipeline = get_booking_pipeline(property_of(db))
+        if pipeline is not None:
+            # Group-committed by the single writer thread
+            booking_public = pipeline.execute(create_booking_staged, data, user_id)
+        else:
+            booking = create_booking(db, data, user_id)
+            booking_public = booking_to_public(booking, booking.room)
 
         return {"message": "Booking created successfully", "booking": booking_public}
     except LookupError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PipelineUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating booking: {str(e)}")
 
 
 @router.put("/{booking_id}/cancel", response_model=dict)
-def cancel(booking_id: str, db: Session = Depends(get_db)):
+def cancel(booking_id: str, db: Session = Depends(get_property_db)):
     """
     FIXED: cancels by public booking_id string (e.g., LUX123456), not numeric id.
     """
     try:
-        booking = cancel_booking(db, booking_id)
-        return {"message": "Booking cancelled successfully", "booking_id": booking.booking_id}
+        pipeline = get_booking_pipeline(property_of(db))
+        if pipeline is not None:
+            cancelled_id = pipeline.execute(cancel_booking_staged, booking_id)
+        else:
+            cancelled_id = cancel_booking(db, booking_id).booking_id
+        return {"message": "Booking cancelled successfully", "booking_id": cancelled_id}
     except LookupError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PipelineUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error cancelling booking: {str(e)}")
+
+
+@router.get("/{booking_id}", response_model=BookingPublic)
+def get_one_booking(booking_id: str, db: Session = Depends(get_property_read_db)):
+    """
+    Looks up a booking by public booking_id (archived bookings included).
+    """
+    try:
+        return get_booking(db, booking_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,56 @@
+# app/api/routes/holds.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.partitions import get_property_db, get_property_read_db
+from app.db.session import property_of
+from app.schemas.hold import HoldCreate, HoldPublic
+from app.services.hold_service import create_hold, get_hold, release_hold, stage_hold
+from app.services.write_pipeline import PipelineUnavailable, get_booking_pipeline
+
+router = APIRouter(prefix="/holds", tags=["holds"])
+
+
+@router.post("/", response_model=HoldPublic, status_code=status.HTTP_201_CREATED)
+def add_hold(data: HoldCreate, db: Session = Depends(get_property_db)):
+    """
+    Reserves one unit of a room type for the dates. Send the token as
+    hold_token with POST /bookings/ before expires_at (UTC).
+    """
+    try:
+        pipeline = get_booking_pipeline(property_of(db))
+        if pipeline is not None:
+            return pipeline.execute(stage_hold, data)
+        return create_hold(db, data)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PipelineUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating hold: {str(e)}")
+
+
+@router.get("/{token}", response_model=HoldPublic)
+def get_one_hold(token: str, db: Session = Depends(get_property_read_db)):
+    try:
+        return get_hold(db, token)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.delete("/{token}", response_model=dict)
+def remove_hold(token: str, db: Session = Depends(get_property_db)):
+    try:
+        release_hold(db, token)
+        return {"message": "Hold released", "token": token}
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error releasing hold: {str(e)}")
@@ -0,0 +1,36 @@
+# app/api/routes/properties.py
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db, get_read_db
+from app.schemas.property import PropertyCreate, PropertyPublic
+from app.services.property_service import create_property, list_properties
+
+router = APIRouter(prefix="/properties", tags=["properties"])
+
+
+@router.get("/", response_model=List[PropertyPublic])
+def get_properties(
+    include_inactive: bool = Query(default=False),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Hotels; send one's code as the X-Property header (or ?property=) to use its rooms and bookings.
+    """
+    return list_properties(db, include_inactive=include_inactive)
+
+
+@router.post("/", response_model=PropertyPublic, status_code=status.HTTP_201_CREATED)
+def add_property(data: PropertyCreate, db: Session = Depends(get_db)):
+    """
+    Registers a hotel with its own database file.
+    Later we can protect this as an admin-only endpoint.
+    """
+    try:
+        return create_property(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating property: {str(e)}")
@@ -0,0 +1,129 @@
+# app/api/routes/rates.py
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.partitions import get_property_db, get_property_read_db
+from app.schemas.rate import (
+    RateCalendar,
+    RateOverrideCreate,
+    RateOverridePublic,
+    RatePlanPublic,
+    StayDiscountItem,
+    StayDiscountsUpdate,
+    StayQuotePublic,
+    WeekdayMultipliersUpdate,
+)
+from app.services.booking_service import find_room_by_type
+from app.services.pricing_service import (
+    create_rate_override,
+    delete_rate_override,
+    get_rate_plan,
+    price_calendar,
+    price_stays,
+    set_stay_discounts,
+    set_weekday_multipliers,
+)
+from app.services.room_service import list_rooms
+from app.utils.dates import parse_date
+
+router = APIRouter(prefix="/rates", tags=["rates"])
+
+
+@router.get("/quote", response_model=List[StayQuotePublic])
+def quote_all_rooms(
+    check_in: str = Query(..., description="YYYY-MM-DD"),
+    check_out: str = Query(..., description="YYYY-MM-DD"),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Prices one stay for every active room type (search results page).
+    """
+    try:
+        start = parse_date(check_in)
+        end = parse_date(check_out)
+        if end <= start:
+            raise ValueError("Check-out date must be after check-in date")
+        if (end - start).days > settings.MAX_STAY_NIGHTS:
+            raise ValueError(f"Stays are limited to {settings.MAX_STAY_NIGHTS} nights")
+
+        results = []
+        for room, quote in price_stays(db, list_rooms(db), start, end):
+            results.append(
+                {
+                    "room_type": room.room_type,
+                    "room_name": room.name,
+                    "nightly_rates": quote.nightly_rates,
+                    "subtotal": quote.subtotal,
+                    "discount_percent": quote.discount_percent,
+                    "total_price": quote.total_price,
+                    "price_per_night": quote.price_per_night,
+                }
+            )
+        return results
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/calendar", response_model=RateCalendar)
+def rate_calendar(
+    room_type: str = Query(..., min_length=2, max_length=30),
+    start: date = Query(...),
+    end: date = Query(...),
+    db: Session = Depends(get_property_read_db),
+):
+    room = find_room_by_type(db, room_type)
+    if not room:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room type not found")
+    try:
+        days = price_calendar(db, room, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"room_type": room.room_type, "base_price": room.price, "days": days}
+
+
+@router.get("/plans/{room_type}", response_model=RatePlanPublic)
+def rate_plan(room_type: str, db: Session = Depends(get_property_read_db)):
+    return get_rate_plan(db, room_type)
+
+
+@router.post("/overrides", response_model=RateOverridePublic, status_code=status.HTTP_201_CREATED)
+def add_override(data: RateOverrideCreate, db: Session = Depends(get_property_db)):
+    try:
+        return create_rate_override(db, data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating rate override: {str(e)}")
+
+
+@router.delete("/overrides/{override_id}", response_model=dict)
+def remove_override(override_id: int, db: Session = Depends(get_property_db)):
+    try:
+        delete_rate_override(db, override_id)
+        return {"message": "Rate override deleted", "id": override_id}
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting rate override: {str(e)}")
+
+
+@router.put("/weekday", response_model=List[float])
+def update_weekday_multipliers(data: WeekdayMultipliersUpdate, db: Session = Depends(get_property_db)):
+    try:
+        return set_weekday_multipliers(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating weekday multipliers: {str(e)}")
+
+
+@router.put("/stay-discounts", response_model=List[StayDiscountItem])
+def update_stay_discounts(data: StayDiscountsUpdate, db: Session = Depends(get_property_db)):
+    try:
+        return set_stay_discounts(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating stay discounts: {str(e)}")
@@ -0,0 +1,28 @@
+# app/api/routes/reports.py
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.db.partitions import get_property_read_db
+from app.schemas.report import OccupancyReport
+from app.services.rollup_service import occupancy_report
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/occupancy", response_model=OccupancyReport)
+def occupancy(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    group_by: str = Query(default="room_type", description="room_type | week | month"),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Daily occupancy / revenue rollups aggregated over [from, to] (inclusive).
+    """
+    try:
+        rows = occupancy_report(db, date_from, date_to, group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"date_from": date_from, "date_to": date_to, "group_by": group_by, "rows": rows}
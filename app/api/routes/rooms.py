@@ -1,41 +1,113 @@
 # app/api/routes/rooms.py
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.schemas.room import RoomCreate, RoomPublic, RoomUpdate
+from app.core.compression import choose_encoding
+from app.db.partitions import get_property_db, get_property_read_db
+from app.schemas.room import RoomCreate, RoomPublic, RoomSearchResult, RoomUpdate
+from app.schemas.unit import UnitBoard, UnitReassignResult
+from app.services.room_search_service import search_rooms
 from app.services.room_service import (
     create_room,
     deactivate_room,
     get_room_by_id,
+    get_room_catalog,
     init_sample_rooms,
-    list_rooms,
+    room_catalog_response,
     update_room,
 )
+from app.services.unit_service import get_unit_board, reassign_units
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
 
 @router.get("/", response_model=List[RoomPublic])
 def get_rooms(
+    request: Request,
     include_inactive: bool = Query(default=False, description="Set true to include inactive rooms"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_property_read_db),
 ):
-    return list_rooms(db, include_inactive=include_inactive)
+    """
+    Served from the in-memory catalog: serialized and compressed once per
+    catalog version, with an ETag for conditional requests.
+    """
+    catalog = get_room_catalog(db, include_inactive=include_inactive)
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    body, headers = room_catalog_response(catalog, encoding)
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if catalog.etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        # Same ETag and Vary as the 200 for this encoding; no body, so no Content-Encoding
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/search/text", response_model=List[RoomSearchResult])
+def search_rooms_text(
+    q: str = Query(..., min_length=1, max_length=200, description='e.g. "ocean view jacuzzi"'),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Full-text search over room name, description and amenities (SQLite FTS5), best match first.
+    """
+    try:
+        return search_rooms(db, q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching rooms: {str(e)}")
 
 
 @router.get("/{room_id}", response_model=RoomPublic)
-def get_room(room_id: int, db: Session = Depends(get_db)):
+def get_room(room_id: int, db: Session = Depends(get_property_read_db)):
     room = get_room_by_id(db, room_id)
     if not room:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
     return room
 
 
+@router.get("/{room_id}/units", response_model=UnitBoard)
+def get_units(
+    room_id: int,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    db: Session = Depends(get_property_read_db),
+):
+    """
+    Room board: the confirmed stays on each physical unit over [from, to] (inclusive).
+    """
+    try:
+        return get_unit_board(db, room_id, date_from, date_to)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching unit board: {str(e)}")
+
+
+@router.post("/{room_id}/units/reassign", response_model=UnitReassignResult)
+def reassign_room_units(room_id: int, db: Session = Depends(get_property_db)):
+    """
+    Re-packs every current and future stay onto units (in-house guests stay put).
+    Later we can protect this as an admin-only endpoint.
+    """
+    try:
+        return reassign_units(db, room_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reassigning units: {str(e)}")
+
+
 @router.post("/", response_model=RoomPublic, status_code=status.HTTP_201_CREATED)
-def add_room(data: RoomCreate, db: Session = Depends(get_db)):
+def add_room(data: RoomCreate, db: Session = Depends(get_property_db)):
     try:
         return create_room(db, data)
     except Exception as e:
@@ -43,29 +115,29 @@ def add_room(data: RoomCreate, db: Session = Depends(get_db)):
 
 
 @router.put("/{room_id}", response_model=RoomPublic)
-def edit_room(room_id: int, data: RoomUpdate, db: Session = Depends(get_db)):
-    room = get_room_by_id(db, room_id)
-    if not room:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
+def edit_room(room_id: int, data: RoomUpdate, db: Session = Depends(get_property_db)):
     try:
-        return update_room(db, room, data)
+        room = update_room(db, room_id, data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating room: {str(e)}")
+    if not room:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
+    return room
 
 
 @router.delete("/{room_id}", response_model=RoomPublic)
-def remove_room(room_id: int, db: Session = Depends(get_db)):
-    room = get_room_by_id(db, room_id)
-    if not room:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
+def remove_room(room_id: int, db: Session = Depends(get_property_db)):
     try:
-        return deactivate_room(db, room)
+        room = deactivate_room(db, room_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deactivating room: {str(e)}")
+    if not room:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
+    return room
 
 
 @router.post("/init-sample-data")
-def seed_sample_rooms(db: Session = Depends(get_db)):
+def seed_sample_rooms(db: Session = Depends(get_property_db)):
     """
     Keeps your original endpoint name for convenience.
     Later we can protect this as an admin-only endpoint.
@@ -0,0 +1,126 @@
+# app/cli.py
+"""
+Maintenance commands:
+
+    python -m app.cli rebuild-rollups
+    python -m app.cli check-rollups
+    python -m app.cli archive-bookings [--older-than-days N] [--batch-size N]
+    python -m app.cli export-bookings --out bookings.csv
+    python -m app.cli assign-units
+
+Add --property CODE (before the command) to work on another property's database.
+"""
+import argparse
+import csv
+import sys
+
+from app.core.config import settings
+from app.db.init_db import init_db
+from app.db.partitions import property_router
+from app.models.room import Room
+from app.services.archive_service import archive_bookings
+from app.services.booking_service import iter_bookings
+from app.services.rollup_service import check_rollups, rebuild_rollups
+from app.services.unit_service import repack_room
+
+
+def _rebuild_rollups(args) -> int:
+    with args.SessionLocal() as db:
+        result = rebuild_rollups(db)
+    print(f"Rollups rebuilt: {result['rows_written']} rows written")
+    return 0
+
+
+def _check_rollups(args) -> int:
+    with args.SessionLocal() as db:
+        mismatches = check_rollups(db)
+    if not mismatches:
+        print("Rollups are consistent with bookings")
+        return 0
+
+    print(f"{len(mismatches)} rollup rows differ from bookings:")
+    for m in mismatches[: args.limit]:
+        print(
+            f"  {m['day']} room={m['room_id']} "
+            f"sold {m['actual_rooms_sold']} (expected {m['expected_rooms_sold']}), "
+            f"revenue {m['actual_revenue']} (expected {m['expected_revenue']})"
+        )
+    return 1
+
+
+def _archive_bookings(args) -> int:
+    with args.SessionLocal() as db:
+        result = archive_bookings(db, older_than_days=args.older_than_days, batch_size=args.batch_size)
+    print(f"Archived {result['archived']} bookings in {result['batches']} batches (check-out before {result['cutoff']:%Y-%m-%d})")
+    return 0
+
+
+def _export_bookings(args) -> int:
+    with args.SessionLocal() as db, open(args.out, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        count = 0
+        for row in iter_bookings(db, include_archived=not args.skip_archived):
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+    print(f"Exported {count} bookings to {args.out}")
+    return 0
+
+
+def _assign_units(args) -> int:
+    unplaced = 0
+    with args.SessionLocal() as db:
+        for room in db.query(Room).order_by(Room.id).all():
+            result = repack_room(db, room)
+            db.commit()
+            unplaced += len(result["unassigned"])
+            print(
+                f"{room.room_type}: {result['bookings']} current/future stays, {result['moved']} moved, "
+                f"{result['units_used']}/{room.total_rooms} units used"
+            )
+            for booking_id in result["unassigned"]:
+                print(f"  no unit for {booking_id}")
+    return 1 if unplaced else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Luxora maintenance commands")
+    parser.add_argument("--property", default=None, help="Property code (defaults to DEFAULT_PROPERTY_CODE)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("rebuild-rollups", help="Recompute occupancy rollups from bookings").set_defaults(
+        func=_rebuild_rollups
+    )
+
+    check = sub.add_parser("check-rollups", help="Compare occupancy rollups with bookings")
+    check.add_argument("--limit", type=int, default=20, help="Max mismatches to print")
+    check.set_defaults(func=_check_rollups)
+
+    archive = sub.add_parser("archive-bookings", help="Move old completed/cancelled bookings to the archive")
+    archive.add_argument("--older-than-days", type=int, default=None, help="Defaults to ARCHIVE_AFTER_DAYS")
+    archive.add_argument("--batch-size", type=int, default=None, help="Defaults to ARCHIVE_BATCH_SIZE")
+    archive.set_defaults(func=_archive_bookings)
+
+    export = sub.add_parser("export-bookings", help="Write all bookings (archive included) to CSV")
+    export.add_argument("--out", required=True, help="Output CSV path")
+    export.add_argument("--skip-archived", action="store_true", help="Only export live bookings")
+    export.set_defaults(func=_export_bookings)
+
+    sub.add_parser("assign-units", help="Give every current/future confirmed booking a room unit").set_defaults(
+        func=_assign_units
+    )
+
+    args = parser.parse_args(argv)
+    init_db()
+    try:
+        args.SessionLocal = property_router.database(args.property or settings.DEFAULT_PROPERTY_CODE).SessionLocal
+    except LookupError as e:
+        print(f"{e}: {args.property}")
+        return 2
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
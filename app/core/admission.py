@@ -0,0 +1,235 @@
+# app/core/admission.py
+import asyncio
+import heapq
+import itertools
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Lower number = admitted first when requests are waiting for a slot
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_BROWSE = 2
+
+
+class ConcurrencyLimiter:
+    """
+    Async semaphore with a bounded, priority-ordered wait queue.
+    acquire() returns False (instead of waiting forever) when the queue is full
+    or the wait times out, so the caller can shed the request.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+
+        self.active = 0
+        self.waiting = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+        # Counters for monitoring
+        self.admitted = 0
+        self.shed = 0
+        self.timed_out = 0
+        self.peak_waiting = 0
+
+    async def acquire(self, priority: int, timeout: float) -> bool:
+        if self.active < self.limit and self.waiting == 0:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if self.waiting >= self.max_queue:
+            self.shed += 1
+            return False
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            # The slot may have been handed to us right as we gave up: pass it on
+            if fut.done() and not fut.cancelled():
+                self.release()
+            self.timed_out += 1
+            return False
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+        finally:
+            self.waiting -= 1
+
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        # Hand the slot straight to the best waiter (active count stays the same)
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(True)
+                return
+        self.active -= 1
+
+    def snapshot(self) -> Dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self.waiting,
+            "peak_queued": self.peak_waiting,
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+@dataclass(frozen=True)
+class AdmissionRule:
+    name: str
+    methods: FrozenSet[str]
+    pattern: "re.Pattern[str]"
+    priority: int
+
+
+def _default_rules(prefix: str) -> List[AdmissionRule]:
+    p = re.escape(prefix)
+    # First match wins, so the specific booking routes come before the generic ones
+    return [
+        AdmissionRule("availability", frozenset({"POST"}), re.compile(rf"^{p}/bookings/check-availability/?$"), PRIORITY_BROWSE),
+        AdmissionRule("booking_writes", frozenset({"POST"}), re.compile(rf"^{p}/bookings/?$"), PRIORITY_WRITE),
+        AdmissionRule("booking_writes", frozenset({"PUT"}), re.compile(rf"^{p}/bookings/[^/]+/cancel/?$"), PRIORITY_WRITE),
+        AdmissionRule("booking_writes", frozenset({"POST", "DELETE"}), re.compile(rf"^{p}/holds(/[^/]+)?/?$"), PRIORITY_WRITE),
+        AdmissionRule("bookings_list", frozenset({"GET"}), re.compile(rf"^{p}/bookings/?$"), PRIORITY_BROWSE),
+        AdmissionRule("rooms", frozenset({"GET"}), re.compile(rf"^{p}/rooms(/.*)?$"), PRIORITY_READ),
+    ]
+
+
+def _default_exempt(prefix: str) -> List["re.Pattern[str]"]:
+    p = re.escape(prefix)
+    # Health checks and docs must answer even when the API is saturated
+    return [
+        re.compile(r"^/$"),
+        re.compile(rf"^{p}/health(/.*)?$"),
+        re.compile(r"^/(docs|redoc|openapi\.json)(/.*)?$"),
+        # Long-lived SSE connections would pin limiter slots (capped by CHANGE_FEED_MAX_SUBSCRIBERS)
+        re.compile(rf"^{p}/bookings/changes/stream/?$"),
+    ]
+
+
+class AdmissionController:
+    """
+    Two-level admission:
+    1) per-route-class limiter (expensive routes queue among themselves)
+    2) one global limiter shared by all API routes, ordered by priority
+    """
+
+    def __init__(
+        self,
+        rules: List[AdmissionRule],
+        exempt: List["re.Pattern[str]"],
+        route_limits: Dict[str, int],
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        self.rules = rules
+        self.exempt = exempt
+        self.queue_timeout = queue_timeout
+        self.global_limiter = ConcurrencyLimiter("global", max_concurrency, max_queue)
+        self.route_limiters: Dict[str, ConcurrencyLimiter] = {
+            name: ConcurrencyLimiter(name, limit, max_queue) for name, limit in route_limits.items()
+        }
+
+    @classmethod
+    def from_settings(cls) -> "AdmissionController":
+        prefix = settings.API_V1_PREFIX
+        return cls(
+            rules=_default_rules(prefix),
+            exempt=_default_exempt(prefix),
+            route_limits=settings.ADMISSION_ROUTE_LIMITS,
+            max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        )
+
+    def is_exempt(self, path: str) -> bool:
+        return any(p.match(path) for p in self.exempt)
+
+    def match(self, method: str, path: str) -> Optional[AdmissionRule]:
+        for rule in self.rules:
+            if method in rule.methods and rule.pattern.match(path):
+                return rule
+        return None
+
+    def snapshot(self) -> Dict:
+        return {
+            "global": self.global_limiter.snapshot(),
+            "routes": {name: limiter.snapshot() for name, limiter in self.route_limiters.items()},
+        }
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app: ASGIApp, controller: AdmissionController, retry_after: int):
+        self.app = app
+        self.controller = controller
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.controller.is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        rule = self.controller.match(scope["method"], scope["path"])
+        priority = rule.priority if rule else PRIORITY_READ
+        route_limiter = self.controller.route_limiters.get(rule.name) if rule else None
+        timeout = self.controller.queue_timeout
+
+        if route_limiter and not await route_limiter.acquire(priority, timeout):
+            await self._shed(scope, receive, send)
+            return
+
+        try:
+            global_limiter = self.controller.global_limiter
+            if not await global_limiter.acquire(priority, timeout):
+                await self._shed(scope, receive, send)
+                return
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                global_limiter.release()
+        finally:
+            if route_limiter:
+                route_limiter.release()
+
+    async def _shed(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            status_code=503,
+            content={"detail": "Server is busy, please retry shortly"},
+            headers={"Retry-After": str(self.retry_after)},
+        )
+        await response(scope, receive, send)
+
+
+def add_admission_middleware(app: FastAPI) -> None:
+    if not settings.ADMISSION_ENABLED:
+        return
+
+    controller = AdmissionController.from_settings()
+    app.state.admission = controller
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=controller,
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    )
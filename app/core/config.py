@@ -1,5 +1,5 @@
 # app/core/config.py
-from typing import List
+from typing import Dict, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,10 +22,99 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./luxora.db"
 
+    # Multi-property: each property's rooms, bookings and rates live in their own
+    # SQLite file under PROPERTY_DATA_DIR. The default property keeps DATABASE_URL,
+    # which also holds users and the property list.
+    DEFAULT_PROPERTY_CODE: str = "main"
+    DEFAULT_PROPERTY_NAME: str = "Luxora"
+    PROPERTY_DATA_DIR: str = "./data/properties"
+    PROPERTY_HEADER: str = "X-Property"
+    PROPERTY_CACHE_TTL_SECONDS: float = 30.0  # how long "active" / "not found" is trusted per worker
+
+    # SQLite profile: "production" = WAL + tuned pragmas + split read/write pools, "default" = plain engine
+    SQLITE_PROFILE: str = "production"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_MMAP_SIZE_BYTES: int = 256 * 1024 * 1024
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITE_POOL_TIMEOUT_SECONDS: float = 30.0
+
+    # Optional group-commit pipeline for booking creates/cancels. Off by default:
+    # it only pays off when each commit's fsync costs more than the batching wait
+    WRITE_PIPELINE_ENABLED: bool = False
+    WRITE_PIPELINE_WINDOW_MS: float = 5.0
+    WRITE_PIPELINE_MAX_BATCH: int = 64
+    WRITE_PIPELINE_TIMEOUT_SECONDS: float = 30.0
+
     # Security (we'll use these when we add auth)
     SECRET_KEY: str = "CHANGE_ME_TO_A_LONG_RANDOM_SECRET"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 1 day
 
+    # Admission control (per-route concurrency limits + load shedding)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_CONCURRENCY: int = 32  # stays below Starlette's 40 threadpool tokens
+    ADMISSION_MAX_QUEUE: int = 64
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2
+    ADMISSION_ROUTE_LIMITS: Dict[str, int] = {
+        "booking_writes": 8,
+        "availability": 8,
+        "bookings_list": 4,
+        "rooms": 16,
+    }
+
+    # Response compression (brotli is used when the package is installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies aren't worth it
+    COMPRESSION_THREAD_MIN_SIZE: int = 64 * 1024  # bytes; larger bodies compress off the event loop
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_CONTENT_TYPES: List[str] = ["application/json", "text/"]  # "text/" = any text type
+
+    # Room catalog (GET /rooms/ is serialized + precompressed once per version)
+    ROOM_CATALOG_TTL_SECONDS: int = 60
+
+    # Pricing (compiled rate tables are cached per process)
+    PRICING_CACHE_TTL_SECONDS: int = 300
+    MAX_STAY_NIGHTS: int = 90  # longest stay that can be quoted or booked
+
+    # Availability answers (per process; booking writes invalidate overlapping dates)
+    AVAILABILITY_CACHE_ENABLED: bool = True
+    AVAILABILITY_CACHE_TTL_SECONDS: float = 5.0
+    AVAILABILITY_CACHE_MAX_ENTRIES: int = 10000
+    AVAILABILITY_CACHE_WAIT_SECONDS: float = 10.0  # how long coalesced callers wait for the leader
+
+    # Inventory holds (checkout flows reserve a unit before POST /bookings/)
+    HOLD_TTL_MINUTES: int = 10
+    HOLD_MAX_MINUTES: int = 30
+    HOLD_PURGE_INTERVAL_SECONDS: int = 300
+
+    # Booking change feed (GET /bookings/changes + server-sent events)
+    CHANGE_FEED_PAGE_SIZE: int = 500
+    CHANGE_FEED_POLL_SECONDS: float = 0.5  # picks up other workers' writes
+    CHANGE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    CHANGE_FEED_RETRY_MS: int = 3000
+    CHANGE_FEED_QUEUE_SIZE: int = 256  # per subscriber; slower clients are disconnected
+    CHANGE_FEED_MAX_SUBSCRIBERS: int = 5000
+    CHANGE_FEED_RETENTION_DAYS: int = 7
+    CHANGE_FEED_PURGE_CRON: str = "15 3 * * *"
+
+    # Archival of past bookings (moved to bookings_archive in small batches)
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_BATCH_PAUSE_SECONDS: float = 0.05
+
+    # Background scheduler (cron fields: minute hour day month weekday)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_JITTER_SECONDS: float = 5.0
+    PENDING_BOOKING_TTL_MINUTES: int = 30
+    PENDING_EXPIRY_INTERVAL_SECONDS: int = 60
+    ARCHIVE_CRON: str = "0 2 * * *"
+    ROLLUP_REFRESH_CRON: str = "30 2 * * *"
+    DB_ANALYZE_CRON: str = "0 3 * * *"
+    DB_VACUUM_CRON: str = "30 3 * * 0"
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
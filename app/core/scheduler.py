@@ -0,0 +1,257 @@
+# app/core/scheduler.py
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy import or_, update
+from sqlalchemy.dialects.sqlite import insert
+
+from app.db.session import SessionLocal
+from app.models.job_lease import JobLease
+
+logger = logging.getLogger("luxora.scheduler")
+
+
+# -------------------------
+# Cron expressions
+# -------------------------
+def _parse_cron_field(expr: str, lo: int, hi: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in expr.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+            if step <= 0:
+                raise ValueError(f"Invalid cron step: {expr}")
+
+        if part == "*":
+            start, end = lo, hi
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(part)
+            end = hi if step > 1 else start
+
+        if start < lo or end > hi or start > end:
+            raise ValueError(f"Cron field out of range: {expr}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """
+    Standard 5-field cron: "minute hour day-of-month month day-of-week"
+    (day-of-week: 0 = Sunday ... 6 = Saturday, 7 also means Sunday).
+    Supports *, lists, ranges and steps.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError("Cron expression must have 5 fields")
+
+        self.expression = expression
+        self.minutes = _parse_cron_field(fields[0], 0, 59)
+        self.hours = _parse_cron_field(fields[1], 0, 23)
+        self.days = _parse_cron_field(fields[2], 1, 31)
+        self.months = _parse_cron_field(fields[3], 1, 12)
+        self.weekdays = {d % 7 for d in _parse_cron_field(fields[4], 0, 7)}
+        # Like classic cron: if both day fields are restricted, either may match
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return dow
+        if self._any_weekday:
+            return dom
+        return dom or dow
+
+    def next_after(self, now: datetime) -> datetime:
+        dt = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+        while dt < limit:
+            if dt.month not in self.months or not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+        raise ValueError(f"Cron expression never fires: {self.expression}")
+
+
+# -------------------------
+# Cross-worker lease
+# -------------------------
+def acquire_lease(name: str, owner: str, ttl_seconds: float) -> bool:
+    """
+    Takes (or renews) the lease row for a job. Returns False while another
+    worker holds an unexpired lease.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+
+    with SessionLocal() as db:
+        inserted = db.execute(
+            insert(JobLease).values(name=name, owner=owner, expires_at=expires_at).on_conflict_do_nothing()
+        ).rowcount
+        if not inserted:
+            inserted = db.execute(
+                update(JobLease)
+                .where(JobLease.name == name, or_(JobLease.expires_at < now, JobLease.owner == owner))
+                .values(owner=owner, expires_at=expires_at)
+            ).rowcount
+        db.commit()
+    return bool(inserted)
+
+
+# -------------------------
+# Jobs
+# -------------------------
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], object]  # sync; runs in a worker thread
+    interval_seconds: Optional[float] = None
+    cron: Optional[CronSchedule] = None
+    jitter_seconds: float = 0.0
+    lease_seconds: Optional[float] = None
+
+    # Metrics
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_started_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    total_duration_ms: float = 0.0
+    last_result: Optional[str] = None
+    last_error: Optional[str] = None
+    next_run_at: Optional[datetime] = None
+
+    def next_delay(self) -> float:
+        now = datetime.now()
+        if self.cron is not None:
+            delay = (self.cron.next_after(now) - now).total_seconds()
+        else:
+            delay = float(self.interval_seconds or 0)
+        delay += random.uniform(0, self.jitter_seconds) if self.jitter_seconds else 0.0
+        self.next_run_at = now + timedelta(seconds=delay)
+        return delay
+
+    def lease_ttl(self) -> float:
+        if self.lease_seconds is not None:
+            return self.lease_seconds
+        # Hold the lease for (almost) one period so other workers skip this occurrence
+        if self.interval_seconds:
+            return max(self.interval_seconds * 0.9, 1.0)
+        return 50.0
+
+    def snapshot(self) -> Dict:
+        return {
+            "schedule": self.cron.expression if self.cron else f"every {self.interval_seconds}s",
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_started_at": self.last_started_at,
+            "last_duration_ms": self.last_duration_ms,
+            "avg_duration_ms": round(self.total_duration_ms / self.runs, 2) if self.runs else None,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+            "next_run_at": self.next_run_at,
+        }
+
+
+@dataclass
+class Scheduler:
+    """
+    Small in-process asyncio scheduler (one task per job), started from lifespan.
+    """
+
+    owner: str = field(default_factory=lambda: f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}")
+    jobs: Dict[str, Job] = field(default_factory=dict)
+    _tasks: List[asyncio.Task] = field(default_factory=list)
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], object],
+        interval_seconds: Optional[float] = None,
+        cron: Optional[str] = None,
+        jitter_seconds: float = 0.0,
+        lease_seconds: Optional[float] = None,
+    ) -> Job:
+        if (interval_seconds is None) == (cron is None):
+            raise ValueError("Job needs exactly one of interval_seconds or cron")
+        if name in self.jobs:
+            raise ValueError(f"Job already registered: {name}")
+
+        job = Job(
+            name=name,
+            func=func,
+            interval_seconds=interval_seconds,
+            cron=CronSchedule(cron) if cron else None,
+            jitter_seconds=jitter_seconds,
+            lease_seconds=lease_seconds,
+        )
+        self.jobs[name] = job
+        return job
+
+    async def _run_once(self, job: Job) -> None:
+        if not await asyncio.to_thread(acquire_lease, job.name, self.owner, job.lease_ttl()):
+            job.skipped += 1
+            return
+
+        job.last_started_at = datetime.utcnow()
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(job.func)
+            job.last_result = None if result is None else str(result)
+            job.last_error = None
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            logger.exception("Scheduled job %s failed", job.name)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            job.runs += 1
+            job.last_duration_ms = round(elapsed, 2)
+            job.total_duration_ms += elapsed
+
+    async def _loop(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(job.next_delay())
+            try:
+                await self._run_once(job)
+            except Exception:
+                # Lease errors (e.g. database locked) must not kill the loop
+                job.failures += 1
+                logger.exception("Scheduler could not run job %s", job.name)
+
+    def start(self) -> None:
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"job:{job.name}"))
+        logger.info("Scheduler started with %d jobs", len(self.jobs))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def snapshot(self) -> Dict:
+        return {"owner": self.owner, "jobs": {name: job.snapshot() for name, job in self.jobs.items()}}
@@ -1,11 +1,34 @@
 # app/db/init_db.py
+from typing import List
+
+from sqlalchemy import Table, insert, inspect, select, text, update
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
 from app.db.session import engine
 from app.db.base import Base
 
 # Import models so SQLAlchemy registers them before create_all
 from app.models.user import User  # noqa: F401
 from app.models.room import Room  # noqa: F401
-from app.models.booking import Booking  # noqa: F401
+from app.models.blackout import RoomBlackout  # noqa: F401
+from app.models.booking import Booking, BookingArchive  # noqa: F401
+from app.models.booking_change import BookingChange  # noqa: F401
+from app.models.hold import InventoryHold  # noqa: F401
+from app.models.job_lease import JobLease  # noqa: F401
+from app.models.property import Property
+from app.models.rollup import OccupancyRollup  # noqa: F401
+from app.models.rate import RateOverride, StayDiscount, WeekdayMultiplier  # noqa: F401
+from app.services.room_search_service import ensure_room_search_index
+from app.utils.contact import normalize_email, phone_digits
+
+
+# Shared by all properties: only in the main database, never in a property file
+GLOBAL_TABLES = {"users", "properties", "job_leases"}
+
+
+def property_tables() -> List[Table]:
+    return [t for t in Base.metadata.sorted_tables if t.name not in GLOBAL_TABLES]
 
 
 def init_db() -> None:
@@ -13,4 +36,79 @@ def init_db() -> None:
     Creates database tables if they don't exist.
     (SQLite dev-friendly; later can be replaced by migrations.)
     """
-    Base.metadata.create_all(bind=engine)
+    _init_schema(engine, Base.metadata.sorted_tables)
+    _ensure_default_property()
+
+
+def init_property_db(bind: Engine) -> None:
+    """
+    Same for one property's own database file (property tables only).
+    """
+    _init_schema(bind, property_tables())
+
+
+def _init_schema(bind: Engine, tables: List[Table]) -> None:
+    Base.metadata.create_all(bind=bind, tables=tables)
+    _ensure_columns(bind, tables)
+    _ensure_indexes(bind, tables)
+    _backfill_contact_keys(bind)
+    ensure_room_search_index(bind)
+
+
+def _ensure_columns(bind: Engine, tables: List[Table]) -> None:
+    """
+    Adds nullable columns declared after a table was created (SQLite ALTER TABLE ADD COLUMN).
+    """
+    # Inspect on the same connection: the production writer pool has only one
+    with bind.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in tables:
+            if table.name not in existing_tables:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present or not column.nullable:
+                    continue
+                col_type = column.type.compile(dialect=bind.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {col_type}'))
+
+
+def _ensure_indexes(bind: Engine, tables: List[Table]) -> None:
+    """
+    create_all only builds indexes for new tables; add ones declared later
+    on existing tables (no-op when they already exist).
+    """
+    for table in tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+def _ensure_default_property() -> None:
+    # Existing single-hotel data becomes the default property
+    with engine.begin() as conn:
+        exists = conn.execute(select(Property.id).where(Property.code == settings.DEFAULT_PROPERTY_CODE)).first()
+        if not exists:
+            conn.execute(
+                insert(Property).values(code=settings.DEFAULT_PROPERTY_CODE, name=settings.DEFAULT_PROPERTY_NAME)
+            )
+
+
+def _backfill_contact_keys(bind: Engine, batch_size: int = 1000) -> None:
+    """
+    Fills normalized email / phone lookup keys for rows written before they existed.
+    """
+    for model in (Booking, BookingArchive):
+        while True:
+            with bind.begin() as conn:
+                rows = conn.execute(
+                    select(model.id, model.email, model.phone).where(model.email_normalized.is_(None)).limit(batch_size)
+                ).all()
+                for row in rows:
+                    conn.execute(
+                        update(model.__table__)
+                        .where(model.__table__.c.id == row.id)
+                        .values(email_normalized=normalize_email(row.email), phone_digits=phone_digits(row.phone))
+                    )
+            if len(rows) < batch_size:
+                break
@@ -0,0 +1,195 @@
+# app/db/partitions.py
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from fastapi import Depends, Header, HTTPException, Query, status
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.init_db import init_property_db
+from app.db.session import (
+    ReadSessionLocal,
+    SessionLocal,
+    build_engines,
+    build_sessionmakers,
+    engine,
+    read_engine,
+)
+from app.models.property import Property
+
+logger = logging.getLogger("luxora.partitions")
+
+
+@dataclass
+class PropertyDatabase:
+    code: str
+    engine: Engine
+    read_engine: Engine
+    SessionLocal: sessionmaker
+    ReadSessionLocal: sessionmaker
+
+
+def property_database_url(code: str) -> str:
+    if code == settings.DEFAULT_PROPERTY_CODE:
+        return settings.DATABASE_URL
+    if not settings.DATABASE_URL.startswith("sqlite"):
+        raise ValueError("Separate property databases need SQLite (DATABASE_URL is not sqlite)")
+    return f"sqlite:///{os.path.join(settings.PROPERTY_DATA_DIR, code + '.db')}"
+
+
+class PropertyRouter:
+    """
+    Maps a property code to its own database (engines + sessionmakers).
+
+    Every property is a separate SQLite file with its own single writer, so a
+    busy hotel's write lock, WAL and table growth never touch the others.
+    Files are opened (and their schema created) on first use; after that a
+    lookup is one dict read. Whether a property is active (or doesn't exist)
+    is re-read from the property list at most every PROPERTY_CACHE_TTL_SECONDS,
+    so a deactivated hotel stops being served and unknown codes don't query
+    the main database on every request.
+    """
+
+    # Bogus codes are remembered too; cap how many
+    MAX_MISSING = 1024
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        default = PropertyDatabase(settings.DEFAULT_PROPERTY_CODE, engine, read_engine, SessionLocal, ReadSessionLocal)
+        self._databases: Dict[str, PropertyDatabase] = {default.code: default}
+        # code -> monotonic time until which the answer is trusted
+        self._active_until: Dict[str, float] = {}
+        self._missing_until: Dict[str, float] = {}
+        # Per-property state kept by other modules (write pipelines, change feed)
+        self._close_hooks: List[Callable[[str], None]] = []
+
+    def database(self, code: str) -> PropertyDatabase:
+        """
+        The database of an existing, active property; LookupError otherwise.
+        """
+        now = time.monotonic()
+        database = self._databases.get(code)
+        if database is not None and (code == settings.DEFAULT_PROPERTY_CODE or self._active_until.get(code, 0) > now):
+            return database
+        if self._missing_until.get(code, 0) > now:
+            raise LookupError("Property not found")
+
+        # Another worker may have created or deactivated it; the property list is the truth
+        with ReadSessionLocal() as db:
+            active = db.query(Property.id).filter(Property.code == code, Property.is_active == True).first()  # noqa: E712
+        if not active:
+            if len(self._missing_until) >= self.MAX_MISSING:
+                self._missing_until.clear()
+            self._missing_until[code] = now + settings.PROPERTY_CACHE_TTL_SECONDS
+            if database is not None:
+                self._close(code)
+            raise LookupError("Property not found")
+        self._active_until[code] = now + settings.PROPERTY_CACHE_TTL_SECONDS
+
+        if database is None:
+            with self._lock:
+                database = self._databases.get(code)
+                if database is None:
+                    database = self._open(code)
+                    self._databases[code] = database
+        return database
+
+    def on_close(self, hook: Callable[[str], None]) -> None:
+        """
+        Registers cleanup to run with a property's code when its database is closed.
+        """
+        self._close_hooks.append(hook)
+
+    def forget(self, code: str) -> None:
+        """
+        Drops what this worker remembers about a code (e.g. right after creating it).
+        """
+        self._active_until.pop(code, None)
+        self._missing_until.pop(code, None)
+
+    def _open(self, code: str) -> PropertyDatabase:
+        url = property_database_url(code)
+        os.makedirs(settings.PROPERTY_DATA_DIR, exist_ok=True)
+        write_engine, read_only_engine = build_engines(url, settings.SQLITE_PROFILE)
+        init_property_db(write_engine)
+        session_local, read_session_local = build_sessionmakers(write_engine, read_only_engine, code)
+        return PropertyDatabase(code, write_engine, read_only_engine, session_local, read_session_local)
+
+    def opened(self) -> List[str]:
+        return list(self._databases)
+
+    def all_databases(self) -> List[PropertyDatabase]:
+        """
+        Every active property's database (for maintenance jobs).
+        """
+        with ReadSessionLocal() as db:
+            codes = [c for (c,) in db.query(Property.code).filter(Property.is_active == True).order_by(Property.id)]  # noqa: E712
+        return [self.database(code) for code in codes]
+
+    def _close(self, code: str) -> None:
+        with self._lock:
+            database = self._databases.pop(code, None)
+            self._active_until.pop(code, None)
+        if database is None:
+            return
+        # Before the engines go: a pipeline drains its queue on stop
+        for hook in self._close_hooks:
+            try:
+                hook(code)
+            except Exception:
+                logger.exception("Cleanup for property %s failed", code)
+        database.engine.dispose()
+        database.read_engine.dispose()
+
+    def dispose(self) -> None:
+        for code in list(self._databases):
+            if code != settings.DEFAULT_PROPERTY_CODE:
+                self._close(code)
+
+
+property_router = PropertyRouter()
+
+
+# -------------------------
+# Request routing
+# -------------------------
+def get_property_code(
+    x_property: Optional[str] = Header(default=None, alias=settings.PROPERTY_HEADER),
+    property_code: Optional[str] = Query(default=None, alias="property", max_length=32),
+) -> str:
+    """
+    The property a request is for: X-Property header, ?property= or the default.
+    """
+    code = (x_property or property_code or settings.DEFAULT_PROPERTY_CODE).strip().lower()
+    try:
+        property_router.database(code)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return code
+
+
+def get_property_db(code: str = Depends(get_property_code)):
+    """
+    Like get_db, but on the database of the request's property.
+    """
+    db = property_router.database(code).SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_property_read_db(code: str = Depends(get_property_code)):
+    """
+    Like get_read_db, but on the database of the request's property.
+    """
+    db = property_router.database(code).ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,24 +1,132 @@
 # app/db/session.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import sqlite3
+from typing import List, Tuple
+from urllib.parse import quote
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
-# SQLite needs check_same_thread=False for multiple threads (FastAPI)
-connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+def _sqlite_pragmas(read_only: bool) -> List[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB}",  # negative = KiB
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE_BYTES}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    else:
+        pragmas.append("PRAGMA journal_mode = WAL")
+        pragmas.append(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+    return pragmas
+
+
+def _apply_pragmas_on_connect(engine: Engine, pragmas: List[str]) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def build_engines(database_url: str, profile: str = "production") -> Tuple[Engine, Engine]:
+    """
+    Returns (write_engine, read_engine).
+
+    profile="production" (SQLite only): WAL + tuned pragmas on every connect,
+    one pooled writer connection, and a separate read-only pool so readers
+    never queue behind booking writes.
+    profile="default": one plain engine for both (the original setup).
+    """
+    if not database_url.startswith("sqlite"):
+        engine = create_engine(database_url, pool_pre_ping=True)
+        return engine, engine
+
+    # SQLite needs check_same_thread=False for multiple threads (FastAPI)
+    connect_args = {"check_same_thread": False}
+
+    if profile != "production":
+        engine = create_engine(database_url, connect_args=connect_args)
+        return engine, engine
+
+    write_engine = create_engine(
+        database_url,
+        connect_args=connect_args,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.SQLITE_WRITE_POOL_TIMEOUT_SECONDS,
+    )
+    _apply_pragmas_on_connect(write_engine, _sqlite_pragmas(read_only=False))
+
+    path = make_url(database_url).database
+    if not path or path == ":memory:":
+        # In-memory databases can't be shared between pools
+        return write_engine, write_engine
+
+    read_engine = create_engine(
+        "sqlite://",
+        creator=lambda: sqlite3.connect(f"file:{quote(path)}?mode=ro", uri=True, check_same_thread=False),
+        poolclass=QueuePool,
+        pool_size=settings.SQLITE_READ_POOL_SIZE,
+        max_overflow=settings.SQLITE_READ_POOL_SIZE,
+    )
+    _apply_pragmas_on_connect(read_engine, _sqlite_pragmas(read_only=True))
+    return write_engine, read_engine
+
+
+engine, read_engine = build_engines(settings.DATABASE_URL, settings.SQLITE_PROFILE)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def build_sessionmakers(
+    write_engine: Engine, read_engine: Engine, property_code: str
+) -> Tuple[sessionmaker, sessionmaker]:
+    """
+    Returns (SessionLocal, ReadSessionLocal) whose sessions know their property
+    (session.info["property"]), so per-process caches can be keyed by it.
+    """
+    # expire_on_commit=False: write paths get their rows back via RETURNING,
+    # so there is no need to re-SELECT them after commit
+    options = {"autocommit": False, "autoflush": False, "expire_on_commit": False}
+    info = {"property": property_code}
+    return (
+        sessionmaker(bind=write_engine, info=info, **options),
+        sessionmaker(bind=read_engine, info=info, **options),
+    )
+
+
+# The default property; this database also holds users and the property list
+SessionLocal, ReadSessionLocal = build_sessionmakers(engine, read_engine, settings.DEFAULT_PROPERTY_CODE)
+
+
+def property_of(db: Session) -> str:
+    return db.info.get("property", settings.DEFAULT_PROPERTY_CODE)
 
 
 def get_db():
     """
     FastAPI dependency that provides a SQLAlchemy session
     and ensures it is closed after the request.
+    Main database (users, properties); property data uses app.db.partitions.get_property_db.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Same as get_db, but on the read-only pool. Use it for endpoints that never write.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -2,12 +2,20 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 from app.api.router import api_router
+from app.core.admission import add_admission_middleware
+from app.core.compression import add_compression_middleware
 from app.core.config import settings
 from app.core.cors import add_cors_middleware
+from app.core.scheduler import Scheduler
 from app.db.init_db import init_db
+from app.db.partitions import property_router
+from app.services.availability_cache import availability_cache
+from app.services.change_feed import change_feed_hub
+from app.services.maintenance_service import register_maintenance_jobs
+from app.services.write_pipeline import booking_pipelines, start_booking_pipeline, stop_booking_pipeline
 
 logger = logging.getLogger("luxora")
 
@@ -19,8 +27,24 @@ async def lifespan(app: FastAPI):
     We create database tables on startup for SQLite development.
     """
     init_db()
+    start_booking_pipeline()
+    await change_feed_hub.start()
+
+    scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        scheduler = Scheduler()
+        register_maintenance_jobs(scheduler)
+        scheduler.start()
+    app.state.scheduler = scheduler
+
     logger.info("🚀 Luxora API started successfully")
     yield
+
+    if scheduler:
+        await scheduler.stop()
+    await change_feed_hub.stop()
+    stop_booking_pipeline()
+    property_router.dispose()
     logger.info("🛑 Luxora API shutdown complete")
 
 
@@ -33,9 +57,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Admission control (added before CORS so shed 503s still carry CORS headers)
+add_admission_middleware(app)
+
 # CORS middleware
 add_cors_middleware(app)
 
+# Compression (outermost, so every JSON response is covered)
+add_compression_middleware(app)
+
 # API routes
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -52,3 +82,62 @@ async def root():
 @app.get(f"{settings.API_V1_PREFIX}/health", tags=["health"])
 async def health_check():
     return {"status": "healthy", "message": "API is running smoothly"}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/admission", tags=["health"])
+async def admission_stats(request: Request):
+    """
+    Queue depth, in-flight and shed counters per route class (for monitoring).
+    """
+    controller = getattr(request.app.state, "admission", None)
+    if controller is None:
+        return {"enabled": False}
+    return {"enabled": True, **controller.snapshot()}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/scheduler", tags=["health"])
+async def scheduler_stats(request: Request):
+    """
+    Per-job run counts, durations, failures and next run times for this worker.
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **scheduler.snapshot()}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/write-pipeline", tags=["health"])
+async def write_pipeline_stats():
+    """
+    Group-commit batch counters per property (only when WRITE_PIPELINE_ENABLED=true).
+    """
+    pipelines = booking_pipelines()
+    if not pipelines:
+        return {"enabled": False}
+    return {"enabled": True, "properties": {code: p.snapshot() for code, p in pipelines.items()}}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/availability-cache", tags=["health"])
+async def availability_cache_stats():
+    """
+    Hit / miss / coalesced counters of the availability cache in this worker.
+    """
+    if not settings.AVAILABILITY_CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **availability_cache.snapshot()}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/change-feed", tags=["health"])
+async def change_feed_stats():
+    """
+    SSE subscribers and published events of the booking change feed in this worker, per property.
+    """
+    return change_feed_hub.snapshot()
+
+
+@app.get(f"{settings.API_V1_PREFIX}/health/properties", tags=["health"])
+async def property_databases():
+    """
+    Property databases this worker has opened.
+    """
+    return {"default": settings.DEFAULT_PROPERTY_CODE, "opened": property_router.opened()}
@@ -0,0 +1,28 @@
+# app/models/blackout.py
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Index, Integer, String
+
+from app.db.base import Base
+
+
+class RoomBlackout(Base):
+    """
+    Units of a room type withheld from sale (renovation, maintenance).
+    start_date and end_date are both inclusive (nights that start on those days).
+    Counted in availability like bookings, but never shows up in bookings or reports.
+    """
+
+    __tablename__ = "room_blackouts"
+    # Availability sums units with a covering range scan, like the bookings count
+    __table_args__ = (Index("ix_room_blackouts_type_dates", "room_type", "start_date", "end_date", "units"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_type = Column(String, nullable=False)
+
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    units = Column(Integer, nullable=False)
+
+    reason = Column(String, default="", nullable=False)  # e.g. "Floor 3 renovation"
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
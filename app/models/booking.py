@@ -1,7 +1,7 @@
 # app/models/booking.py
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -9,6 +9,12 @@ from app.db.base import Base
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # "My bookings": one user's stays in date order without scanning the table
+        Index("ix_bookings_user_check_in", "user_id", "check_in"),
+        # Availability overlap counts: covering range scan per room
+        Index("ix_bookings_room_status_dates", "room_id", "status", "check_in", "check_out"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     booking_id = Column(String, unique=True, index=True, nullable=False)
@@ -18,6 +24,10 @@ class Booking(Base):
     email = Column(String, nullable=False)
     phone = Column(String, nullable=False)
 
+    # Normalized lookup keys (filled on write): lower-cased email, digits-only phone
+    email_normalized = Column(String, nullable=True, index=True)
+    phone_digits = Column(String, nullable=True, index=True)
+
     # Booking details
     room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -31,6 +41,10 @@ class Booking(Base):
     total_nights = Column(Integer, nullable=False)
     total_price = Column(Float, nullable=False)
 
+    # Physical unit (1..room.total_rooms) given by app/services/unit_service.py;
+    # None until assigned, and again once cancelled
+    unit_number = Column(Integer, nullable=True)
+
     # Status: pending, confirmed, cancelled
     status = Column(String, default="pending", nullable=False)
 
@@ -39,3 +53,43 @@ class Booking(Base):
 
     room = relationship("Room", back_populates="bookings")
     user = relationship("User", back_populates="bookings")
+
+
+class BookingArchive(Base):
+    """
+    Completed / cancelled bookings moved out of the hot `bookings` table.
+    Same columns (and same ids) as Booking, plus archived_at.
+    """
+
+    __tablename__ = "bookings_archive"
+    __table_args__ = (Index("ix_bookings_archive_user_check_in", "user_id", "check_in"),)
+
+    id = Column(Integer, primary_key=True)
+    booking_id = Column(String, unique=True, index=True, nullable=False)
+
+    name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    phone = Column(String, nullable=False)
+
+    # Normalized lookup keys (filled on write): lower-cased email, digits-only phone
+    email_normalized = Column(String, nullable=True, index=True)
+    phone_digits = Column(String, nullable=True, index=True)
+
+    # No foreign keys: archived rows must not block room/user changes
+    room_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=True)
+
+    check_in = Column(DateTime, nullable=False)
+    check_out = Column(DateTime, nullable=False)
+    guests = Column(Integer, nullable=False)
+
+    price_per_night = Column(Float, nullable=False)
+    total_nights = Column(Integer, nullable=False)
+    total_price = Column(Float, nullable=False)
+
+    unit_number = Column(Integer, nullable=True)
+    status = Column(String, nullable=False)
+
+    special_requests = Column(Text, default="", nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,24 @@
+# app/models/booking_change.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.db.base import Base
+
+
+class BookingChange(Base):
+    """
+    Append-only change log, written in the same transaction as the booking
+    change. seq only grows, and SQLite serializes writers, so a reader that
+    has seen seq N will never see a smaller seq appear later.
+    """
+
+    __tablename__ = "booking_changes"
+    # AUTOINCREMENT: seq values are never reused, even after the log is purged
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    event = Column(String, nullable=False)  # created, cancelled, expired
+    booking_id = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON: the booking as GET /bookings/ returns it
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
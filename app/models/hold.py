@@ -0,0 +1,28 @@
+# app/models/hold.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.db.base import Base
+
+
+class InventoryHold(Base):
+    """
+    One unit of a room type reserved for a checkout flow until expires_at.
+    Counted like a confirmed booking while unexpired; POST /bookings/ with
+    the token turns it into the booking.
+    """
+
+    __tablename__ = "inventory_holds"
+    # Overlap counts are a range scan on (room_id, check_in) that never touches the table
+    __table_args__ = (Index("ix_inventory_holds_room_dates", "room_id", "check_in", "check_out", "expires_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    token = Column(String, unique=True, index=True, nullable=False)
+
+    room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
+    check_in = Column(DateTime, nullable=False)
+    check_out = Column(DateTime, nullable=False)
+
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,17 @@
+# app/models/job_lease.py
+from sqlalchemy import Column, DateTime, String
+
+from app.db.base import Base
+
+
+class JobLease(Base):
+    """
+    One row per scheduled job. A worker may run the job only while it holds
+    an unexpired lease, so several uvicorn workers never run the same job twice.
+    """
+
+    __tablename__ = "job_leases"
+
+    name = Column(String, primary_key=True)
+    owner = Column(String, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,21 @@
+# app/models/property.py
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
+
+from app.db.base import Base
+
+
+class Property(Base):
+    """
+    One hotel. Lives in the main database; the property's rooms, bookings and
+    rates live in its own database file (see app/db/partitions.py).
+    """
+
+    __tablename__ = "properties"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String, unique=True, index=True, nullable=False)  # e.g. "colombo", also the file name
+    name = Column(String, nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,56 @@
+# app/models/rate.py
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Float, Integer, String, UniqueConstraint
+
+from app.db.base import Base
+
+
+class RateOverride(Base):
+    """
+    Date-range price override for a room type (seasons, holidays, events).
+    start_date and end_date are both inclusive (nights that start on those days).
+    """
+
+    __tablename__ = "rate_overrides"
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_type = Column(String, nullable=False, index=True)
+    name = Column(String, default="", nullable=False)  # e.g. "High season", "Christmas"
+
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+
+    # Fixed nightly price for the range (None = keep the room's base price)
+    price = Column(Float, nullable=True)
+    multiplier = Column(Float, default=1.0, nullable=False)
+
+    # Higher priority wins when ranges overlap
+    priority = Column(Integer, default=0, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class WeekdayMultiplier(Base):
+    __tablename__ = "rate_weekday_multipliers"
+    __table_args__ = (UniqueConstraint("room_type", "weekday", name="uq_rate_weekday"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_type = Column(String, nullable=False, index=True)
+    weekday = Column(Integer, nullable=False)  # 0 = Monday ... 6 = Sunday
+    multiplier = Column(Float, default=1.0, nullable=False)
+
+
+class StayDiscount(Base):
+    """
+    Length-of-stay discount: stays of at least min_nights get discount_percent off.
+    The largest qualifying discount applies.
+    """
+
+    __tablename__ = "rate_stay_discounts"
+    __table_args__ = (UniqueConstraint("room_type", "min_nights", name="uq_rate_stay_discount"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_type = Column(String, nullable=False, index=True)
+    min_nights = Column(Integer, nullable=False)
+    discount_percent = Column(Float, nullable=False)
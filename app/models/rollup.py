@@ -0,0 +1,20 @@
+# app/models/rollup.py
+from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String
+
+from app.db.base import Base
+
+
+class OccupancyRollup(Base):
+    """
+    One row per (night, room). Kept up to date by create_booking / cancel_booking,
+    so reports never have to expand bookings into nights.
+    """
+
+    __tablename__ = "occupancy_rollups"
+
+    day = Column(Date, primary_key=True)
+    room_id = Column(Integer, ForeignKey("rooms.id"), primary_key=True)
+    room_type = Column(String, nullable=False, index=True)
+
+    rooms_sold = Column(Integer, default=0, nullable=False)
+    revenue = Column(Float, default=0.0, nullable=False)
@@ -0,0 +1,25 @@
+# app/schemas/blackout.py
+from datetime import date, datetime
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class BlackoutCreate(BaseModel):
+    room_type: str = Field(min_length=2, max_length=30)
+    start_date: date
+    end_date: date
+    units: int = Field(ge=1, le=999)
+    reason: str = Field(default="", max_length=200)
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be on or after start_date")
+        return self
+
+
+class BlackoutPublic(BlackoutCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    created_at: datetime
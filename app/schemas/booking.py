@@ -1,6 +1,6 @@
 # app/schemas/booking.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,6 +18,8 @@ class AvailabilityRoomInfo(BaseModel):
     total_nights: int
     total_price: float
     available_rooms: int
+    nightly_rates: List[float] = []
+    discount_percent: float = 0.0
 
 
 class AvailabilityResponse(BaseModel):
@@ -37,6 +39,8 @@ class BookingCreate(BaseModel):
     guests: int = Field(ge=1, le=20)
 
     special_requests: Optional[str] = ""
+    # From POST /holds/: the held unit becomes this booking
+    hold_token: Optional[str] = Field(default=None, max_length=64)
 
 
 class BookingPublic(BaseModel):
@@ -60,6 +64,7 @@ class BookingPublic(BaseModel):
     total_nights: int
     total_price: float
 
+    unit_number: Optional[int] = None
     status: str
     special_requests: Optional[str] = ""
     created_at: datetime
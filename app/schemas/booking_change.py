@@ -0,0 +1,20 @@
+# app/schemas/booking_change.py
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class BookingChangeEvent(BaseModel):
+    seq: int
+    event: str
+    booking_id: str
+    booking: Dict[str, Any]
+    created_at: datetime
+
+
+class BookingChangesPage(BaseModel):
+    events: List[BookingChangeEvent]
+    last_seq: int
+    # True when `since` is older than the retained log: reload GET /bookings/ first
+    reset: bool = False
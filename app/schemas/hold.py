@@ -0,0 +1,20 @@
+# app/schemas/hold.py
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class HoldCreate(BaseModel):
+    room_type: str = Field(min_length=2, max_length=30)
+    check_in: str
+    check_out: str
+    minutes: Optional[int] = Field(default=None, ge=1, description="Defaults to HOLD_TTL_MINUTES")
+
+
+class HoldPublic(BaseModel):
+    token: str
+    room_type: str
+    check_in: datetime
+    check_out: datetime
+    expires_at: datetime
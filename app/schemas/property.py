@@ -0,0 +1,18 @@
+# app/schemas/property.py
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PropertyCreate(BaseModel):
+    # Lowercase slug: used in the X-Property header and as the database file name
+    code: str = Field(min_length=2, max_length=32, pattern=r"^[a-z0-9][a-z0-9-]*$")
+    name: str = Field(min_length=2, max_length=100)
+
+
+class PropertyPublic(PropertyCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    is_active: bool
+    created_at: datetime
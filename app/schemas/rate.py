@@ -0,0 +1,73 @@
+# app/schemas/rate.py
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class RateOverrideCreate(BaseModel):
+    room_type: str = Field(min_length=2, max_length=30)
+    name: str = Field(default="", max_length=120)
+    start_date: date
+    end_date: date
+    price: Optional[float] = Field(default=None, gt=0)
+    multiplier: float = Field(default=1.0, gt=0)
+    priority: int = 0
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be on or after start_date")
+        return self
+
+
+class RateOverridePublic(RateOverrideCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class WeekdayMultipliersUpdate(BaseModel):
+    room_type: str = Field(min_length=2, max_length=30)
+    # Monday first, exactly 7 values
+    multipliers: List[float] = Field(min_length=7, max_length=7)
+
+
+class StayDiscountItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    min_nights: int = Field(ge=2, le=365)
+    discount_percent: float = Field(gt=0, lt=100)
+
+
+class StayDiscountsUpdate(BaseModel):
+    room_type: str = Field(min_length=2, max_length=30)
+    discounts: List[StayDiscountItem] = Field(default_factory=list)
+
+
+class RatePlanPublic(BaseModel):
+    room_type: str
+    overrides: List[RateOverridePublic]
+    weekday_multipliers: List[float]
+    stay_discounts: List[StayDiscountItem]
+
+
+class CalendarDay(BaseModel):
+    date: date
+    price: float
+
+
+class RateCalendar(BaseModel):
+    room_type: str
+    base_price: float
+    days: List[CalendarDay]
+
+
+class StayQuotePublic(BaseModel):
+    room_type: str
+    room_name: str
+    nightly_rates: List[float]
+    subtotal: float
+    discount_percent: float
+    total_price: float
+    price_per_night: float
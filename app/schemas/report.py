@@ -0,0 +1,21 @@
+# app/schemas/report.py
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+
+class OccupancyRow(BaseModel):
+    key: str  # room type, ISO week (2026-W07) or month (2026-02)
+    room_nights_sold: int
+    room_nights_available: int
+    occupancy_rate: float
+    revenue: float
+    average_daily_rate: float
+
+
+class OccupancyReport(BaseModel):
+    date_from: date
+    date_to: date
+    group_by: str
+    rows: List[OccupancyRow]
@@ -86,3 +86,8 @@ class RoomPublic(RoomBase):
 
     id: int
     created_at: datetime
+
+
+class RoomSearchResult(BaseModel):
+    room: RoomPublic
+    score: float  # higher = better match
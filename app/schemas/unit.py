@@ -0,0 +1,33 @@
+# app/schemas/unit.py
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+
+class UnitStay(BaseModel):
+    booking_id: str
+    name: str
+    check_in: datetime
+    check_out: datetime
+
+
+class UnitRow(BaseModel):
+    unit: int
+    stays: List[UnitStay]
+
+
+class UnitBoard(BaseModel):
+    room_id: int
+    room_type: str
+    total_units: int
+    units: List[UnitRow]
+    unassigned: List[UnitStay] = []
+
+
+class UnitReassignResult(BaseModel):
+    room_id: int
+    bookings: int
+    moved: int
+    units_used: int
+    unassigned: List[str] = []
@@ -0,0 +1,64 @@
+# app/services/archive_service.py
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.booking import Booking, BookingArchive
+
+ARCHIVABLE_STATUSES = ("confirmed", "cancelled", "expired")
+
+# Columns copied as-is from bookings into bookings_archive
+_COLUMNS = [c.name for c in Booking.__table__.columns]
+
+
+def archive_bookings(
+    db: Session,
+    older_than_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+) -> Dict:
+    """
+    Moves bookings that checked out more than `older_than_days` ago into
+    bookings_archive. Each batch is its own short transaction (copy + delete),
+    so the write lock is never held for long.
+    """
+    days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = datetime.now() - timedelta(days=days)
+
+    archived = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = [
+            row[0]
+            for row in db.query(Booking.id)
+            .filter(Booking.check_out < cutoff, Booking.status.in_(ARCHIVABLE_STATUSES))
+            .order_by(Booking.id.asc())
+            .limit(size)
+        ]
+        if not ids:
+            break
+
+        source = select(*[Booking.__table__.c[name] for name in _COLUMNS], literal(datetime.utcnow())).where(
+            Booking.__table__.c.id.in_(ids)
+        )
+        db.execute(insert(BookingArchive.__table__).from_select(_COLUMNS + ["archived_at"], source))
+        db.execute(delete(Booking.__table__).where(Booking.__table__.c.id.in_(ids)))
+        db.commit()
+
+        archived += len(ids)
+        batches += 1
+        if len(ids) < size:
+            break
+        # Let queued booking writes grab the lock between batches
+        time.sleep(settings.ARCHIVE_BATCH_PAUSE_SECONDS)
+
+    return {"archived": archived, "batches": batches, "cutoff": cutoff}
+
+
+def get_archived_booking(db: Session, booking_id: str) -> Optional[BookingArchive]:
+    return db.query(BookingArchive).filter(BookingArchive.booking_id == booking_id).first()
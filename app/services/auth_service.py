@@ -1,4 +1,6 @@
 # app/services/auth_service.py
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.security import hash_password, verify_password
@@ -13,19 +15,17 @@ def get_user_by_email(db: Session, email: str) -> User | None:
 def create_user(db: Session, data: UserCreate) -> User:
     email = data.email.lower().strip()
 
-    existing = get_user_by_email(db, email)
-    if existing:
+    # The unique index on email rejects duplicates, so no pre-read is needed
+    try:
+        user = db.scalars(
+            insert(User)
+            .values(name=data.name.strip(), email=email, password=hash_password(data.password))
+            .returning(User)
+        ).one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise ValueError("Email is already registered")
-
-    user = User(
-        name=data.name.strip(),
-        email=email,
-        password=hash_password(data.password),
-    )
-
-    db.add(user)
-    db.commit()
-    db.refresh(user)
     return user
 
 
@@ -0,0 +1,177 @@
+# app/services/availability_cache.py
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import property_of
+
+# (property, room_type, check_in, check_out)
+AvailabilityKey = Tuple[str, str, datetime, datetime]
+# (property, room_type): the unit writes invalidate
+RoomScope = Tuple[str, str]
+
+_PENDING = "availability_invalidations"
+
+
+class AvailabilityCache:
+    """
+    Short-TTL memo of check_availability answers.
+
+    - bounded (least recently used entries are dropped first)
+    - concurrent identical misses share one computation (request coalescing)
+    - booking writes drop the entries whose dates overlap theirs; a result
+      computed while a write for the same room type committed is not stored
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[AvailabilityKey, Tuple[float, Dict]]" = OrderedDict()
+        self._by_room: Dict[RoomScope, Set[AvailabilityKey]] = {}
+        self._inflight: Dict[AvailabilityKey, Future] = {}
+        # Bumped by invalidations; results computed across a bump aren't stored
+        self._epoch = 0
+        self._generation: Dict[RoomScope, int] = {}
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidated = 0
+
+    def get_or_compute(self, key: AvailabilityKey, compute: Callable[[], Dict]) -> Dict:
+        scope = key[:2]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            waiting = self._inflight.get(key)
+            if waiting is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                leader: Future = Future()
+                self._inflight[key] = leader
+                generation = (self._epoch, self._generation.get(scope, 0))
+
+        if waiting is not None:
+            return waiting.result(timeout=settings.AVAILABILITY_CACHE_WAIT_SECONDS)
+
+        try:
+            value = compute()
+        except BaseException as e:
+            # Errors are shared with the waiters but never cached
+            with self._lock:
+                self._inflight.pop(key, None)
+            leader.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            if (self._epoch, self._generation.get(scope, 0)) == generation:
+                self._store(key, value)
+        leader.set_result(value)
+        return value
+
+    def _store(self, key: AvailabilityKey, value: Dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        self._by_room.setdefault(key[:2], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self._discard_index(old_key)
+
+    def _discard_index(self, key: AvailabilityKey) -> None:
+        keys = self._by_room.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_room[key[:2]]
+
+    def invalidate(
+        self,
+        room_type: Optional[str] = None,
+        check_in: Optional[datetime] = None,
+        check_out: Optional[datetime] = None,
+        property_code: Optional[str] = None,
+    ) -> int:
+        """
+        Drops cached answers for one room type of a property (only those
+        overlapping check_in..check_out when given), or everything when
+        room_type is None.
+        """
+        with self._lock:
+            if room_type is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._by_room.clear()
+                self._epoch += 1
+            else:
+                scope = (property_code or settings.DEFAULT_PROPERTY_CODE, room_type)
+                self._generation[scope] = self._generation.get(scope, 0) + 1
+                keys = self._by_room.get(scope, set())
+                if check_in is not None and check_out is not None:
+                    keys = {k for k in keys if k[2] < check_out and k[3] > check_in}
+                for key in list(keys):
+                    self._entries.pop(key, None)
+                    self._discard_index(key)
+                dropped = len(keys)
+            self.invalidated += dropped
+        return dropped
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+            inflight = len(self._inflight)
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": size,
+            "inflight": inflight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidated": self.invalidated,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+        }
+
+
+availability_cache = AvailabilityCache(
+    ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+    max_entries=settings.AVAILABILITY_CACHE_MAX_ENTRIES,
+)
+
+
+# -------------------------
+# Invalidation after commit
+# -------------------------
+def invalidate_after_commit(db: Session, room_type: str, check_in: datetime, check_out: datetime) -> None:
+    """
+    Queues an invalidation on the session; it runs once the transaction commits
+    (so readers can't re-cache the pre-write answer in between). Works the same
+    for single writes and write-pipeline batches.
+    """
+    db.info.setdefault(_PENDING, []).append((property_of(db), room_type, check_in, check_out))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_invalidations(session: Session) -> None:
+    pending: List[Tuple[str, str, datetime, datetime]] = session.info.pop(_PENDING, [])
+    for property_code, room_type, check_in, check_out in pending:
+        availability_cache.invalidate(room_type, check_in, check_out, property_code=property_code)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING, None)
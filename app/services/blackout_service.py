@@ -0,0 +1,55 @@
+# app/services/blackout_service.py
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.models.blackout import RoomBlackout
+from app.schemas.blackout import BlackoutCreate
+from app.services.availability_cache import invalidate_after_commit
+from app.services.booking_service import find_room_by_type
+
+
+def _invalidate_availability(db: Session, blackout: RoomBlackout) -> None:
+    # Inclusive nights -> the datetime range availability keys use
+    start = datetime.combine(blackout.start_date, time.min)
+    end = datetime.combine(blackout.end_date + timedelta(days=1), time.min)
+    invalidate_after_commit(db, blackout.room_type, start, end)
+
+
+def list_blackouts(db: Session, room_type: Optional[str] = None, include_past: bool = False) -> List[RoomBlackout]:
+    q = db.query(RoomBlackout)
+    if room_type:
+        q = q.filter(RoomBlackout.room_type == room_type)
+    if not include_past:
+        q = q.filter(RoomBlackout.end_date >= date.today())
+    return q.order_by(RoomBlackout.start_date.asc(), RoomBlackout.id.asc()).all()
+
+
+def create_blackout(db: Session, data: BlackoutCreate) -> RoomBlackout:
+    room = find_room_by_type(db, data.room_type)
+    if not room:
+        raise LookupError("Room type not found")
+    if data.units > room.total_rooms:
+        raise ValueError(f"Cannot withhold more than the {room.total_rooms} units of this room type")
+
+    blackout = db.scalars(insert(RoomBlackout).values(**data.model_dump()).returning(RoomBlackout)).one()
+    _invalidate_availability(db, blackout)
+    db.commit()
+    return blackout
+
+
+def delete_blackout(db: Session, blackout_id: int) -> RoomBlackout:
+    blackout = db.scalars(
+        delete(RoomBlackout)
+        .where(RoomBlackout.id == blackout_id)
+        .returning(RoomBlackout)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if not blackout:
+        raise LookupError("Blackout not found")
+
+    _invalidate_availability(db, blackout)
+    db.commit()
+    return blackout
@@ -1,18 +1,31 @@
 # app/services/booking_service.py
-from datetime import datetime
-from typing import Dict, List, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.booking import Booking
+from app.models.blackout import RoomBlackout
+from app.models.booking import Booking, BookingArchive
+from app.models.hold import InventoryHold
 from app.models.room import Room
+from app.core.config import settings
+from app.db.session import property_of
 from app.schemas.booking import BookingCreate
-from app.utils.dates import parse_date
+from app.services.archive_service import get_archived_booking
+from app.services.availability_cache import availability_cache, invalidate_after_commit
+from app.services.change_feed import record_booking_change
+from app.services.pricing_service import price_stay
+from app.services.rollup_service import apply_booking_to_rollups
+from app.services.unit_service import fill_released_unit, free_unit, repack_room
+from app.utils.contact import normalize_email, phone_digits
+from app.utils.dates import local_now, parse_date
 from app.utils.ids import generate_booking_id
 
 
 def _today_date() -> datetime.date:
-    return datetime.now().date()
+    return local_now().date()
 
 
 def find_room_by_type(db: Session, room_type: str) -> Room | None:
@@ -36,7 +49,45 @@ def count_overlapping_confirmed(db: Session, room_id: int, check_in: datetime, c
     )
 
 
-def check_availability(db: Session, room_type: str, check_in_str: str, check_out_str: str) -> Dict:
+def count_reserved_units(db: Session, room: Room, check_in: datetime, check_out: datetime) -> int:
+    """
+    Units taken for the dates: confirmed bookings, unexpired holds and
+    blacked-out units. One statement; each part is a covering index range scan.
+    """
+    bookings = (
+        select(func.count())
+        .where(
+            Booking.room_id == room.id,
+            Booking.status == "confirmed",
+            Booking.check_in < check_out,
+            Booking.check_out > check_in,
+        )
+        .scalar_subquery()
+    )
+    holds = (
+        select(func.count())
+        .where(
+            InventoryHold.room_id == room.id,
+            InventoryHold.check_in < check_out,
+            InventoryHold.check_out > check_in,
+            InventoryHold.expires_at > datetime.utcnow(),
+        )
+        .scalar_subquery()
+    )
+    # Blackouts are inclusive night ranges: compare with the stay's first and last night
+    blackouts = (
+        select(func.coalesce(func.sum(RoomBlackout.units), 0))
+        .where(
+            RoomBlackout.room_type == room.room_type,
+            RoomBlackout.start_date <= (check_out - timedelta(days=1)).date(),
+            RoomBlackout.end_date >= check_in.date(),
+        )
+        .scalar_subquery()
+    )
+    return db.execute(select(bookings + holds + blackouts)).scalar_one()
+
+
+def parse_stay_dates(check_in_str: str, check_out_str: str) -> Tuple[datetime, datetime]:
     check_in = parse_date(check_in_str)
     check_out = parse_date(check_out_str)
 
@@ -45,29 +96,46 @@ def check_availability(db: Session, room_type: str, check_in_str: str, check_out
         raise ValueError("Check-in date must be in the future")
     if check_out <= check_in:
         raise ValueError("Check-out date must be after check-in date")
+    if (check_out - check_in).days > settings.MAX_STAY_NIGHTS:
+        raise ValueError(f"Stays are limited to {settings.MAX_STAY_NIGHTS} nights")
+    return check_in, check_out
 
+
+def check_availability(db: Session, room_type: str, check_in_str: str, check_out_str: str) -> Dict:
+    check_in, check_out = parse_stay_dates(check_in_str, check_out_str)
+
+    if not settings.AVAILABILITY_CACHE_ENABLED:
+        return _compute_availability(db, room_type, check_in, check_out)
+    # Validation stays outside the cache: "in the future" depends on today
+    return availability_cache.get_or_compute(
+        (property_of(db), room_type, check_in, check_out),
+        lambda: _compute_availability(db, room_type, check_in, check_out),
+    )
+
+
+def _compute_availability(db: Session, room_type: str, check_in: datetime, check_out: datetime) -> Dict:
     room = find_room_by_type(db, room_type)
     if not room:
         return {"available": False, "message": "Room type not found"}
 
-    overlapping = count_overlapping_confirmed(db, room.id, check_in, check_out)
-    available_rooms = room.total_rooms - overlapping
+    available_rooms = room.total_rooms - count_reserved_units(db, room, check_in, check_out)
 
     if available_rooms <= 0:
         return {"available": False, "message": "Room not available for selected dates"}
 
-    nights = (check_out - check_in).days
-    total_price = room.price * nights
+    quote = price_stay(db, room, check_in, check_out)
 
     return {
         "available": True,
         "room": {
             "name": room.name,
             "room_type": room.room_type,
-            "price_per_night": room.price,
-            "total_nights": nights,
-            "total_price": total_price,
+            "price_per_night": quote.price_per_night,
+            "total_nights": quote.nights,
+            "total_price": quote.total_price,
             "available_rooms": available_rooms,
+            "nightly_rates": quote.nightly_rates,
+            "discount_percent": quote.discount_percent,
         },
     }
 
@@ -77,90 +145,304 @@ def _generate_unique_booking_id(db: Session) -> str:
     for _ in range(20):
         code = generate_booking_id()
         exists = db.query(Booking).filter(Booking.booking_id == code).first()
-        if not exists:
+        if not exists and not get_archived_booking(db, code):
             return code
     # Extremely unlikely
     raise RuntimeError("Could not generate unique booking id")
 
 
-def create_booking(db: Session, data: BookingCreate) -> Booking:
-    check_in = parse_date(data.check_in)
-    check_out = parse_date(data.check_out)
-
-    if check_in.date() <= _today_date():
-        raise ValueError("Check-in date must be in the future")
-    if check_out <= check_in:
-        raise ValueError("Check-out date must be after check-in date")
+def stage_booking(db: Session, data: BookingCreate, user_id: Optional[int] = None) -> Booking:
+    """
+    Validates and inserts a booking (plus its rollups) without committing,
+    so callers can commit one booking or a whole batch at once.
+    """
+    check_in, check_out = parse_stay_dates(data.check_in, data.check_out)
 
     room = find_room_by_type(db, data.room_type)
     if not room:
         raise LookupError("Room not found")
 
-    overlapping = count_overlapping_confirmed(db, room.id, check_in, check_out)
-    if overlapping >= room.total_rooms:
+    if data.hold_token:
+        # Deleting the hold first frees its unit for the count below
+        _consume_hold(db, data.hold_token, room.id, check_in, check_out)
+
+    if count_reserved_units(db, room, check_in, check_out) >= room.total_rooms:
         raise ValueError("Room no longer available")
+    unit = free_unit(db, room, check_in, check_out)
+
+    quote = price_stay(db, room, check_in, check_out)
+
+    booking = db.scalars(
+        insert(Booking)
+        .values(
+            booking_id=_generate_unique_booking_id(db),
+            name=data.name,
+            email=data.email,
+            phone=data.phone,
+            email_normalized=normalize_email(data.email),
+            phone_digits=phone_digits(data.phone),
+            room_id=room.id,
+            user_id=user_id,
+            check_in=check_in,
+            check_out=check_out,
+            guests=data.guests,
+            price_per_night=quote.price_per_night,
+            total_nights=quote.nights,
+            total_price=quote.total_price,
+            special_requests=data.special_requests or "",
+            unit_number=unit,
+            status="confirmed",  # MVP: auto-confirm
+        )
+        .returning(Booking)
+    ).one()
+    # Callers read booking.room for the response; we already have it
+    set_committed_value(booking, "room", room)
+    if unit is None:
+        # The count fits but no single unit is free all stay: repack future stays
+        set_committed_value(booking, "unit_number", repack_room(db, room)["assignments"].get(booking.id))
+
+    apply_booking_to_rollups(db, booking, room.room_type, sign=1)
+    invalidate_after_commit(db, room.room_type, check_in, check_out)
+    record_booking_change(db, "created", booking_to_public(booking, room))
+    return booking
 
-    nights = (check_out - check_in).days
-    total_price = room.price * nights
-
-    booking = Booking(
-        booking_id=_generate_unique_booking_id(db),
-        name=data.name,
-        email=data.email,
-        phone=data.phone,
-        room_id=room.id,
-        check_in=check_in,
-        check_out=check_out,
-        guests=data.guests,
-        price_per_night=room.price,
-        total_nights=nights,
-        total_price=total_price,
-        special_requests=data.special_requests or "",
-        status="confirmed",  # MVP: auto-confirm
-    )
 
-    db.add(booking)
+def _consume_hold(db: Session, token: str, room_id: int, check_in: datetime, check_out: datetime) -> None:
+    # Rolled back with the booking if anything after this fails
+    hold = db.scalars(
+        delete(InventoryHold)
+        .where(InventoryHold.token == token, InventoryHold.expires_at > datetime.utcnow())
+        .returning(InventoryHold)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if not hold:
+        raise ValueError("Hold not found or expired")
+    if (hold.room_id, hold.check_in, hold.check_out) != (room_id, check_in, check_out):
+        raise ValueError("Hold is for a different room type or dates")
+
+
+def create_booking(db: Session, data: BookingCreate, user_id: Optional[int] = None) -> Booking:
+    booking = stage_booking(db, data, user_id)
     db.commit()
-    db.refresh(booking)
     return booking
 
 
-def list_bookings(db: Session) -> List[Dict]:
-    bookings = db.query(Booking).order_by(Booking.created_at.desc()).all()
-
-    # Build simple, frontend-friendly dicts with room info
-    results: List[Dict] = []
-    for b in bookings:
-        room = db.query(Room).filter(Room.id == b.room_id).first()
-        results.append(
-            {
-                "id": b.id,
-                "booking_id": b.booking_id,
-                "name": b.name,
-                "email": b.email,
-                "phone": b.phone,
-                "room_type": room.room_type if room else "Unknown",
-                "room_name": room.name if room else None,
-                "check_in": b.check_in,
-                "check_out": b.check_out,
-                "guests": b.guests,
-                "price_per_night": b.price_per_night,
-                "total_nights": b.total_nights,
-                "total_price": b.total_price,
-                "status": b.status,
-                "special_requests": b.special_requests,
-                "created_at": b.created_at,
-            }
-        )
+def create_booking_staged(db: Session, data: BookingCreate, user_id: Optional[int] = None) -> Dict:
+    """
+    Write-pipeline operation: stages the booking and returns its public dict
+    (built before the batch commits, so it never touches an expired instance).
+    """
+    booking = stage_booking(db, data, user_id)
+    return booking_to_public(booking, booking.room)
+
+
+def booking_to_public(b: Union[Booking, BookingArchive], room: Optional[Room]) -> Dict:
+    """
+    Simple, frontend-friendly dict with room info (works for live and archived rows).
+    """
+    return {
+        "id": b.id,
+        "booking_id": b.booking_id,
+        "name": b.name,
+        "email": b.email,
+        "phone": b.phone,
+        "room_type": room.room_type if room else "Unknown",
+        "room_name": room.name if room else None,
+        "check_in": b.check_in,
+        "check_out": b.check_out,
+        "guests": b.guests,
+        "price_per_night": b.price_per_night,
+        "total_nights": b.total_nights,
+        "total_price": b.total_price,
+        "unit_number": b.unit_number,
+        "status": b.status,
+        "special_requests": b.special_requests,
+        "created_at": b.created_at,
+    }
+
+
+def iter_bookings(db: Session, include_archived: bool = True) -> Iterator[Dict]:
+    """
+    Streams bookings (newest first) as public dicts; archived rows come after live ones.
+    """
+    rooms = {room.id: room for room in db.query(Room).all()}
+
+    for b in db.query(Booking).order_by(Booking.created_at.desc()).yield_per(1000):
+        yield booking_to_public(b, rooms.get(b.room_id))
+
+    if include_archived:
+        for b in db.query(BookingArchive).order_by(BookingArchive.created_at.desc()).yield_per(1000):
+            yield booking_to_public(b, rooms.get(b.room_id))
+
+
+def list_bookings(db: Session, include_archived: bool = False) -> List[Dict]:
+    results = list(iter_bookings(db, include_archived=include_archived))
+    if include_archived:
+        results.sort(key=lambda b: b["created_at"], reverse=True)
     return results
 
 
-def cancel_booking(db: Session, booking_id: str) -> Booking:
+def get_booking(db: Session, booking_id: str) -> Dict:
+    """
+    Looks up one booking by its public code, falling back to the archive.
+    """
     booking = db.query(Booking).filter(Booking.booking_id == booking_id).first()
+    if not booking:
+        booking = get_archived_booking(db, booking_id)
     if not booking:
         raise LookupError("Booking not found")
 
-    booking.status = "cancelled"
+    room = db.query(Room).filter(Room.id == booking.room_id).first()
+    return booking_to_public(booking, room)
+
+
+def _with_rooms(db: Session, bookings: List[Union[Booking, BookingArchive]]) -> List[Dict]:
+    # One query for all the rooms on the page
+    room_ids = {b.room_id for b in bookings}
+    rooms = {r.id: r for r in db.query(Room).filter(Room.id.in_(room_ids)).all()} if room_ids else {}
+    return [booking_to_public(b, rooms.get(b.room_id)) for b in bookings]
+
+
+MAX_LOOKUP_RESULTS = 50
+
+
+def lookup_bookings(
+    db: Session,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    booking_id: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Front-desk lookup by exactly one of email / phone / booking code.
+    Each is an indexed equality match on bookings and bookings_archive.
+    """
+    given = [v for v in (email, phone, booking_id) if v]
+    if len(given) != 1:
+        raise ValueError("Provide exactly one of email, phone or booking_id")
+
+    if booking_id:
+        try:
+            return [get_booking(db, booking_id.strip().upper())]
+        except LookupError:
+            return []
+
+    if email:
+        column, key = "email_normalized", normalize_email(email)
+    else:
+        column, key = "phone_digits", phone_digits(phone)
+        if not key:
+            raise ValueError("Phone number must contain digits")
+
+    found = []
+    for model in (Booking, BookingArchive):
+        found += (
+            db.query(model)
+            .filter(getattr(model, column) == key)
+            .order_by(model.check_in.desc())
+            .limit(MAX_LOOKUP_RESULTS)
+            .all()
+        )
+    found.sort(key=lambda b: b.check_in, reverse=True)
+    return _with_rooms(db, found[:MAX_LOOKUP_RESULTS])
+
+
+USER_BOOKING_FILTERS = ("upcoming", "past", "all")
+
+
+def list_user_bookings(db: Session, user_id: int, when: str = "upcoming", limit: int = 20, offset: int = 0) -> List[Dict]:
+    """
+    One user's bookings, paginated. Every query is a range scan on
+    (user_id, check_in), so the cost depends only on that user's bookings.
+    upcoming: still to come or in progress, soonest first
+    past / all: most recent first (archived bookings included)
+    """
+    if when not in USER_BOOKING_FILTERS:
+        raise ValueError(f"when must be one of: {', '.join(USER_BOOKING_FILTERS)}")
+
+    now = local_now()
+    window = offset + limit
+
+    def query(model):
+        q = db.query(model).filter(model.user_id == user_id)
+        if when == "upcoming":
+            return q.filter(model.check_out > now).order_by(model.check_in.asc())
+        if when == "past":
+            q = q.filter(model.check_out <= now)
+        return q.order_by(model.check_in.desc())
+
+    if when == "upcoming":
+        # Archived bookings have all checked out
+        page = query(Booking).offset(offset).limit(limit).all()
+    else:
+        # Merge the first offset+limit rows of each table, then cut the page
+        merged = query(Booking).limit(window).all() + query(BookingArchive).limit(window).all()
+        merged.sort(key=lambda b: b.check_in, reverse=True)
+        page = merged[offset:window]
+
+    return _with_rooms(db, page)
+
+
+def _cancel_where(db: Session, booking_id: str, *conditions) -> Optional[Tuple[Booking, str, str]]:
+    # Room type and name ride along in RETURNING (rollups, cache invalidation, change feed)
+    room = select(Room).where(Room.id == Booking.room_id)
+    return db.execute(
+        update(Booking)
+        .where(Booking.booking_id == booking_id, *conditions)
+        .values(status="cancelled", unit_number=None)
+        .returning(
+            Booking,
+            room.with_only_columns(Room.room_type).scalar_subquery(),
+            room.with_only_columns(Room.name).scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+
+
+def _record_cancellation(db: Session, booking: Booking, room_type: str, room_name: str) -> None:
+    public = booking_to_public(booking, None)
+    public.update(room_type=room_type, room_name=room_name)
+    record_booking_change(db, "cancelled", public)
+
+
+def stage_cancellation(db: Session, booking_id: str) -> Booking:
+    """
+    Conditional UPDATE ... RETURNING (no read-modify-write). Confirmed bookings
+    are tried first so we know their nights must leave the rollups.
+    """
+    row = _cancel_where(db, booking_id, Booking.status == "confirmed")
+    if row:
+        booking, room_type, room_name = row
+        apply_booking_to_rollups(db, booking, room_type, sign=-1)
+        invalidate_after_commit(db, room_type, booking.check_in, booking.check_out)
+        fill_released_unit(db, booking)
+        _record_cancellation(db, booking, room_type, room_name)
+        return booking
+
+    # Pending bookings; expired ones are final, like cancelled
+    row = _cancel_where(db, booking_id, Booking.status.notin_(("confirmed", "cancelled", "expired")))
+    if row:
+        _record_cancellation(db, *row)
+        return row[0]
+
+    # Nothing updated: only now find out why
+    status = db.scalar(select(Booking.status).where(Booking.booking_id == booking_id))
+    if status == "expired":
+        raise ValueError("Expired bookings cannot be cancelled")
+    if status:
+        raise ValueError("Booking is already cancelled")
+    if get_archived_booking(db, booking_id):
+        raise ValueError("Archived bookings cannot be cancelled")
+    raise LookupError("Booking not found")
+
+
+def cancel_booking(db: Session, booking_id: str) -> Booking:
+    booking = stage_cancellation(db, booking_id)
     db.commit()
-    db.refresh(booking)
     return booking
+
+
+def cancel_booking_staged(db: Session, booking_id: str) -> str:
+    """
+    Write-pipeline operation: returns the cancelled booking's public id.
+    """
+    return stage_cancellation(db, booking_id).booking_id
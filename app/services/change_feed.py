@@ -0,0 +1,332 @@
+# app/services/change_feed.py
+import asyncio
+import json
+import logging
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, func, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.partitions import property_router
+from app.db.session import property_of
+from app.models.booking_change import BookingChange
+
+logger = logging.getLogger("luxora.change_feed")
+
+_WRITTEN = "booking_changes_written"
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# -------------------------
+# Change log
+# -------------------------
+def record_booking_change(db: Session, event_name: str, booking_public: Dict) -> None:
+    """
+    Appends one event inside the caller's transaction (no commit here).
+    """
+    db.execute(
+        insert(BookingChange).values(
+            event=event_name,
+            booking_id=booking_public["booking_id"],
+            payload=json.dumps(booking_public, default=_json_default),
+        )
+    )
+    db.info[_WRITTEN] = True
+
+
+def change_to_public(change: BookingChange) -> Dict:
+    return {
+        "seq": change.seq,
+        "event": change.event,
+        "booking_id": change.booking_id,
+        "booking": json.loads(change.payload),
+        "created_at": change.created_at,
+    }
+
+
+def latest_seq(db: Session) -> int:
+    return db.query(func.max(BookingChange.seq)).scalar() or 0
+
+
+def list_changes(db: Session, since: Optional[int] = None, limit: Optional[int] = None) -> Dict:
+    """
+    Events after `since`, oldest first. Without `since`, only the current
+    last_seq: take it, load GET /bookings/, then follow from there (events
+    are full booking rows, so applying one twice is harmless).
+    """
+    if since is None:
+        return {"events": [], "last_seq": latest_seq(db), "reset": False}
+    if since < 0:
+        raise ValueError("since must be 0 or greater")
+
+    limit = min(limit or settings.CHANGE_FEED_PAGE_SIZE, settings.CHANGE_FEED_PAGE_SIZE)
+    changes = db.query(BookingChange).filter(BookingChange.seq > since).order_by(BookingChange.seq.asc()).limit(limit).all()
+    oldest = db.query(func.min(BookingChange.seq)).scalar()
+
+    return {
+        "events": [change_to_public(c) for c in changes],
+        "last_seq": changes[-1].seq if changes else since,
+        # Older events were purged: the client missed changes and must reload
+        "reset": oldest is not None and since < oldest - 1,
+    }
+
+
+def purge_booking_changes(db: Session, older_than_days: Optional[int] = None) -> int:
+    days = settings.CHANGE_FEED_RETENTION_DAYS if older_than_days is None else older_than_days
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    purged = db.execute(delete(BookingChange).where(BookingChange.created_at < cutoff)).rowcount
+    db.commit()
+    return purged
+
+
+# -------------------------
+# Server-sent events
+# -------------------------
+def sse_message(change: Dict) -> str:
+    data = json.dumps(change, default=_json_default)
+    return f"id: {change['seq']}\nevent: {change['event']}\ndata: {data}\n\n"
+
+
+def _fetch_messages(session_factory: sessionmaker, since: int, limit: int) -> Tuple[List[Tuple[int, str]], bool]:
+    with session_factory() as db:
+        page = list_changes(db, since, limit)
+    return [(c["seq"], sse_message(c)) for c in page["events"]], page["reset"]
+
+
+class ChangeBroadcaster:
+    """
+    One asyncio task per worker and property reads new change-log rows (woken
+    right after local commits, polling for other workers' writes) and fans each
+    event out to every SSE subscriber. The message is formatted once per event,
+    and an idle subscriber is just a queue, so thousands of them cost little.
+    """
+
+    def __init__(self, session_factory: sessionmaker, poll_seconds: float, queue_size: int, max_subscribers: int):
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_seq = 0
+
+        # Counters for monitoring
+        self.events_published = 0
+        self.dropped_subscribers = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.last_seq = await asyncio.to_thread(self._latest_seq)
+        self._task = asyncio.create_task(self._run(), name="change-feed")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for queue in list(self._subscribers):
+            self._close(queue)
+        self._loop = None
+
+    def notify(self) -> None:
+        # Called from worker threads after a commit
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    def subscribe(self) -> asyncio.Queue:
+        if len(self._subscribers) >= self.max_subscribers:
+            raise RuntimeError("Too many change feed subscribers")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def _close(self, queue: asyncio.Queue) -> None:
+        # None tells the stream to end; make room for it if needed
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def _run(self) -> None:
+        page_size = settings.CHANGE_FEED_PAGE_SIZE
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                messages, _ = await asyncio.to_thread(_fetch_messages, self.session_factory, self.last_seq, page_size)
+            except Exception:
+                logger.exception("Could not read the booking change log")
+                continue
+
+            for seq, message in messages:
+                self._publish(seq, message)
+            if len(messages) == page_size:
+                self._wakeup.set()  # more waiting
+
+    def _publish(self, seq: int, message: str) -> None:
+        self.last_seq = seq
+        self.events_published += 1
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait((seq, message))
+            except asyncio.QueueFull:
+                # Too slow to keep up: disconnect; it resumes from Last-Event-ID
+                self.dropped_subscribers += 1
+                self._close(queue)
+
+    async def stream(self, since: Optional[int]) -> AsyncIterator[str]:
+        """
+        SSE body for one subscriber: the backlog after `since` (if given),
+        then live events, with keep-alive comments while idle.
+        """
+        queue = self.subscribe()
+        try:
+            yield f"retry: {settings.CHANGE_FEED_RETRY_MS}\n\n"
+
+            sent = self.last_seq if since is None else since
+            if since is not None:
+                # Subscribed first, so nothing published meanwhile is lost
+                messages, reset = await asyncio.to_thread(
+                    _fetch_messages, self.session_factory, since, settings.CHANGE_FEED_PAGE_SIZE
+                )
+                if reset or len(messages) == settings.CHANGE_FEED_PAGE_SIZE:
+                    # Too far behind for a replay: reload, then follow live events.
+                    # Take the position before yielding: events published while
+                    # the reset is being sent must still be delivered
+                    sent = self.last_seq
+                    yield "event: reset\ndata: {}\n\n"
+                else:
+                    for seq, message in messages:
+                        yield message
+                        sent = seq
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), settings.CHANGE_FEED_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    return
+                seq, message = item
+                if seq > sent:
+                    yield message
+                    sent = seq
+        finally:
+            self.unsubscribe(queue)
+
+    def snapshot(self) -> Dict:
+        return {
+            "running": self.running,
+            "subscribers": len(self._subscribers),
+            "last_seq": self.last_seq,
+            "events_published": self.events_published,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+    def _latest_seq(self) -> int:
+        with self.session_factory() as db:
+            return latest_seq(db)
+
+
+class ChangeFeedHub:
+    """
+    The broadcasters of this worker, one per property database. The default
+    property's starts with the app; the others on their first subscriber.
+    """
+
+    def __init__(self):
+        self._broadcasters: Dict[str, ChangeBroadcaster] = {}
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        self._running = True
+        await self.broadcaster(settings.DEFAULT_PROPERTY_CODE)
+
+    async def stop(self) -> None:
+        self._running = False
+        broadcasters = list(self._broadcasters.values())
+        self._broadcasters.clear()
+        for broadcaster in broadcasters:
+            await broadcaster.stop()
+
+    async def broadcaster(self, property_code: str) -> ChangeBroadcaster:
+        broadcaster = self._broadcasters.get(property_code)
+        if broadcaster is None:
+            broadcaster = ChangeBroadcaster(
+                session_factory=property_router.database(property_code).ReadSessionLocal,
+                poll_seconds=settings.CHANGE_FEED_POLL_SECONDS,
+                queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+                max_subscribers=settings.CHANGE_FEED_MAX_SUBSCRIBERS,
+            )
+            # Registered before the await, so concurrent callers share it
+            self._broadcasters[property_code] = broadcaster
+            try:
+                await broadcaster.start()
+            except BaseException:
+                self._broadcasters.pop(property_code, None)
+                raise
+        return broadcaster
+
+    def close(self, property_code: str) -> None:
+        """
+        Stops a property's broadcaster (its database was closed); its
+        subscribers' streams end. Safe to call from any thread.
+        """
+        broadcaster = self._broadcasters.pop(property_code, None)
+        loop = broadcaster._loop if broadcaster is not None else None
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(broadcaster.stop(), loop)
+
+    def notify(self, property_code: str) -> None:
+        broadcaster = self._broadcasters.get(property_code)
+        if broadcaster is not None:
+            broadcaster.notify()
+
+    def snapshot(self) -> Dict:
+        return {
+            "running": self.running,
+            "properties": {code: b.snapshot() for code, b in list(self._broadcasters.items())},
+        }
+
+
+change_feed_hub = ChangeFeedHub()
+property_router.on_close(change_feed_hub.close)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_broadcaster(session: Session) -> None:
+    if session.info.pop(_WRITTEN, False):
+        change_feed_hub.notify(property_of(session))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written(session: Session) -> None:
+    session.info.pop(_WRITTEN, None)
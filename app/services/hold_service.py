@@ -0,0 +1,108 @@
+# app/services/hold_service.py
+import secrets
+from datetime import datetime, timedelta
+from typing import Dict
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.hold import InventoryHold
+from app.models.room import Room
+from app.schemas.hold import HoldCreate
+from app.services.availability_cache import invalidate_after_commit
+from app.services.booking_service import count_reserved_units, find_room_by_type, parse_stay_dates
+
+
+def hold_to_public(hold: InventoryHold, room_type: str) -> Dict:
+    return {
+        "token": hold.token,
+        "room_type": room_type,
+        "check_in": hold.check_in,
+        "check_out": hold.check_out,
+        "expires_at": hold.expires_at,
+    }
+
+
+def stage_hold(db: Session, data: HoldCreate) -> Dict:
+    """
+    Reserves one unit for the dates (without committing) and returns the hold.
+    Also the write-pipeline operation, so it returns a plain dict.
+    """
+    check_in, check_out = parse_stay_dates(data.check_in, data.check_out)
+
+    minutes = data.minutes or settings.HOLD_TTL_MINUTES
+    if minutes > settings.HOLD_MAX_MINUTES:
+        raise ValueError(f"Holds can last at most {settings.HOLD_MAX_MINUTES} minutes")
+
+    room = find_room_by_type(db, data.room_type)
+    if not room:
+        raise LookupError("Room not found")
+
+    if count_reserved_units(db, room, check_in, check_out) >= room.total_rooms:
+        raise ValueError("Room not available for selected dates")
+
+    hold = db.scalars(
+        insert(InventoryHold)
+        .values(
+            token=secrets.token_urlsafe(24),
+            room_id=room.id,
+            check_in=check_in,
+            check_out=check_out,
+            expires_at=datetime.utcnow() + timedelta(minutes=minutes),
+        )
+        .returning(InventoryHold)
+    ).one()
+
+    invalidate_after_commit(db, room.room_type, check_in, check_out)
+    return hold_to_public(hold, room.room_type)
+
+
+def create_hold(db: Session, data: HoldCreate) -> Dict:
+    hold = stage_hold(db, data)
+    db.commit()
+    return hold
+
+
+def get_hold(db: Session, token: str) -> Dict:
+    row = (
+        db.query(InventoryHold, Room.room_type)
+        .join(Room, Room.id == InventoryHold.room_id)
+        .filter(InventoryHold.token == token, InventoryHold.expires_at > datetime.utcnow())
+        .first()
+    )
+    if not row:
+        raise LookupError("Hold not found or expired")
+    return hold_to_public(*row)
+
+
+def release_hold(db: Session, token: str) -> None:
+    """
+    Gives the unit back before the hold expires (guest left checkout).
+    """
+    room_type = select(Room.room_type).where(Room.id == InventoryHold.room_id).scalar_subquery()
+    row = db.execute(
+        delete(InventoryHold)
+        .where(InventoryHold.token == token)
+        .returning(InventoryHold.check_in, InventoryHold.check_out, room_type)
+    ).one_or_none()
+    if not row:
+        raise LookupError("Hold not found or expired")
+
+    check_in, check_out, room_type_name = row
+    invalidate_after_commit(db, room_type_name, check_in, check_out)
+    db.commit()
+
+
+def purge_expired_holds(db: Session) -> int:
+    """
+    Deletes expired holds. They stopped counting when they expired; this only
+    keeps the table (and its index) small.
+    """
+    purged = db.execute(
+        delete(InventoryHold)
+        .where(InventoryHold.expires_at <= datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return purged
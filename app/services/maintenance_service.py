@@ -0,0 +1,158 @@
+# app/services/maintenance_service.py
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.scheduler import Scheduler
+from app.db.partitions import PropertyDatabase, property_router
+from app.models.booking import Booking
+from app.models.room import Room
+from app.services.archive_service import archive_bookings
+from app.services.booking_service import booking_to_public
+from app.services.change_feed import purge_booking_changes, record_booking_change
+from app.services.hold_service import purge_expired_holds
+from app.services.rollup_service import check_rollups
+
+logger = logging.getLogger("luxora.maintenance")
+
+
+def expire_pending_bookings(db: Session, ttl_minutes: Optional[int] = None) -> int:
+    """
+    Marks pending bookings older than the TTL as expired (one UPDATE), and
+    logs each one to the change feed in the same transaction.
+    """
+    minutes = settings.PENDING_BOOKING_TTL_MINUTES if ttl_minutes is None else ttl_minutes
+    cutoff = datetime.utcnow() - timedelta(minutes=minutes)
+
+    expired = db.scalars(
+        update(Booking)
+        .where(Booking.status == "pending", Booking.created_at < cutoff)
+        .values(status="expired")
+        .returning(Booking)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if expired:
+        room_ids = {b.room_id for b in expired}
+        rooms = {r.id: r for r in db.query(Room).filter(Room.id.in_(room_ids)).all()}
+        for booking in expired:
+            record_booking_change(db, "expired", booking_to_public(booking, rooms.get(booking.room_id)))
+    db.commit()
+    return len(expired)
+
+
+def _each_property(job: Callable[[PropertyDatabase], Any]) -> Dict[str, Any]:
+    """
+    Runs a job against every property database; one property failing doesn't skip the rest.
+    """
+    results: Dict[str, Any] = {}
+    failed = []
+    for database in property_router.all_databases():
+        try:
+            results[database.code] = job(database)
+        except Exception:
+            logger.exception("Maintenance job failed for property %s", database.code)
+            failed.append(database.code)
+    if failed:
+        raise RuntimeError(f"Failed for properties: {', '.join(failed)}")
+    return results
+
+
+def _optimize(database: PropertyDatabase) -> None:
+    # Refresh query planner statistics (cheap, safe while serving traffic)
+    with database.engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+        conn.commit()
+
+
+def _vacuum(database: PropertyDatabase) -> None:
+    # VACUUM cannot run inside a transaction
+    with database.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+
+
+def optimize_database() -> None:
+    _each_property(_optimize)
+
+
+def vacuum_database() -> None:
+    _each_property(_vacuum)
+
+
+def _refresh_rollups(database: PropertyDatabase) -> str:
+    # Read pool: the full scan never holds the (single) writer connection
+    with database.ReadSessionLocal() as db:
+        mismatches = check_rollups(db)
+    if not mismatches:
+        return "consistent"
+    logger.error(
+        "Occupancy rollups of %s drifted (%d rows); repair with: python -m app.cli --property %s rebuild-rollups",
+        database.code,
+        len(mismatches),
+        database.code,
+    )
+    return f"drifted ({len(mismatches)} rows differ)"
+
+
+def refresh_rollups() -> Dict[str, str]:
+    """
+    Nightly consistency check of every property's rollups. Drift is logged,
+    not repaired here: a rebuild locks out booking writes while it runs.
+    """
+    return _each_property(_refresh_rollups)
+
+
+def _sum_per_property(operation: Callable[[Session], int]) -> int:
+    def run(database: PropertyDatabase) -> int:
+        with database.SessionLocal() as db:
+            return operation(db)
+
+    return sum(_each_property(run).values())
+
+
+def _expire_pending_job() -> int:
+    return _sum_per_property(expire_pending_bookings)
+
+
+def _purge_holds_job() -> int:
+    return _sum_per_property(purge_expired_holds)
+
+
+def _purge_changes_job() -> int:
+    return _sum_per_property(purge_booking_changes)
+
+
+def _archive_job() -> int:
+    return _sum_per_property(lambda db: archive_bookings(db)["archived"])
+
+
+def register_maintenance_jobs(scheduler: Scheduler) -> None:
+    jitter = settings.SCHEDULER_JITTER_SECONDS
+    is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+
+    # First job: pending bookings must not tie up inventory forever
+    scheduler.add_job(
+        "expire_pending_bookings",
+        _expire_pending_job,
+        interval_seconds=settings.PENDING_EXPIRY_INTERVAL_SECONDS,
+        jitter_seconds=jitter,
+    )
+    scheduler.add_job(
+        "purge_expired_holds",
+        _purge_holds_job,
+        interval_seconds=settings.HOLD_PURGE_INTERVAL_SECONDS,
+        jitter_seconds=jitter,
+    )
+    scheduler.add_job("archive_bookings", _archive_job, cron=settings.ARCHIVE_CRON, jitter_seconds=jitter)
+    scheduler.add_job(
+        "purge_booking_changes", _purge_changes_job, cron=settings.CHANGE_FEED_PURGE_CRON, jitter_seconds=jitter
+    )
+    scheduler.add_job("refresh_rollups", refresh_rollups, cron=settings.ROLLUP_REFRESH_CRON, jitter_seconds=jitter)
+    if is_sqlite:
+        scheduler.add_job("analyze", optimize_database, cron=settings.DB_ANALYZE_CRON, jitter_seconds=jitter)
+        scheduler.add_job(
+            "vacuum", vacuum_database, cron=settings.DB_VACUUM_CRON, jitter_seconds=jitter, lease_seconds=3600
+        )
@@ -0,0 +1,261 @@
+# app/services/pricing_service.py
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import property_of
+from app.models.rate import RateOverride, StayDiscount, WeekdayMultiplier
+from app.models.room import Room
+from app.schemas.rate import RateOverrideCreate, StayDiscountsUpdate, WeekdayMultipliersUpdate
+from app.services.availability_cache import availability_cache
+
+MAX_CALENDAR_DAYS = 366
+
+
+@dataclass(frozen=True)
+class RateTable:
+    """
+    Compiled rate plan for one room type. Built once from the rate tables and
+    reused for every quote until rates change (no per-night queries).
+    """
+
+    room_type: str
+    # (start_date, end_date_inclusive, fixed_price_or_None, multiplier), lowest priority first
+    overrides: Tuple[Tuple[date, date, Optional[float], float], ...]
+    weekday: Tuple[float, ...]  # 7 multipliers, Monday first
+    # (min_nights, discount_percent), largest min_nights first
+    stay_discounts: Tuple[Tuple[int, float], ...]
+    compiled_at: float
+
+    def nightly_rates(self, base_price: float, start: date, nights: int) -> List[float]:
+        """
+        Price every night of [start, start + nights) in one pass:
+        overrides are painted onto whole slices, then the weekday pattern is applied.
+        """
+        if nights <= 0:
+            return []
+
+        base = [base_price] * nights
+        mult = [1.0] * nights
+        for o_start, o_end, price, multiplier in self.overrides:
+            lo = max((o_start - start).days, 0)
+            hi = min((o_end - start).days + 1, nights)
+            if lo >= hi:
+                continue
+            if price is not None:
+                base[lo:hi] = [price] * (hi - lo)
+            mult[lo:hi] = [multiplier] * (hi - lo)
+
+        first = start.weekday()
+        week = self.weekday[first:] + self.weekday[:first]
+        weekday = (week * (nights // 7 + 1))[:nights]
+
+        return [round(b * m * w, 2) for b, m, w in zip(base, mult, weekday)]
+
+    def stay_discount(self, nights: int) -> float:
+        # The best qualifying tier, even if a longer tier was set up with a smaller discount
+        return max((percent for min_nights, percent in self.stay_discounts if nights >= min_nights), default=0.0)
+
+
+@dataclass(frozen=True)
+class StayQuote:
+    nightly_rates: List[float]
+    subtotal: float
+    discount_percent: float
+    total_price: float
+
+    @property
+    def nights(self) -> int:
+        return len(self.nightly_rates)
+
+    @property
+    def price_per_night(self) -> float:
+        return round(self.total_price / self.nights, 2) if self.nights else 0.0
+
+
+# -------------------------
+# Compiled table cache
+# -------------------------
+# (property, room_type) -> table
+_cache: Dict[Tuple[str, str], RateTable] = {}
+_cache_version = 0  # bumped by invalidations; tables compiled across a bump aren't stored
+_cache_lock = threading.Lock()
+
+
+def invalidate_rate_cache(room_type: Optional[str] = None, property_code: Optional[str] = None) -> None:
+    global _cache_version
+    with _cache_lock:
+        _cache_version += 1
+        if room_type is None:
+            _cache.clear()
+        else:
+            _cache.pop((property_code or settings.DEFAULT_PROPERTY_CODE, room_type), None)
+    # Cached availability answers carry prices
+    availability_cache.invalidate(room_type, property_code=property_code)
+
+
+def compile_rate_table(db: Session, room_type: str) -> RateTable:
+    overrides = (
+        db.query(RateOverride)
+        .filter(RateOverride.room_type == room_type)
+        .order_by(RateOverride.priority.asc(), RateOverride.id.asc())
+        .all()
+    )
+    weekday = [1.0] * 7
+    for w in db.query(WeekdayMultiplier).filter(WeekdayMultiplier.room_type == room_type).all():
+        if 0 <= w.weekday <= 6:
+            weekday[w.weekday] = w.multiplier
+    discounts = (
+        db.query(StayDiscount)
+        .filter(StayDiscount.room_type == room_type)
+        .order_by(StayDiscount.min_nights.desc())
+        .all()
+    )
+
+    return RateTable(
+        room_type=room_type,
+        overrides=tuple((o.start_date, o.end_date, o.price, o.multiplier) for o in overrides),
+        weekday=tuple(weekday),
+        stay_discounts=tuple((d.min_nights, d.discount_percent) for d in discounts),
+        compiled_at=time.monotonic(),
+    )
+
+
+def get_rate_table(db: Session, room_type: str) -> RateTable:
+    # TTL is a safety net for multi-worker deployments (invalidation is per process)
+    key = (property_of(db), room_type)
+    with _cache_lock:
+        table = _cache.get(key)
+        version = _cache_version
+    if table and time.monotonic() - table.compiled_at < settings.PRICING_CACHE_TTL_SECONDS:
+        return table
+
+    table = compile_rate_table(db, room_type)
+    with _cache_lock:
+        # A rate change committed while compiling: use this table once, don't keep it
+        if version == _cache_version:
+            _cache[key] = table
+    return table
+
+
+# -------------------------
+# Pricing
+# -------------------------
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def price_stay(db: Session, room: Room, check_in, check_out) -> StayQuote:
+    return _quote(get_rate_table(db, room.room_type), room, check_in, check_out)
+
+
+def _quote(table: RateTable, room: Room, check_in, check_out) -> StayQuote:
+    start = _as_date(check_in)
+    nights = (_as_date(check_out) - start).days
+
+    nightly = table.nightly_rates(room.price, start, nights)
+    subtotal = round(sum(nightly), 2)
+    discount = table.stay_discount(nights)
+    total = round(subtotal * (100 - discount) / 100, 2)
+
+    return StayQuote(nightly_rates=nightly, subtotal=subtotal, discount_percent=discount, total_price=total)
+
+
+def price_stays(db: Session, rooms: List[Room], check_in, check_out) -> List[Tuple[Room, StayQuote]]:
+    """
+    Prices the same stay for several rooms (e.g. a search result).
+    Each room type's table is looked up once.
+    """
+    tables: Dict[str, RateTable] = {}
+    results = []
+    for room in rooms:
+        if room.room_type not in tables:
+            tables[room.room_type] = get_rate_table(db, room.room_type)
+        results.append((room, _quote(tables[room.room_type], room, check_in, check_out)))
+    return results
+
+
+def price_calendar(db: Session, room: Room, start: date, end: date) -> List[Dict]:
+    """
+    Nightly rates for every day in [start, end] (inclusive), before stay discounts.
+    """
+    days = (end - start).days + 1
+    if days <= 0:
+        raise ValueError("end must be on or after start")
+    if days > MAX_CALENDAR_DAYS:
+        raise ValueError(f"Calendar range is limited to {MAX_CALENDAR_DAYS} days")
+
+    table = get_rate_table(db, room.room_type)
+    rates = table.nightly_rates(room.price, start, days)
+    return [{"date": start + timedelta(days=i), "price": price} for i, price in enumerate(rates)]
+
+
+# -------------------------
+# Rate plan management
+# -------------------------
+def get_rate_plan(db: Session, room_type: str) -> Dict:
+    overrides = (
+        db.query(RateOverride)
+        .filter(RateOverride.room_type == room_type)
+        .order_by(RateOverride.start_date.asc())
+        .all()
+    )
+    table = compile_rate_table(db, room_type)
+    return {
+        "room_type": room_type,
+        "overrides": overrides,
+        "weekday_multipliers": list(table.weekday),
+        "stay_discounts": [
+            {"min_nights": n, "discount_percent": p} for n, p in sorted(table.stay_discounts)
+        ],
+    }
+
+
+def create_rate_override(db: Session, data: RateOverrideCreate) -> RateOverride:
+    override = db.scalars(insert(RateOverride).values(**data.model_dump()).returning(RateOverride)).one()
+    db.commit()
+    invalidate_rate_cache(override.room_type, property_of(db))
+    return override
+
+
+def delete_rate_override(db: Session, override_id: int) -> None:
+    override = db.query(RateOverride).filter(RateOverride.id == override_id).first()
+    if not override:
+        raise LookupError("Rate override not found")
+
+    room_type = override.room_type
+    db.delete(override)
+    db.commit()
+    invalidate_rate_cache(room_type, property_of(db))
+
+
+def set_weekday_multipliers(db: Session, data: WeekdayMultipliersUpdate) -> List[float]:
+    if any(m <= 0 for m in data.multipliers):
+        raise ValueError("Multipliers must be greater than 0")
+
+    db.query(WeekdayMultiplier).filter(WeekdayMultiplier.room_type == data.room_type).delete()
+    for weekday, multiplier in enumerate(data.multipliers):
+        if multiplier != 1.0:
+            db.add(WeekdayMultiplier(room_type=data.room_type, weekday=weekday, multiplier=multiplier))
+    db.commit()
+    invalidate_rate_cache(data.room_type, property_of(db))
+    return list(data.multipliers)
+
+
+def set_stay_discounts(db: Session, data: StayDiscountsUpdate) -> List[Dict]:
+    min_nights = [d.min_nights for d in data.discounts]
+    if len(set(min_nights)) != len(min_nights):
+        raise ValueError("Duplicate min_nights in discounts")
+
+    db.query(StayDiscount).filter(StayDiscount.room_type == data.room_type).delete()
+    for d in data.discounts:
+        db.add(StayDiscount(room_type=data.room_type, min_nights=d.min_nights, discount_percent=d.discount_percent))
+    db.commit()
+    invalidate_rate_cache(data.room_type, property_of(db))
+    return [d.model_dump() for d in sorted(data.discounts, key=lambda d: d.min_nights)]
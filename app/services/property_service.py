@@ -0,0 +1,31 @@
+# app/services/property_service.py
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.db.partitions import property_database_url, property_router
+from app.models.property import Property
+from app.schemas.property import PropertyCreate
+
+
+def list_properties(db: Session, include_inactive: bool = False) -> List[Property]:
+    q = db.query(Property)
+    if not include_inactive:
+        q = q.filter(Property.is_active == True)  # noqa: E712
+    return q.order_by(Property.id.asc()).all()
+
+
+def create_property(db: Session, data: PropertyCreate) -> Property:
+    """
+    Registers a hotel and creates its own (empty) database.
+    """
+    if db.query(Property.id).filter(Property.code == data.code).first():
+        raise ValueError("Property code already exists")
+    property_database_url(data.code)  # raises when partitions aren't supported
+
+    prop = db.scalars(insert(Property).values(**data.model_dump()).returning(Property)).one()
+    db.commit()
+    property_router.forget(prop.code)  # it may have been looked up (and not found) before
+    property_router.database(prop.code)
+    return prop
@@ -0,0 +1,229 @@
+# app/services/rollup_service.py
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking, BookingArchive
+from app.models.room import Room
+from app.models.rollup import OccupancyRollup
+
+GROUP_BY_OPTIONS = ("room_type", "week", "month")
+MAX_REPORT_DAYS = 3 * 366
+REBUILD_BATCH_SIZE = 1000
+# Nights per upsert statement: ~6 bound parameters each, under SQLite's 999 limit
+UPSERT_BATCH_NIGHTS = 100
+
+
+def _nights(check_in: datetime, check_out: datetime) -> List[date]:
+    start = check_in.date()
+    return [start + timedelta(days=i) for i in range((check_out.date() - start).days)]
+
+
+def _nightly_revenue(booking: Booking) -> float:
+    # Revenue is spread evenly over the stay so cancel/rebuild always agree
+    return booking.total_price / booking.total_nights if booking.total_nights else 0.0
+
+
+def apply_booking_to_rollups(db: Session, booking: Booking, room_type: Optional[str] = None, sign: int = 1) -> None:
+    """
+    Adds (sign=1) or removes (sign=-1) one booking's nights in the rollups.
+    Runs inside the caller's transaction: one upsert statement per booking
+    (per UPSERT_BATCH_NIGHTS nights for longer stays).
+    Without room_type, it is read from rooms inside the same statement.
+    """
+    nights = _nights(booking.check_in, booking.check_out)
+    if not nights:
+        return
+
+    if room_type is None:
+        room_type = select(Room.room_type).where(Room.id == booking.room_id).scalar_subquery()
+
+    revenue = sign * _nightly_revenue(booking)
+    rows = [
+        {"day": day, "room_id": booking.room_id, "room_type": room_type, "rooms_sold": sign, "revenue": revenue}
+        for day in nights
+    ]
+
+    for i in range(0, len(rows), UPSERT_BATCH_NIGHTS):
+        stmt = insert(OccupancyRollup).values(rows[i : i + UPSERT_BATCH_NIGHTS])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OccupancyRollup.day, OccupancyRollup.room_id],
+            set_={
+                "rooms_sold": OccupancyRollup.rooms_sold + stmt.excluded.rooms_sold,
+                "revenue": OccupancyRollup.revenue + stmt.excluded.revenue,
+            },
+        )
+        db.execute(stmt)
+
+
+def _expected_rollups(db: Session) -> Dict[Tuple[date, int], List]:
+    """
+    Recomputes rollups from the raw bookings (live and archived):
+    {(day, room_id): [room_type, sold, revenue]}
+    """
+    expected: Dict[Tuple[date, int], List] = defaultdict(lambda: ["", 0, 0.0])
+
+    for model in (Booking, BookingArchive):
+        rows = (
+            db.query(model, Room.room_type)
+            .outerjoin(Room, Room.id == model.room_id)
+            .filter(model.status == "confirmed")
+            .yield_per(REBUILD_BATCH_SIZE)
+        )
+        for booking, room_type in rows:
+            revenue = _nightly_revenue(booking)
+            for day in _nights(booking.check_in, booking.check_out):
+                entry = expected[(day, booking.room_id)]
+                entry[0] = room_type or "Unknown"
+                entry[1] += 1
+                entry[2] += revenue
+    return expected
+
+
+def _begin(db: Session, mode: str = "DEFERRED") -> None:
+    # pysqlite only BEGINs at the first write, so every SELECT before it would
+    # see its own snapshot; start the transaction explicitly instead
+    if db.get_bind().dialect.name == "sqlite":
+        db.connection().exec_driver_sql(f"BEGIN {mode}")
+
+
+def rebuild_rollups(db: Session) -> Dict:
+    """
+    Recomputes the whole rollup table. Takes the write lock before reading
+    bookings, so no booking can commit between the snapshot and the rewrite
+    (writers wait for it). Call it on a fresh session.
+    """
+    _begin(db, "IMMEDIATE")
+    expected = _expected_rollups(db)
+
+    db.query(OccupancyRollup).delete()
+    items = list(expected.items())
+    for i in range(0, len(items), REBUILD_BATCH_SIZE):
+        chunk = items[i : i + REBUILD_BATCH_SIZE]
+        db.execute(
+            insert(OccupancyRollup),
+            [
+                {"day": day, "room_id": room_id, "room_type": rt, "rooms_sold": sold, "revenue": revenue}
+                for (day, room_id), (rt, sold, revenue) in chunk
+            ],
+        )
+    db.commit()
+    return {"rows_written": len(items)}
+
+
+def check_rollups(db: Session, tolerance: float = 0.01) -> List[Dict]:
+    """
+    Compares the rollup table to the raw bookings and returns every mismatch.
+    An empty list means the rollups are consistent. Reads everything in one
+    read transaction (one snapshot), so it can run on the read pool while
+    bookings are written. Call it on a fresh session.
+    """
+    _begin(db)
+    try:
+        expected = _expected_rollups(db)
+        actual = {(r.day, r.room_id): r for r in db.query(OccupancyRollup).all()}
+    finally:
+        db.rollback()  # ends the read transaction
+
+    mismatches: List[Dict] = []
+    for key in sorted(set(expected) | set(actual)):
+        exp_sold, exp_revenue = (expected[key][1], expected[key][2]) if key in expected else (0, 0.0)
+        row = actual.get(key)
+        act_sold, act_revenue = (row.rooms_sold, row.revenue) if row else (0, 0.0)
+
+        if exp_sold != act_sold or abs(exp_revenue - act_revenue) > tolerance:
+            mismatches.append(
+                {
+                    "day": key[0],
+                    "room_id": key[1],
+                    "expected_rooms_sold": exp_sold,
+                    "actual_rooms_sold": act_sold,
+                    "expected_revenue": round(exp_revenue, 2),
+                    "actual_revenue": round(act_revenue, 2),
+                }
+            )
+    return mismatches
+
+
+def _bucket_key(day: date, group_by: str) -> str:
+    if group_by == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    return f"{day.year}-{day.month:02d}"
+
+
+def _report_row(key: str, sold: int, available: int, revenue: float) -> Dict:
+    return {
+        "key": key,
+        "room_nights_sold": sold,
+        "room_nights_available": available,
+        "occupancy_rate": round(sold / available, 4) if available else 0.0,
+        "revenue": round(revenue, 2),
+        "average_daily_rate": round(revenue / sold, 2) if sold else 0.0,
+    }
+
+
+def occupancy_report(db: Session, date_from: date, date_to: date, group_by: str) -> List[Dict]:
+    """
+    Occupancy and revenue of the active rooms for nights in [date_from, date_to]
+    (inclusive), read only from the rollup table.
+    """
+    if group_by not in GROUP_BY_OPTIONS:
+        raise ValueError(f"group_by must be one of: {', '.join(GROUP_BY_OPTIONS)}")
+    days = (date_to - date_from).days + 1
+    if days <= 0:
+        raise ValueError("'to' must be on or after 'from'")
+    if days > MAX_REPORT_DAYS:
+        raise ValueError(f"Report range is limited to {MAX_REPORT_DAYS} days")
+
+    capacity_by_type: Dict[str, int] = defaultdict(int)
+    for room_type, total_rooms in db.query(Room.room_type, Room.total_rooms).filter(Room.is_active == True):  # noqa: E712
+        capacity_by_type[room_type] += total_rooms
+
+    # Same rooms on both sides of the ratio: inactive rooms add neither capacity nor nights sold
+    active_rooms = select(Room.id).where(Room.is_active == True)  # noqa: E712
+    in_range = (
+        OccupancyRollup.day >= date_from,
+        OccupancyRollup.day <= date_to,
+        OccupancyRollup.room_id.in_(active_rooms),
+    )
+
+    if group_by == "room_type":
+        rows = (
+            db.query(OccupancyRollup.room_type, func.sum(OccupancyRollup.rooms_sold), func.sum(OccupancyRollup.revenue))
+            .filter(*in_range)
+            .group_by(OccupancyRollup.room_type)
+            .all()
+        )
+        totals = {rt: (sold or 0, revenue or 0.0) for rt, sold, revenue in rows}
+        keys = sorted(set(capacity_by_type) | set(totals))
+        results = []
+        for rt in keys:
+            sold, revenue = totals.get(rt, (0, 0.0))
+            results.append(_report_row(rt, sold, capacity_by_type.get(rt, 0) * days, revenue))
+        return results
+
+    # week / month: one row per day from the rollups, bucketed here
+    daily = (
+        db.query(OccupancyRollup.day, func.sum(OccupancyRollup.rooms_sold), func.sum(OccupancyRollup.revenue))
+        .filter(*in_range)
+        .group_by(OccupancyRollup.day)
+        .all()
+    )
+    per_day = {day: (sold or 0, revenue or 0.0) for day, sold, revenue in daily}
+    daily_capacity = sum(capacity_by_type.values())
+
+    buckets: Dict[str, List] = {}
+    for i in range(days):
+        day = date_from + timedelta(days=i)
+        sold, revenue = per_day.get(day, (0, 0.0))
+        bucket = buckets.setdefault(_bucket_key(day, group_by), [0, 0, 0.0])
+        bucket[0] += sold
+        bucket[1] += daily_capacity
+        bucket[2] += revenue
+
+    return [_report_row(key, sold, available, revenue) for key, (sold, available, revenue) in buckets.items()]
@@ -0,0 +1,153 @@
+# app/services/room_search_service.py
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.room import Room
+
+logger = logging.getLogger("luxora.room_search")
+
+MAX_SEARCH_TERMS = 8
+
+# Column weights for ranking: a hit in the name counts most, then amenities
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+AMENITIES_WEIGHT = 5.0
+
+# External-content FTS5 index over rooms, kept in sync by triggers, so every
+# write path (room_service, sample data, raw SQL) updates it in the same transaction
+_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS rooms_fts USING fts5(
+        name, description, amenities,
+        content='rooms', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS rooms_fts_ai AFTER INSERT ON rooms BEGIN
+        INSERT INTO rooms_fts(rowid, name, description, amenities)
+        VALUES (new.id, new.name, new.description, new.amenities);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS rooms_fts_ad AFTER DELETE ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, description, amenities)
+        VALUES ('delete', old.id, old.name, old.description, old.amenities);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS rooms_fts_au AFTER UPDATE OF name, description, amenities ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, description, amenities)
+        VALUES ('delete', old.id, old.name, old.description, old.amenities);
+        INSERT INTO rooms_fts(rowid, name, description, amenities)
+        VALUES (new.id, new.name, new.description, new.amenities);
+    END
+    """,
+]
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+# None until ensure_room_search_index() ran in this process
+_fts_ready: Optional[bool] = None
+
+rooms_fts = table("rooms_fts", column("rowid"))
+
+
+def ensure_room_search_index(engine: Engine) -> bool:
+    """
+    Creates the FTS5 table and triggers (fills the index the first time).
+    Returns False when the database can't do FTS5; search then scans in Python.
+    """
+    global _fts_ready
+    if engine.dialect.name != "sqlite":
+        _fts_ready = False
+        return False
+
+    try:
+        with engine.begin() as conn:
+            existed = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'rooms_fts'")).first()
+            for ddl in _FTS_DDL:
+                conn.exec_driver_sql(ddl)
+            if not existed:
+                conn.exec_driver_sql("INSERT INTO rooms_fts(rooms_fts) VALUES ('rebuild')")
+    except OperationalError:
+        logger.warning("SQLite FTS5 is not available; room search falls back to a full scan")
+        _fts_ready = False
+        return False
+
+    _fts_ready = True
+    return True
+
+
+def search_terms(q: str) -> List[str]:
+    terms = _TERM.findall((q or "").lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise ValueError("Search text must contain letters or digits")
+    return terms
+
+
+def build_match_query(terms: List[str]) -> str:
+    """
+    "ocean view jacu" -> '"ocean" "view" "jacu"*' (all terms, last one as a prefix
+    for type-ahead). Terms are quoted, so user input can't inject FTS syntax.
+    """
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search_rooms(db: Session, q: str, limit: int = 20) -> List[Dict]:
+    """
+    Active rooms matching every term, best first: [{"room": Room, "score": float}].
+    """
+    terms = search_terms(q)
+    if _fts_ready:
+        hits = search_rooms_fts(db, terms, limit)
+    else:
+        hits = search_rooms_scan(db, terms, limit)
+    return [{"room": room, "score": score} for room, score in hits]
+
+
+def search_rooms_fts(db: Session, terms: List[str], limit: int) -> List[Tuple[Room, float]]:
+    fts = literal_column("rooms_fts")
+    # bm25() is lower-is-better; negate it so higher scores are better
+    rank = func.bm25(fts, NAME_WEIGHT, DESCRIPTION_WEIGHT, AMENITIES_WEIGHT)
+    rows = db.execute(
+        select(Room, rank)
+        .join(rooms_fts, rooms_fts.c.rowid == Room.id)
+        .where(fts.match(build_match_query(terms)), Room.is_active == True)  # noqa: E712
+        .order_by(rank)
+        .limit(limit)
+    ).all()
+    return [(room, round(-score, 4)) for room, score in rows]
+
+
+def search_rooms_scan(db: Session, terms: List[str], limit: int) -> List[Tuple[Room, float]]:
+    """
+    Fallback without FTS5: loads every active room and matches in Python
+    (also the baseline in benchmarks/bench_room_search.py).
+    """
+    *whole, prefix = terms
+    weighted = ((NAME_WEIGHT, "name"), (DESCRIPTION_WEIGHT, "description"), (AMENITIES_WEIGHT, "amenities"))
+
+    hits = []
+    for room in db.query(Room).filter(Room.is_active == True).all():  # noqa: E712
+        tokens = {name: _TERM.findall((getattr(room, name) or "").lower()) for _, name in weighted}
+        score = 0.0
+        for weight, name in weighted:
+            field_tokens = tokens[name]
+            score += weight * sum(field_tokens.count(t) for t in whole)
+            score += weight * sum(1 for tok in field_tokens if tok.startswith(prefix))
+
+        all_tokens = [tok for field_tokens in tokens.values() for tok in field_tokens]
+        if all(t in all_tokens for t in whole) and any(tok.startswith(prefix) for tok in all_tokens):
+            hits.append((room, score))
+
+    hits.sort(key=lambda hit: hit[1], reverse=True)
+    return hits[:limit]
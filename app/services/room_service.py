@@ -1,10 +1,21 @@
 # app/services/room_service.py
-from typing import List, Optional
-
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
+from app.core.compression import available_encodings, compress
+from app.core.config import settings
+from app.db.session import property_of
 from app.models.room import Room
-from app.schemas.room import RoomCreate, RoomUpdate
+from app.schemas.room import RoomCreate, RoomPublic, RoomUpdate
+from app.services.availability_cache import availability_cache
+from app.services.unit_service import repack_room
 
 
 def amenities_list_to_string(amenities: List[str]) -> str:
@@ -24,42 +35,56 @@ def get_room_by_id(db: Session, room_id: int) -> Optional[Room]:
 
 
 def create_room(db: Session, data: RoomCreate) -> Room:
-    room = Room(
-        name=data.name,
-        description=data.description,
-        price=data.price,
-        room_type=data.room_type,
-        image_url=data.image_url,
-        max_guests=data.max_guests,
-        amenities=amenities_list_to_string(data.amenities),
-        total_rooms=data.total_rooms,
-        is_active=data.is_active,
-    )
-    db.add(room)
+    room = db.scalars(
+        insert(Room)
+        .values(
+            name=data.name,
+            description=data.description,
+            price=data.price,
+            room_type=data.room_type,
+            image_url=data.image_url,
+            max_guests=data.max_guests,
+            amenities=amenities_list_to_string(data.amenities),
+            total_rooms=data.total_rooms,
+            is_active=data.is_active,
+        )
+        .returning(Room)
+    ).one()
     db.commit()
-    db.refresh(room)
+    invalidate_room_catalog()
     return room
 
 
-def update_room(db: Session, room: Room, data: RoomUpdate) -> Room:
+def _update_room_returning(db: Session, room_id: int, values: dict) -> Optional[Room]:
+    # Single UPDATE ... RETURNING: no pre-read and no refresh after commit
+    room = db.scalars(
+        update(Room)
+        .where(Room.id == room_id)
+        .values(**values)
+        .returning(Room)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if room and "total_rooms" in values:
+        # Units above a lowered count no longer exist; a raised count gives room to repack
+        repack_room(db, room)
+    db.commit()
+    invalidate_room_catalog()
+    return room
+
+
+def update_room(db: Session, room_id: int, data: RoomUpdate) -> Optional[Room]:
     payload = data.model_dump(exclude_unset=True)
 
     if "amenities" in payload and payload["amenities"] is not None:
         payload["amenities"] = amenities_list_to_string(payload["amenities"])
 
-    for key, value in payload.items():
-        setattr(room, key, value)
+    if not payload:
+        return get_room_by_id(db, room_id)
+    return _update_room_returning(db, room_id, payload)
 
-    db.commit()
-    db.refresh(room)
-    return room
 
-
-def deactivate_room(db: Session, room: Room) -> Room:
-    room.is_active = False
-    db.commit()
-    db.refresh(room)
-    return room
+def deactivate_room(db: Session, room_id: int) -> Optional[Room]:
+    return _update_room_returning(db, room_id, {"is_active": False})
 
 
 def init_sample_rooms(db: Session) -> dict:
@@ -117,8 +142,88 @@ def init_sample_rooms(db: Session) -> dict:
         created_names.append(room.name)
 
     db.commit()
+    invalidate_room_catalog()
     return {
         "message": "Sample room data created successfully",
         "rooms_created": created_names,
         "total_rooms": len(created_names),
     }
+
+
+# -------------------------
+# Precompressed room catalog
+# -------------------------
+@dataclass(frozen=True)
+class RoomCatalog:
+    """
+    GET /rooms/ payload, serialized once and compressed once per encoding.
+    """
+
+    version: int
+    etag: str
+    body: bytes
+    encoded: Dict[str, bytes]
+    built_at: float
+
+
+_rooms_adapter = TypeAdapter(List[RoomPublic])
+# (property, include_inactive) -> catalog
+_catalog: Dict[Tuple[str, bool], RoomCatalog] = {}
+_catalog_version = 0
+_catalog_lock = threading.Lock()
+
+
+def invalidate_room_catalog() -> None:
+    global _catalog_version
+    with _catalog_lock:
+        _catalog_version += 1
+        _catalog.clear()
+    # Price / inventory / room type changes affect every availability answer
+    availability_cache.invalidate()
+
+
+def build_room_catalog(db: Session, include_inactive: bool, version: int) -> RoomCatalog:
+    rooms = _rooms_adapter.validate_python(list_rooms(db, include_inactive=include_inactive), from_attributes=True)
+    body = _rooms_adapter.dump_json(rooms)
+    return RoomCatalog(
+        version=version,
+        # Content hash, so every worker hands out the same ETag for the same catalog
+        etag='"' + hashlib.sha1(body).hexdigest()[:20] + '"',
+        body=body,
+        encoded={encoding: compress(body, encoding) for encoding in available_encodings()},
+        built_at=time.monotonic(),
+    )
+
+
+def get_room_catalog(db: Session, include_inactive: bool = False) -> RoomCatalog:
+    # TTL is a safety net for multi-worker deployments (invalidation is per process)
+    key = (property_of(db), include_inactive)
+    with _catalog_lock:
+        catalog = _catalog.get(key)
+        version = _catalog_version
+    if (
+        catalog
+        and catalog.version == version
+        and time.monotonic() - catalog.built_at < settings.ROOM_CATALOG_TTL_SECONDS
+    ):
+        return catalog
+
+    catalog = build_room_catalog(db, include_inactive, version)
+    with _catalog_lock:
+        # Don't cache a build that raced with a room change
+        if catalog.version == _catalog_version:
+            _catalog[key] = catalog
+    return catalog
+
+
+def room_catalog_response(catalog: RoomCatalog, encoding: Optional[str]) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Body and headers for one encoding (None = identity).
+    """
+    # Same URL, different hotel: caches must key on the property header too
+    headers = {"ETag": catalog.etag, "Vary": f"Accept-Encoding, {settings.PROPERTY_HEADER}"}
+    if encoding is None or encoding not in catalog.encoded:
+        return catalog.body, headers
+    headers["Content-Encoding"] = encoding
+    headers["ETag"] = "W/" + catalog.etag
+    return catalog.encoded[encoding], headers
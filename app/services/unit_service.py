@@ -0,0 +1,241 @@
+# app/services/unit_service.py
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking
+from app.models.room import Room
+from app.utils.dates import local_now
+
+MAX_BOARD_DAYS = 366
+
+
+# -------------------------
+# Interval partitioning
+# -------------------------
+@dataclass(frozen=True)
+class Stay:
+    key: int  # booking id
+    start: datetime
+    end: datetime
+    unit: Optional[int] = None  # current unit (kept when the stay is pinned)
+
+
+@dataclass
+class UnitPlan:
+    assignments: Dict[int, int] = field(default_factory=dict)  # key -> unit
+    unassigned: List[int] = field(default_factory=list)  # keys that didn't fit
+    units_used: int = 0
+
+
+def partition_stays(stays: Iterable[Stay], units: int, pin_before: Optional[datetime] = None) -> UnitPlan:
+    """
+    Gives every stay a unit in 1..units so that no unit holds two overlapping
+    stays, in O(n log n): stays in start order, a heap of (end, unit) for
+    occupied units and a heap of free unit numbers (lowest first).
+
+    With pin_before (now), guests already in house keep their current unit:
+    those stays all overlap at pin_before, so they are placed first (pinned
+    ones, then the ones without a valid unit), and the sweep continues from
+    there. Stays that ended by pin_before are ignored. Greedy still needs no
+    more units than the busiest night has stays: whenever the count of
+    overlapping stays fits, every stay gets a unit.
+    """
+    plan = UnitPlan()
+    busy: List[Tuple[datetime, int]] = []
+    free: List[int] = list(range(1, units + 1))  # already a heap
+    in_use: Set[int] = set()
+
+    def place(stay: Stay, unit: int) -> None:
+        in_use.add(unit)
+        heapq.heappush(busy, (stay.end, unit))
+        plan.assignments[stay.key] = unit
+        plan.units_used = max(plan.units_used, unit)
+
+    def lowest_free() -> Optional[int]:
+        while free:
+            candidate = heapq.heappop(free)
+            # Lazy deletion: pinned stays take units without popping them
+            if candidate not in in_use:
+                return candidate
+        return None
+
+    upcoming = list(stays)
+    if pin_before is not None:
+        in_house = [s for s in upcoming if s.start < pin_before < s.end]
+        upcoming = [s for s in upcoming if s.start >= pin_before]
+
+        def pinned(stay: Stay) -> bool:
+            return stay.unit is not None and 1 <= stay.unit <= units
+
+        for stay in sorted(in_house, key=lambda s: (not pinned(s), s.start, s.end, s.key)):
+            unit = stay.unit if pinned(stay) and stay.unit not in in_use else lowest_free()
+            if unit is None:
+                plan.unassigned.append(stay.key)
+            else:
+                place(stay, unit)
+
+    for stay in sorted(upcoming, key=lambda s: (s.start, s.end, s.key)):
+        while busy and busy[0][0] <= stay.start:
+            _, unit = heapq.heappop(busy)
+            in_use.discard(unit)
+            heapq.heappush(free, unit)
+
+        unit = lowest_free()
+        if unit is None:
+            plan.unassigned.append(stay.key)
+        else:
+            place(stay, unit)
+    return plan
+
+
+# -------------------------
+# Assignment in the database
+# -------------------------
+def _overlapping(room_id: int, check_in: datetime, check_out: datetime):
+    return (
+        Booking.room_id == room_id,
+        Booking.status == "confirmed",
+        Booking.check_in < check_out,
+        Booking.check_out > check_in,
+    )
+
+
+def free_unit(
+    db: Session, room: Room, check_in: datetime, check_out: datetime, exclude_id: Optional[int] = None
+) -> Optional[int]:
+    """
+    Lowest unit free for the whole stay, or None when the units are too
+    fragmented (or some overlapping booking has no unit yet): repack then.
+    """
+    q = select(Booking.unit_number).where(*_overlapping(room.id, check_in, check_out))
+    if exclude_id is not None:
+        q = q.where(Booking.id != exclude_id)
+    taken = set(db.scalars(q))
+    if None in taken:
+        return None
+    for unit in range(1, room.total_rooms + 1):
+        if unit not in taken:
+            return unit
+    return None
+
+
+def repack_room(db: Session, room: Room, now: Optional[datetime] = None) -> Dict:
+    """
+    Re-runs the partitioning over every current and future confirmed stay of
+    the room (in-house guests keep their unit) and writes the units that
+    changed. Stages only; the caller commits.
+    """
+    now = now or local_now()
+    rows = db.execute(
+        select(Booking.id, Booking.booking_id, Booking.check_in, Booking.check_out, Booking.unit_number).where(
+            Booking.room_id == room.id, Booking.status == "confirmed", Booking.check_out > now
+        )
+    ).all()
+    plan = partition_stays((Stay(r.id, r.check_in, r.check_out, r.unit_number) for r in rows), room.total_rooms, now)
+
+    changes = [
+        {"id": r.id, "unit_number": plan.assignments.get(r.id)}
+        for r in rows
+        if plan.assignments.get(r.id) != r.unit_number
+    ]
+    if changes:
+        # Bulk UPDATE by primary key (one executemany)
+        db.execute(update(Booking).execution_options(synchronize_session=False), changes)
+
+    unassigned = set(plan.unassigned)
+    return {
+        "room_id": room.id,
+        "bookings": len(rows),
+        "moved": len(changes),
+        "units_used": plan.units_used,
+        "unassigned": [r.booking_id for r in rows if r.id in unassigned],
+        "assignments": plan.assignments,
+    }
+
+
+def fill_released_unit(db: Session, booking: Booking, now: Optional[datetime] = None) -> int:
+    """
+    Incremental step after a cancellation: the freed unit can only help
+    bookings without a unit that overlap the cancelled stay; everyone else
+    keeps their room. Returns how many got a unit.
+    """
+    now = now or local_now()
+    room = db.get(Room, booking.room_id)
+    waiting = db.execute(
+        select(Booking.id, Booking.check_in, Booking.check_out)
+        .where(*_overlapping(booking.room_id, booking.check_in, booking.check_out))
+        .where(Booking.unit_number.is_(None), Booking.check_out > now)
+        .order_by(Booking.check_in.asc())
+    ).all()
+    if not waiting or room is None:
+        return 0
+
+    for stay in waiting:
+        unit = free_unit(db, room, stay.check_in, stay.check_out, exclude_id=stay.id)
+        if unit is None:
+            # Several unplaced stays overlap (or units are fragmented): place them together
+            assignments = repack_room(db, room, now)["assignments"]
+            return sum(1 for w in waiting if w.id in assignments)
+        db.execute(
+            update(Booking)
+            .where(Booking.id == stay.id)
+            .values(unit_number=unit)
+            .execution_options(synchronize_session=False)
+        )
+    return len(waiting)
+
+
+# -------------------------
+# Front desk
+# -------------------------
+def reassign_units(db: Session, room_id: int) -> Dict:
+    room = db.get(Room, room_id)
+    if not room:
+        raise LookupError("Room not found")
+    result = repack_room(db, room)
+    db.commit()
+    return result
+
+
+def get_unit_board(db: Session, room_id: int, date_from: date, date_to: date) -> Dict:
+    """
+    Which confirmed stay occupies which unit between date_from and date_to (inclusive).
+    """
+    if date_to < date_from:
+        raise ValueError("'to' must be on or after 'from'")
+    if (date_to - date_from).days + 1 > MAX_BOARD_DAYS:
+        raise ValueError(f"Date range too large (max {MAX_BOARD_DAYS} days)")
+    room = db.get(Room, room_id)
+    if not room:
+        raise LookupError("Room not found")
+
+    start = datetime.combine(date_from, time.min)
+    end = datetime.combine(date_to + timedelta(days=1), time.min)
+    bookings = db.execute(
+        select(Booking.booking_id, Booking.name, Booking.check_in, Booking.check_out, Booking.unit_number)
+        .where(*_overlapping(room.id, start, end))
+        .order_by(Booking.check_in.asc())
+    ).all()
+
+    units: Dict[int, List[Dict]] = {unit: [] for unit in range(1, room.total_rooms + 1)}
+    unassigned = []
+    for b in bookings:
+        stay = {"booking_id": b.booking_id, "name": b.name, "check_in": b.check_in, "check_out": b.check_out}
+        if b.unit_number:
+            # setdefault: units above total_rooms (room shrank) until the next repack
+            units.setdefault(b.unit_number, []).append(stay)
+        else:
+            unassigned.append(stay)
+
+    return {
+        "room_id": room.id,
+        "room_type": room.room_type,
+        "total_units": room.total_rooms,
+        "units": [{"unit": unit, "stays": stays} for unit, stays in sorted(units.items())],
+        "unassigned": unassigned,
+    }
@@ -0,0 +1,240 @@
+# app/services/write_pipeline.py
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.partitions import property_router
+from app.db.session import SessionLocal
+
+logger = logging.getLogger("luxora.write_pipeline")
+
+_STOP = object()
+
+# (operation, args, future) - operation is called as operation(db, *args)
+WriteItem = Tuple[Callable[..., Any], tuple, Future]
+
+
+class PipelineUnavailable(RuntimeError):
+    """
+    The write was not performed: the writer didn't reach it in time, or it stopped.
+    """
+
+
+class BookingWritePipeline:
+    """
+    Single writer thread that group-commits booking mutations.
+
+    Callers submit an operation and wait on its Future. The writer collects
+    everything queued within a few milliseconds, runs each operation in order
+    inside its own SAVEPOINT (so availability checks see earlier items of the
+    same batch, and one failure doesn't sink the others), then commits the
+    whole batch with a single fsync.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        window_ms: Optional[float] = None,
+        max_batch: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.window = (settings.WRITE_PIPELINE_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_batch = max_batch or settings.WRITE_PIPELINE_MAX_BATCH
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._submit_lock = threading.Lock()
+
+        # Counters for monitoring
+        self.batches = 0
+        self.items = 0
+        self.failed_batches = 0
+        self.largest_batch = 0
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="booking-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        with self._submit_lock:
+            self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+        # Whatever was queued behind the stop is never written: fail it now
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item[2].set_running_or_notify_cancel():
+                item[2].set_exception(PipelineUnavailable("Booking writer stopped, nothing was saved"))
+
+    def submit(self, operation: Callable[..., Any], *args) -> Future:
+        fut: Future = Future()
+        with self._submit_lock:
+            if self._closed:
+                fut.set_exception(PipelineUnavailable("Booking writer stopped, nothing was saved"))
+            else:
+                self._queue.put((operation, args, fut))
+        return fut
+
+    def execute(self, operation: Callable[..., Any], *args, timeout: Optional[float] = None) -> Any:
+        """
+        Submits and waits for the result. An item the writer hasn't started
+        within the timeout is withdrawn (never written) and PipelineUnavailable
+        is raised; one already in a running batch is waited for, so the caller
+        always learns whether it was written.
+        """
+        fut = self.submit(operation, *args)
+        try:
+            return fut.result(timeout=settings.WRITE_PIPELINE_TIMEOUT_SECONDS if timeout is None else timeout)
+        except FutureTimeoutError:
+            if fut.cancel():
+                raise PipelineUnavailable("Booking writes are backed up, nothing was saved; please retry shortly")
+            # Its batch is running: the outcome is decided by that batch's commit
+            return fut.result()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch: List[WriteItem] = [item]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._process(batch)
+
+    def _process(self, batch: List[WriteItem]) -> None:
+        outcomes: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        db: Session = self.session_factory()
+        try:
+            # Take the write lock up front (pysqlite would otherwise BEGIN lazily,
+            # and releasing the first SAVEPOINT would commit on its own)
+            if db.get_bind().dialect.name == "sqlite":
+                db.connection().exec_driver_sql("BEGIN IMMEDIATE")
+
+            for operation, args, fut in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                savepoint = db.begin_nested()
+                try:
+                    result = operation(db, *args)
+                    savepoint.commit()
+                    outcomes.append((fut, result, None))
+                except Exception as e:
+                    savepoint.rollback()
+                    outcomes.append((fut, None, e))
+
+            db.commit()
+        except Exception as e:
+            # The group commit itself failed: nobody's write was persisted
+            db.rollback()
+            self.failed_batches += 1
+            logger.exception("Booking write batch of %d failed", len(batch))
+            outcomes = [(fut, None, e) for _, _, fut in batch if not fut.cancelled()]
+        finally:
+            db.close()
+
+        self.batches += 1
+        self.items += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        for fut, result, error in outcomes:
+            if error is not None:
+                fut.set_exception(error)
+            else:
+                fut.set_result(result)
+
+    def snapshot(self) -> Dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "failed_batches": self.failed_batches,
+            "largest_batch": self.largest_batch,
+            "avg_batch": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "queued": self._queue.qsize(),
+        }
+
+
+# One writer per property database; a busy hotel's queue never delays another's
+_pipelines: Dict[str, BookingWritePipeline] = {}
+_pipelines_lock = threading.Lock()
+
+
+def get_booking_pipeline(property_code: Optional[str] = None) -> Optional[BookingWritePipeline]:
+    """
+    The property's running pipeline (started on first use), or None when
+    booking writes go straight to the database.
+    """
+    code = property_code or settings.DEFAULT_PROPERTY_CODE
+    pipeline = _pipelines.get(code)
+    if pipeline is not None or not _pipelines:
+        # Nothing started means the pipeline is disabled (or shut down)
+        return pipeline
+
+    with _pipelines_lock:
+        pipeline = _pipelines.get(code)
+        if pipeline is None and _pipelines:
+            pipeline = BookingWritePipeline(session_factory=property_router.database(code).SessionLocal)
+            pipeline.start()
+            _pipelines[code] = pipeline
+    return pipeline
+
+
+def booking_pipelines() -> Dict[str, BookingWritePipeline]:
+    return dict(_pipelines)
+
+
+def start_booking_pipeline() -> Optional[BookingWritePipeline]:
+    """
+    Starts the default property's pipeline; the others start on their first write.
+    """
+    with _pipelines_lock:
+        if settings.WRITE_PIPELINE_ENABLED and settings.DEFAULT_PROPERTY_CODE not in _pipelines:
+            pipeline = BookingWritePipeline()
+            pipeline.start()
+            _pipelines[settings.DEFAULT_PROPERTY_CODE] = pipeline
+        return _pipelines.get(settings.DEFAULT_PROPERTY_CODE)
+
+
+def _drop_pipeline(property_code: str) -> None:
+    # The property's database was closed (deactivated); a later write starts a fresh pipeline
+    with _pipelines_lock:
+        pipeline = _pipelines.pop(property_code, None)
+    if pipeline is not None:
+        pipeline.stop()
+
+
+property_router.on_close(_drop_pipeline)
+
+
+def stop_booking_pipeline() -> None:
+    with _pipelines_lock:
+        pipelines = list(_pipelines.values())
+        _pipelines.clear()
+    for pipeline in pipelines:
+        pipeline.stop()
@@ -0,0 +1,18 @@
+# app/utils/contact.py
+import re
+
+_NON_DIGITS = re.compile(r"\D+")
+
+
+def normalize_email(email: str) -> str:
+    """
+    Lookup key for emails: trimmed and lower-cased.
+    """
+    return (email or "").strip().lower()
+
+
+def phone_digits(phone: str) -> str:
+    """
+    Lookup key for phone numbers: digits only ("+94 (77) 123-4567" -> "94771234567").
+    """
+    return _NON_DIGITS.sub("", phone or "")
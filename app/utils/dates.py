@@ -2,6 +2,14 @@
 from datetime import datetime
 
 
+def local_now() -> datetime:
+    """
+    Current local time, naive. Stay dates are naive local dates, so compare
+    them to this (not utcnow, which is for stored timestamps).
+    """
+    return datetime.now()
+
+
 def parse_date(date_str: str) -> datetime:
     """
     Accepts 'YYYY-MM-DD' or ISO datetime strings.
@@ -0,0 +1,95 @@
+# benchmarks/bench_group_commit.py
+"""
+Booking write throughput: one commit per request vs the group-commit pipeline.
+
+    python -m benchmarks.bench_group_commit [--threads 16] [--bookings 2000] [--synchronous FULL]
+        [--window-ms 5] [--max-batch 64] [--dir PATH]
+
+Group commit only pays off when a commit's fsync costs more than the
+batch's extra wait; --dir points the databases at the disk to measure.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--synchronous", default="FULL", help="FULL makes every commit pay for an fsync")
+    parser.add_argument("--window-ms", type=float, default=None, help="default: WRITE_PIPELINE_WINDOW_MS")
+    parser.add_argument("--max-batch", type=int, default=None, help="default: WRITE_PIPELINE_MAX_BATCH")
+    parser.add_argument("--dir", default=None, help="where to create the databases (default: system temp)")
+    args = parser.parse_args()
+
+    # Settings are read at import time
+    os.environ["SQLITE_SYNCHRONOUS"] = args.synchronous
+
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.base import Base
+    from app.db.init_db import Room  # registers every model
+    from app.db.session import build_engines
+    from app.schemas.booking import BookingCreate
+    from app.services.booking_service import create_booking, create_booking_staged
+    from app.services.write_pipeline import BookingWritePipeline
+
+    check_in = date.today() + timedelta(days=30)
+    payload = BookingCreate(
+        name="Bench Guest",
+        email="bench@example.com",
+        phone="0000000000",
+        room_type="Bench",
+        check_in=check_in.isoformat(),
+        check_out=(check_in + timedelta(days=2)).isoformat(),
+        guests=1,
+    )
+
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-", dir=args.dir)
+    try:
+        print(f"{args.bookings} bookings from {args.threads} threads, synchronous={args.synchronous}")
+        print(f"{'mode':<16}{'bookings/s':>12}{'batches':>10}{'avg batch':>11}")
+
+        for mode in ("direct", "group-commit"):
+            engine, _ = build_engines(f"sqlite:///{os.path.join(workdir, mode + '.db')}", "production")
+            Base.metadata.create_all(bind=engine)
+            Session = sessionmaker(bind=engine, autoflush=False)
+            with Session() as db:
+                db.add(Room(name="Bench", description="Benchmark room", price=100.0, room_type="Bench", image_url="http://x", total_rooms=10**9))
+                db.commit()
+
+            pipeline = None
+            if mode == "direct":
+                def write(_):
+                    with Session() as db:
+                        create_booking(db, payload)
+            else:
+                pipeline = BookingWritePipeline(session_factory=Session, window_ms=args.window_ms, max_batch=args.max_batch)
+                pipeline.start()
+
+                def write(_):
+                    pipeline.submit(create_booking_staged, payload).result()
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(args.threads) as pool:
+                list(pool.map(write, range(args.bookings)))
+            elapsed = time.perf_counter() - started
+
+            batches, avg = "-", "-"
+            if pipeline:
+                pipeline.stop()
+                stats = pipeline.snapshot()
+                batches, avg = stats["batches"], stats["avg_batch"]
+            print(f"{mode:<16}{args.bookings / elapsed:>12.0f}{batches:>10}{avg:>11}")
+            engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
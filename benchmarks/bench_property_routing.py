@@ -0,0 +1,156 @@
+# benchmarks/bench_property_routing.py
+"""
+Multi-property routing: what picking the property's database costs per
+request, and what separate files buy when one property is busy writing.
+
+    python -m benchmarks.bench_property_routing [--requests 20000] [--http-requests 2000] [--writes 300]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+
+def _per_call_us(fn, runs: int, rounds: int = 3) -> float:
+    # Best of a few rounds: the machine's noise is larger than what we measure
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(runs):
+            fn()
+        best = min(best, (time.perf_counter() - started) / runs * 1_000_000)
+    return best
+
+
+def _percentiles(samples: list) -> tuple:
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000, help="dependency-level iterations")
+    parser.add_argument("--http-requests", type=int, default=2_000)
+    parser.add_argument("--writes", type=int, default=300, help="writes timed on the quiet property")
+    parser.add_argument("--busy-hold-ms", type=float, default=20.0, help="how long each busy-property transaction holds the lock")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-")
+    # Settings are read at import time
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'main.db')}"
+    os.environ["PROPERTY_DATA_DIR"] = os.path.join(workdir, "properties")
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ["ADMISSION_ENABLED"] = "false"
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import insert, text
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.init_db import init_db
+    from app.db.partitions import get_property_code, property_database_url, property_router
+    from app.db.session import SessionLocal, build_engines
+    from app.main import app
+    from app.models.booking_change import BookingChange
+    from app.models.room import Room
+    from app.schemas.property import PropertyCreate
+    from app.services.property_service import create_property
+
+    try:
+        init_db()
+        with SessionLocal() as db:
+            for code in ("busy", "quiet"):
+                create_property(db, PropertyCreate(code=code, name=f"Bench {code}"))
+        for code in ("main", "busy", "quiet"):
+            with property_router.database(code).SessionLocal() as db:
+                db.execute(insert(Room).values(
+                    name="Bench", description="Benchmark room", price=100.0, room_type="Bench",
+                    image_url="http://x", total_rooms=10,
+                ))
+                db.commit()
+
+        # 1) Dependency level: resolve the property, open a session, one query
+        def direct():
+            with SessionLocal() as db:
+                db.execute(text("SELECT 1"))
+
+        def routed(code):
+            def run():
+                with property_router.database(get_property_code(None, code)).SessionLocal() as db:
+                    db.execute(text("SELECT 1"))
+            return run
+
+        print(f"Per request, {args.requests} iterations")
+        print(f"{'path':<36}{'us/request':>12}")
+        lookup = _per_call_us(lambda: property_router.database(get_property_code(None, "quiet")), args.requests)
+        print(f"{'resolve property only':<36}{lookup:>12.2f}")
+        base = _per_call_us(direct, args.requests)
+        print(f"{'SessionLocal + SELECT 1 (no routing)':<36}{base:>12.2f}")
+        for code in ("main", "quiet"):
+            routed_us = _per_call_us(routed(code), args.requests)
+            print(f"{'routed to ' + code:<36}{routed_us:>12.2f}  ({routed_us - base:+.2f})")
+
+        # 2) HTTP level: same endpoint, with and without the header
+        print(f"\nGET /api/rooms/1, {args.http_requests} requests (TestClient)")
+        print(f"{'request':<36}{'p50 ms':>9}{'p95 ms':>9}")
+        variants = (("no header (default property)", {}), ("X-Property: quiet", {"X-Property": "quiet"}))
+        samples = {label: [] for label, _ in variants}
+        with TestClient(app) as client:
+            # Interleaved, so drift over the run hits both alike
+            for _ in range(args.http_requests):
+                for label, headers in variants:
+                    started = time.perf_counter()
+                    assert client.get("/api/rooms/1", headers=headers).status_code == 200
+                    samples[label].append((time.perf_counter() - started) * 1000)
+        for label, _ in variants:
+            p50, p95 = _percentiles(samples[label])
+            print(f"{label:<36}{p50:>9.3f}{p95:>9.3f}")
+
+        # 3) Isolation: quiet-property writes while another property holds its write lock
+        print(f"\nQuiet-property write latency while 'busy' holds its write lock {args.busy_hold_ms:.0f} ms per transaction")
+        print(f"{'layout':<36}{'p50 ms':>9}{'p95 ms':>9}")
+        busy = property_router.database("busy")
+        # Both properties in one file: a second writer on the busy file (what
+        # a second worker would be), so they contend on SQLite's lock
+        shared_engine, _ = build_engines(property_database_url("busy"), "production")
+        layouts = (
+            ("shared file", sessionmaker(bind=shared_engine)),
+            ("one file per property", property_router.database("quiet").SessionLocal),
+        )
+        for layout, quiet_session in layouts:
+            stop = threading.Event()
+
+            def hammer():
+                while not stop.is_set():
+                    with busy.engine.connect() as conn:
+                        conn.exec_driver_sql("BEGIN IMMEDIATE")
+                        conn.execute(insert(BookingChange).values(event="bench", booking_id="BUSY", payload="{}"))
+                        time.sleep(args.busy_hold_ms / 1000)
+                        conn.exec_driver_sql("COMMIT")
+                    time.sleep(0.002)  # request handling between transactions
+
+            writer = threading.Thread(target=hammer, daemon=True)
+            writer.start()
+            time.sleep(0.05)
+            samples = []
+            for _ in range(args.writes):
+                started = time.perf_counter()
+                with quiet_session() as db:
+                    db.execute(insert(BookingChange).values(event="bench", booking_id="QUIET", payload="{}"))
+                    db.commit()
+                samples.append((time.perf_counter() - started) * 1000)
+            stop.set()
+            writer.join()
+            p50, p95 = _percentiles(samples)
+            print(f"{layout:<36}{p50:>9.3f}{p95:>9.3f}")
+
+        shared_engine.dispose()
+        property_router.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
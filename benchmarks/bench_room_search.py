@@ -0,0 +1,102 @@
+# benchmarks/bench_room_search.py
+"""
+Room text search: FTS5 index vs loading every room and matching in Python.
+
+    python -m benchmarks.bench_room_search [--rooms 100000] [--queries 50]
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.init_db import Room  # registers every model
+from app.db.session import build_engines
+from app.services.room_search_service import (
+    ensure_room_search_index,
+    search_rooms_fts,
+    search_rooms_scan,
+    search_terms,
+)
+
+WORDS = (
+    "ocean city garden mountain lake river pool spa jacuzzi balcony terrace fireplace kitchen "
+    "sofa desk bathtub rain shower king queen twin bunk loft attic courtyard quiet modern classic "
+    "rustic minimalist sunny spacious cozy bright panoramic private family accessible"
+).split()
+AMENITIES = "WiFi,AC,TV,Smart TV,Mini Bar,Mini Fridge,Coffee Machine,Safe,Jacuzzi,Butler Service,Ocean View,City View".split(",")
+QUERIES = ["ocean view jacuzzi", "quiet garden", "family pool", "rustic fireplace loft", "balc", "private spa"]
+
+
+def _room(i: int) -> dict:
+    return {
+        "name": f"{random.choice(WORDS).title()} {random.choice(WORDS).title()} Room {i}",
+        "description": " ".join(random.choices(WORDS, k=30)),
+        "price": 100.0,
+        "room_type": f"type{i}",
+        "image_url": "https://example.com/room.jpg",
+        "max_guests": 2,
+        "amenities": ", ".join(random.sample(AMENITIES, 5)),
+        "total_rooms": 5,
+        "is_active": True,
+    }
+
+
+def _timed(fn, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--scan-queries", type=int, default=5, help="the scan is slow; fewer runs")
+    args = parser.parse_args()
+
+    random.seed(7)
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-")
+    try:
+        engine, _ = build_engines(f"sqlite:///{os.path.join(workdir, 'bench.db')}", "production")
+        Base.metadata.create_all(bind=engine)
+        ensure_room_search_index(engine)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+        started = time.perf_counter()
+        with Session() as db:
+            for offset in range(0, args.rooms, 10_000):
+                db.execute(insert(Room), [_room(i) for i in range(offset, min(offset + 10_000, args.rooms))])
+            db.commit()
+        print(f"Inserted {args.rooms} rooms (FTS kept in sync by triggers) in {time.perf_counter() - started:.1f}s")
+
+        print(f"{'query':<24}{'fts p50 ms':>12}{'fts p95 ms':>12}{'scan p50 ms':>13}{'speedup':>9}{'hits':>6}")
+        with Session() as db:
+            for q in QUERIES:
+                terms = search_terms(q)
+                fts_hits = search_rooms_fts(db, terms, 20)
+                scan_hits = search_rooms_scan(db, terms, 20)
+                db.expunge_all()  # don't let the identity map flatter the scan
+
+                fts = sorted(_timed(lambda: search_rooms_fts(db, terms, 20), args.queries))
+                scan = sorted(_timed(lambda: (search_rooms_scan(db, terms, 20), db.expunge_all()), args.scan_queries))
+                fts_p50, fts_p95 = statistics.median(fts), fts[int(len(fts) * 0.95) - 1]
+                scan_p50 = statistics.median(scan)
+                hits = f"{len(fts_hits)}/{len(scan_hits)}"
+                print(f"{q:<24}{fts_p50:>12.2f}{fts_p95:>12.2f}{scan_p50:>13.1f}{scan_p50 / fts_p50:>8.0f}x{hits:>6}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/bench_sqlite_profile.py
+"""
+Read throughput under concurrent booking writes: default engine vs production profile.
+
+    python -m benchmarks.bench_sqlite_profile [--seconds 5] [--readers 8] [--bookings 20000]
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.init_db import Booking, Room  # registers every model
+from app.db.session import build_engines
+from app.services.booking_service import count_overlapping_confirmed
+
+START = datetime(2030, 1, 1)
+
+
+def _random_stay():
+    check_in = START + timedelta(days=random.randint(0, 365))
+    return check_in, check_in + timedelta(days=random.randint(1, 7))
+
+
+def _booking(i: int, room_id: int) -> Booking:
+    check_in, check_out = _random_stay()
+    nights = (check_out - check_in).days
+    return Booking(
+        booking_id=f"BENCH{i:09d}",
+        name="Bench Guest",
+        email="bench@example.com",
+        phone="0000000000",
+        room_id=room_id,
+        check_in=check_in,
+        check_out=check_out,
+        guests=1,
+        price_per_night=100.0,
+        total_nights=nights,
+        total_price=100.0 * nights,
+        status="confirmed",
+    )
+
+
+def seed(path: str, bookings: int) -> None:
+    write_engine, _ = build_engines(f"sqlite:///{path}", "default")
+    Base.metadata.create_all(bind=write_engine)
+    with sessionmaker(bind=write_engine)() as db:
+        for i in range(3):
+            db.add(Room(name=f"Room {i}", description="Benchmark room", price=100.0, room_type=f"T{i}", image_url="http://x", total_rooms=50))
+        db.commit()
+        db.add_all(_booking(i, random.randint(1, 3)) for i in range(bookings))
+        db.commit()
+    write_engine.dispose()
+
+
+def run(path: str, profile: str, seconds: float, readers: int) -> dict:
+    write_engine, read_engine = build_engines(f"sqlite:///{path}", profile)
+    WriteSession = sessionmaker(bind=write_engine)
+    ReadSession = sessionmaker(bind=read_engine)
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+    lock = threading.Lock()
+
+    def reader():
+        n = errors = 0
+        while not stop.is_set():
+            try:
+                with ReadSession() as db:
+                    check_in, check_out = _random_stay()
+                    count_overlapping_confirmed(db, random.randint(1, 3), check_in, check_out)
+                n += 1
+            except Exception:
+                errors += 1
+        with lock:
+            counts["reads"] += n
+            counts["read_errors"] += errors
+
+    def writer():
+        i = 10_000_000
+        while not stop.is_set():
+            try:
+                with WriteSession() as db:
+                    db.add(_booking(i, random.randint(1, 3)))
+                    db.commit()
+                counts["writes"] += 1
+            except Exception:
+                counts["write_errors"] += 1
+            i += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    write_engine.dispose()
+    read_engine.dispose()
+    return {k: v / seconds if not k.endswith("errors") else v for k, v in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--bookings", type=int, default=20_000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-")
+    try:
+        template = os.path.join(workdir, "template.db")
+        seed(template, args.bookings)
+
+        print(f"{args.readers} readers + 1 writer, {args.bookings} seeded bookings, {args.seconds}s per profile")
+        print(f"{'profile':<12}{'reads/s':>12}{'writes/s':>12}{'read errs':>12}{'write errs':>12}")
+        for profile in ("default", "production"):
+            path = os.path.join(workdir, f"{profile}.db")
+            shutil.copy(template, path)
+            r = run(path, profile, args.seconds, args.readers)
+            print(f"{profile:<12}{r['reads']:>12.0f}{r['writes']:>12.0f}{r['read_errors']:>12}{r['write_errors']:>12}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
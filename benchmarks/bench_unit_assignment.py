@@ -0,0 +1,181 @@
+# benchmarks/bench_unit_assignment.py
+"""
+Room-unit assignment over a full season.
+
+1) partition_stays() on up to 100k stays of one room type: time per stay
+   (n log n) and units used vs the busiest night (the optimum).
+2) Front desk style first-fit in booking order, same stays and units:
+   how many stays find no unit although the count says they fit.
+3) In SQLite: repack 100k bookings over 50 room types, then the
+   incremental paths (unit for a new booking, fill after a cancellation).
+
+    python -m benchmarks.bench_unit_assignment [--bookings 100000] [--season-days 180] [--baseline-bookings 10000]
+"""
+import argparse
+import bisect
+import os
+import random
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.init_db import Booking, Room  # registers every model
+from app.db.session import build_engines
+from app.services.unit_service import Stay, fill_released_unit, free_unit, partition_stays, repack_room
+
+SEASON_START = datetime(2030, 1, 1)
+
+
+def _stays(n: int, season_days: int, first_key: int = 1) -> list:
+    stays = []
+    for key in range(first_key, first_key + n):
+        nights = random.choice((1, 1, 2, 2, 3, 3, 4, 5, 7, 7, 10, 14))
+        start = SEASON_START + timedelta(days=random.randrange(season_days - nights))
+        stays.append(Stay(key, start, start + timedelta(days=nights)))
+    return stays
+
+
+def _busiest_night(stays: list) -> int:
+    events = sorted([(s.start, 1) for s in stays] + [(s.end, -1) for s in stays])  # ends sort first
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def _check_no_overlap(stays: list, assignments: dict) -> None:
+    per_unit = defaultdict(list)
+    for s in stays:
+        per_unit[assignments[s.key]].append((s.start, s.end))
+    for intervals in per_unit.values():
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert end <= start, "two stays share a unit"
+
+
+def _first_fit_in_booking_order(stays: list, units: int) -> int:
+    """
+    Each booking takes the lowest unit free for its whole stay, in the order
+    bookings arrive (never moving anyone). Returns stays left without a unit.
+    """
+    starts = [[] for _ in range(units)]
+    ends = [[] for _ in range(units)]
+    unplaced = 0
+    for s in stays:
+        for u in range(units):
+            i = bisect.bisect_left(starts[u], s.start)
+            if (i == 0 or ends[u][i - 1] <= s.start) and (i == len(starts[u]) or starts[u][i] >= s.end):
+                starts[u].insert(i, s.start)
+                ends[u].insert(i, s.end)
+                break
+        else:
+            unplaced += 1
+    return unplaced
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--season-days", type=int, default=180)
+    parser.add_argument("--baseline-bookings", type=int, default=10_000, help="first-fit is O(n * units); keep it smaller")
+    parser.add_argument("--room-types", type=int, default=50)
+    parser.add_argument("--incremental", type=int, default=1000, help="timed new-booking / cancellation lookups")
+    args = parser.parse_args()
+    random.seed(11)
+
+    # 1) Interval partitioning scaling
+    print(f"partition_stays, one room type, {args.season_days}-day season")
+    print(f"{'stays':>8}{'ms':>10}{'us/stay':>9}{'units used':>12}{'busiest night':>15}")
+    sizes = sorted({max(args.bookings // 8, 1), max(args.bookings // 4, 1), max(args.bookings // 2, 1), args.bookings})
+    for n in sizes:
+        stays = _stays(n, args.season_days)
+        peak = _busiest_night(stays)
+        started = time.perf_counter()
+        plan = partition_stays(stays, peak)
+        elapsed = time.perf_counter() - started
+        assert not plan.unassigned and plan.units_used == peak
+        _check_no_overlap(stays, plan.assignments)
+        print(f"{n:>8}{elapsed * 1000:>10.1f}{elapsed / n * 1e6:>9.2f}{plan.units_used:>12}{peak:>15}")
+
+    # 2) Why not assign as bookings arrive
+    stays = _stays(args.baseline_bookings, args.season_days)
+    peak = _busiest_night(stays)
+    started = time.perf_counter()
+    unplaced = _first_fit_in_booking_order(stays, peak)
+    elapsed = time.perf_counter() - started
+    print(f"\n{args.baseline_bookings} stays, {peak} units (= busiest night)")
+    print(f"{'strategy':<34}{'no unit':>9}{'ms':>10}")
+    print(f"{'first-fit in booking order':<34}{unplaced:>9}{elapsed * 1000:>10.1f}")
+    started = time.perf_counter()
+    plan = partition_stays(stays, peak)
+    print(f"{'interval partitioning':<34}{len(plan.unassigned):>9}{(time.perf_counter() - started) * 1000:>10.1f}")
+
+    # 3) Database: full repack, then the incremental paths
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-")
+    try:
+        engine, _ = build_engines(f"sqlite:///{os.path.join(workdir, 'bench.db')}", "production")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+        per_type = args.bookings // args.room_types
+        with Session() as db:
+            rooms = []
+            for t in range(args.room_types):
+                stays = _stays(per_type, args.season_days, first_key=t * per_type + 1)
+                rooms.append(db.scalars(insert(Room).values(
+                    name=f"Type {t}", description="Benchmark room", price=100.0, room_type=f"type{t}",
+                    image_url="http://x", total_rooms=_busiest_night(stays),
+                ).returning(Room)).one())
+                db.execute(insert(Booking), [
+                    {
+                        "booking_id": f"B{s.key}", "name": "Bench", "email": "b@x.com", "phone": "000000",
+                        "room_id": rooms[-1].id, "check_in": s.start, "check_out": s.end, "guests": 1,
+                        "price_per_night": 100.0, "total_nights": (s.end - s.start).days,
+                        "total_price": 100.0, "status": "confirmed",
+                    }
+                    for s in stays
+                ])
+            db.commit()
+
+            now = SEASON_START - timedelta(days=1)
+            started = time.perf_counter()
+            repacked = 0
+            for room in rooms:
+                result = repack_room(db, room, now)
+                assert not result["unassigned"]
+                repacked += result["bookings"]
+            db.commit()
+            elapsed = time.perf_counter() - started
+            print(f"\nSQLite, {per_type * args.room_types} bookings over {args.room_types} room types")
+            print(f"{'operation':<44}{'total ms':>10}{'per op':>12}")
+            print(f"{'repack every room (load, plan, write)':<44}{elapsed * 1000:>10.1f}{elapsed / repacked * 1e6:>9.2f} us")
+
+            # New booking: the lowest unit free for a random stay (None = would repack)
+            samples = _stays(args.incremental, args.season_days)
+            started = time.perf_counter()
+            found = sum(free_unit(db, random.choice(rooms), s.start, s.end) is not None for s in samples)
+            elapsed = time.perf_counter() - started
+            print(f"{'free_unit() for a new stay':<44}{elapsed * 1000:>10.1f}{elapsed / len(samples) * 1e3:>9.3f} ms")
+            print(f"  ({found}/{len(samples)} found a unit; the rest are full for those dates)")
+
+            # Cancellation: nothing is waiting for a unit, so only the lookup runs
+            victims = db.scalars(select(Booking).order_by(Booking.id).limit(args.incremental)).all()
+            started = time.perf_counter()
+            for booking in victims:
+                fill_released_unit(db, booking, now)
+            elapsed = time.perf_counter() - started
+            print(f"{'fill_released_unit() after a cancellation':<44}{elapsed * 1000:>10.1f}{elapsed / len(victims) * 1e3:>9.3f} ms")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
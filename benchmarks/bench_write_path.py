@@ -0,0 +1,169 @@
+# benchmarks/bench_write_path.py
+"""
+Statements and latency per write: commit()+refresh() (previous code) vs UPDATE/INSERT ... RETURNING.
+Both cancel variants do the same side work (rollups, unit refill, change feed),
+so only the read-modify-write pattern differs.
+
+    python -m benchmarks.bench_write_path [--ops 2000]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.init_db import Booking, Room  # registers every model
+from app.db.session import build_engines
+from app.schemas.room import RoomCreate, RoomUpdate
+from app.services.availability_cache import invalidate_after_commit
+from app.services.booking_service import booking_to_public, cancel_booking
+from app.services.change_feed import record_booking_change
+from app.services.rollup_service import apply_booking_to_rollups, rebuild_rollups
+from app.services.room_service import amenities_list_to_string, create_room, update_room
+from app.services.unit_service import fill_released_unit
+
+ROOM = RoomCreate(name="Bench Room", description="Benchmark room description", price=100.0, room_type="Bench", image_url="http://x")
+
+
+# Previous implementations, kept here only for comparison
+def legacy_create_room(db, data):
+    room = Room(
+        name=data.name,
+        description=data.description,
+        price=data.price,
+        room_type=data.room_type,
+        image_url=data.image_url,
+        max_guests=data.max_guests,
+        amenities=amenities_list_to_string(data.amenities),
+        total_rooms=data.total_rooms,
+        is_active=data.is_active,
+    )
+    db.add(room)
+    db.commit()
+    db.refresh(room)
+    return room
+
+
+def legacy_update_room(db, room_id, data):
+    room = db.query(Room).filter(Room.id == room_id).first()
+    for key, value in data.model_dump(exclude_unset=True).items():
+        setattr(room, key, value)
+    db.commit()
+    db.refresh(room)
+    return room
+
+
+def legacy_cancel_booking(db, booking_id):
+    booking = db.query(Booking).filter(Booking.booking_id == booking_id).first()
+    if booking.status == "confirmed":
+        room_type = booking.room.room_type
+        apply_booking_to_rollups(db, booking, room_type, sign=-1)
+        invalidate_after_commit(db, room_type, booking.check_in, booking.check_out)
+        booking.status = "cancelled"
+        booking.unit_number = None
+        db.flush()
+        fill_released_unit(db, booking)
+    else:
+        booking.status = "cancelled"
+        db.flush()
+    record_booking_change(db, "cancelled", booking_to_public(booking, booking.room))
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def seed_bookings(Session, room_id: int, count: int, prefix: str, status: str) -> list:
+    # One night each on its own date, in unit 1: a cancel frees no unit anyone waits for
+    first_night = datetime(2030, 1, 1)
+    with Session() as db:
+        db.add_all(
+            Booking(
+                booking_id=f"{prefix}{i:08d}",
+                name="Bench",
+                email="bench@example.com",
+                phone="0000000000",
+                room_id=room_id,
+                check_in=first_night + timedelta(days=i),
+                check_out=first_night + timedelta(days=i + 1),
+                guests=1,
+                price_per_night=100.0,
+                total_nights=1,
+                total_price=100.0,
+                unit_number=1,
+                status=status,
+            )
+            for i in range(count)
+        )
+        db.commit()
+    with Session() as db:
+        rebuild_rollups(db)
+    return [(f"{prefix}{i:08d}",) for i in range(count)]
+
+
+def measure(engine, Session, fn, args_list) -> tuple:
+    statements = [0]
+
+    def count(*_):
+        statements[0] += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    started = time.perf_counter()
+    for args in args_list:
+        # New session per op, like one request
+        with Session() as db:
+            fn(db, *args)
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", count)
+    return statements[0] / len(args_list), elapsed / len(args_list) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="luxora-bench-")
+    try:
+        engine, _ = build_engines(f"sqlite:///{os.path.join(workdir, 'bench.db')}", "production")
+        Base.metadata.create_all(bind=engine)
+        legacy_session = sessionmaker(bind=engine, autoflush=False)  # old setting: expire_on_commit=True
+        session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+        with session() as db:
+            room_id = create_room(db, ROOM).id
+        # Alternate prices so every UPDATE really changes the row
+        updates = [(room_id, RoomUpdate(price=150.0 + i % 2)) for i in range(args.ops)]
+
+        cases = [
+            ("create_room", (legacy_session, legacy_create_room, [(ROOM,)] * args.ops), (session, create_room, [(ROOM,)] * args.ops)),
+            ("update_room", (legacy_session, legacy_update_room, updates), (session, update_room, updates)),
+            (
+                "cancel_pending",
+                (legacy_session, legacy_cancel_booking, seed_bookings(session, room_id, args.ops, "OLDP", "pending")),
+                (session, cancel_booking, seed_bookings(session, room_id, args.ops, "NEWP", "pending")),
+            ),
+            (
+                "cancel_confirmed",
+                (legacy_session, legacy_cancel_booking, seed_bookings(session, room_id, args.ops, "OLDC", "confirmed")),
+                (session, cancel_booking, seed_bookings(session, room_id, args.ops, "NEWC", "confirmed")),
+            ),
+        ]
+
+        print(f"{args.ops} ops per case")
+        print(f"{'operation':<18}{'stmts before':>14}{'stmts after':>13}{'us before':>11}{'us after':>10}")
+        for name, (old_s, old_fn, old_args), (new_s, new_fn, new_args) in cases:
+            old_stmts, old_us = measure(engine, old_s, old_fn, old_args)
+            new_stmts, new_us = measure(engine, new_s, new_fn, new_args)
+            print(f"{name:<18}{old_stmts:>14.1f}{new_stmts:>13.1f}{old_us:>11.0f}{new_us:>10.0f}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# tests/conftest.py
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# Settings are read at import time: point the app at a scratch directory first
+_workdir = tempfile.mkdtemp(prefix="luxora-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'main.db')}"
+os.environ["PROPERTY_DATA_DIR"] = os.path.join(_workdir, "properties")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["WRITE_PIPELINE_ENABLED"] = "false"
+
+from app.core.config import settings  # noqa: E402
+from app.db.init_db import init_property_db  # noqa: E402
+from app.db.session import build_engines, build_sessionmakers  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cleanup_workdir():
+    yield
+    shutil.rmtree(_workdir, ignore_errors=True)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """
+    SessionLocal of a fresh property database (production profile, full schema).
+    """
+    write_engine, read_engine = build_engines(f"sqlite:///{tmp_path / 'property.db'}", "production")
+    init_property_db(write_engine)
+    session_local, _ = build_sessionmakers(write_engine, read_engine, settings.DEFAULT_PROPERTY_CODE)
+    yield session_local
+    write_engine.dispose()
+    read_engine.dispose()
@@ -0,0 +1,112 @@
+# tests/test_admission.py
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.admission import (
+    PRIORITY_BROWSE,
+    PRIORITY_READ,
+    PRIORITY_WRITE,
+    AdmissionControlMiddleware,
+    AdmissionController,
+    ConcurrencyLimiter,
+    _default_exempt,
+    _default_rules,
+)
+
+
+def test_limiter_sheds_when_queue_is_full():
+    async def run():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=1)
+        assert await limiter.acquire(PRIORITY_READ, timeout=1)
+
+        waiter = asyncio.create_task(limiter.acquire(PRIORITY_READ, timeout=1))
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        # Queue full: refused at once instead of waiting
+        assert not await limiter.acquire(PRIORITY_READ, timeout=1)
+        assert limiter.shed == 1
+
+        limiter.release()
+        assert await waiter
+        assert limiter.active == 1
+
+    asyncio.run(run())
+
+
+def test_limiter_times_out_waiters():
+    async def run():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=4)
+        assert await limiter.acquire(PRIORITY_READ, timeout=1)
+        assert not await limiter.acquire(PRIORITY_READ, timeout=0.01)
+        assert limiter.timed_out == 1
+        assert limiter.waiting == 0
+
+    asyncio.run(run())
+
+
+def test_limiter_admits_by_priority_then_arrival():
+    async def run():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=10)
+        assert await limiter.acquire(PRIORITY_READ, timeout=1)
+
+        order = []
+
+        async def wait(name, priority):
+            assert await limiter.acquire(priority, timeout=1)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(wait("browse", PRIORITY_BROWSE)),
+            asyncio.create_task(wait("read", PRIORITY_READ)),
+            asyncio.create_task(wait("write-1", PRIORITY_WRITE)),
+            asyncio.create_task(wait("write-2", PRIORITY_WRITE)),
+        ]
+        await asyncio.sleep(0)
+        for _ in tasks:
+            limiter.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == ["write-1", "write-2", "read", "browse"]
+
+    asyncio.run(run())
+
+
+def _app(controller: AdmissionController) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, controller=controller, retry_after=7)
+
+    @app.get("/api/rooms/")
+    def rooms():
+        return []
+
+    @app.get("/api/health")
+    def health():
+        return {"status": "ok"}
+
+    return app
+
+
+def test_middleware_sheds_with_503_and_retry_after():
+    controller = AdmissionController(
+        rules=_default_rules("/api"),
+        exempt=_default_exempt("/api"),
+        route_limits={"rooms": 1},
+        max_concurrency=1,
+        max_queue=0,
+        queue_timeout=0.1,
+    )
+    client = TestClient(_app(controller))
+    assert client.get("/api/rooms/").status_code == 200
+
+    # Saturated: every slot taken and no queue
+    controller.global_limiter.active = 1
+    response = client.get("/api/rooms/")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+
+    # Health checks are exempt
+    assert client.get("/api/health").status_code == 200
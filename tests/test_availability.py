@@ -0,0 +1,136 @@
+# tests/test_availability.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from app.models.booking import Booking
+from app.models.hold import InventoryHold
+from app.models.room import Room
+from app.schemas.blackout import BlackoutCreate
+from app.schemas.booking import BookingCreate
+from app.schemas.hold import HoldCreate
+from app.services.availability_cache import availability_cache
+from app.services.blackout_service import create_blackout, delete_blackout
+from app.services.booking_service import check_availability, count_reserved_units, create_booking
+from app.services.hold_service import create_hold
+
+FIRST_NIGHT = date.today() + timedelta(days=10)
+CHECK_IN = datetime.combine(FIRST_NIGHT, datetime.min.time())
+CHECK_OUT = CHECK_IN + timedelta(days=3)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_availability_cache():
+    # Answers are cached per process; every test gets its own database
+    availability_cache.invalidate()
+    yield
+    availability_cache.invalidate()
+
+
+def _room(db, total_rooms=2):
+    room = db.scalars(
+        insert(Room)
+        .values(
+            name="Deluxe", description="Test room", price=100.0, room_type="Deluxe",
+            image_url="http://x", total_rooms=total_rooms,
+        )
+        .returning(Room)
+    ).one()
+    db.commit()
+    return room
+
+
+def _dates(check_in=CHECK_IN, check_out=CHECK_OUT):
+    return {"check_in": check_in.date().isoformat(), "check_out": check_out.date().isoformat()}
+
+
+def _hold(db, **dates):
+    return create_hold(db, HoldCreate(room_type="Deluxe", **(dates or _dates())))
+
+
+def _book(db, hold_token=None):
+    return create_booking(
+        db,
+        BookingCreate(
+            name="Test Guest", email="guest@example.com", phone="0771234567", room_type="Deluxe",
+            guests=1, hold_token=hold_token, **_dates(),
+        ),
+    )
+
+
+def _available(db, check_in=CHECK_IN, check_out=CHECK_OUT):
+    answer = check_availability(db, "Deluxe", *_dates(check_in, check_out).values())
+    return answer["room"]["available_rooms"] if answer["available"] else 0
+
+
+def test_unexpired_holds_count_as_reserved(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        _hold(db)
+        _hold(db, **_dates(CHECK_OUT - timedelta(days=1), CHECK_OUT + timedelta(days=2)))  # overlaps the last night
+        _hold(db, **_dates(CHECK_OUT, CHECK_OUT + timedelta(days=2)))  # starts on check-out day
+        assert count_reserved_units(db, room, CHECK_IN, CHECK_OUT) == 2
+        assert _available(db) == 0
+
+        db.execute(update(InventoryHold).values(expires_at=datetime.utcnow() - timedelta(seconds=1)))
+        db.commit()
+        assert count_reserved_units(db, room, CHECK_IN, CHECK_OUT) == 0
+
+
+def test_hold_is_used_up_by_the_booking_it_was_made_for(session_factory):
+    with session_factory() as db:
+        _room(db, total_rooms=1)
+        token = _hold(db)["token"]
+
+        # The only unit is held: no booking without the token
+        with pytest.raises(ValueError, match="no longer available"):
+            _book(db)
+        db.rollback()
+
+        booking = _book(db, hold_token=token)
+        assert booking.status == "confirmed"
+        assert db.scalar(select(func.count()).select_from(InventoryHold)) == 0
+        assert db.scalar(select(func.count()).select_from(Booking)) == 1
+        # The booking took the held unit, not a second one
+        assert _available(db) == 0
+
+        with pytest.raises(ValueError, match="Hold not found"):
+            _book(db, hold_token=token)
+
+
+def _blackout(db, start, end, units=1):
+    return create_blackout(db, BlackoutCreate(room_type="Deluxe", start_date=start, end_date=end, units=units))
+
+
+def test_blackout_nights_inside_the_stay_reduce_availability(session_factory):
+    last_night = FIRST_NIGHT + timedelta(days=2)
+    with session_factory() as db:
+        room = _room(db, total_rooms=3)
+        assert _available(db) == 3  # cached before the blackouts below
+
+        # Inclusive night ranges: each of these touches one night of the stay
+        _blackout(db, FIRST_NIGHT - timedelta(days=5), FIRST_NIGHT)
+        _blackout(db, last_night, last_night + timedelta(days=5))
+        # Ends the night before check-in / starts on the check-out day: no overlap
+        _blackout(db, FIRST_NIGHT - timedelta(days=3), FIRST_NIGHT - timedelta(days=1), units=3)
+        _blackout(db, last_night + timedelta(days=1), last_night + timedelta(days=1), units=3)
+
+        assert count_reserved_units(db, room, CHECK_IN, CHECK_OUT) == 2
+        assert _available(db) == 1
+
+        _book(db)
+        assert _available(db) == 0
+        with pytest.raises(ValueError, match="no longer available"):
+            _book(db)
+        db.rollback()
+
+
+def test_removing_a_blackout_gives_the_units_back(session_factory):
+    with session_factory() as db:
+        _room(db, total_rooms=2)
+        blackout = _blackout(db, FIRST_NIGHT + timedelta(days=1), FIRST_NIGHT + timedelta(days=1), units=2)
+        assert _available(db) == 0
+
+        delete_blackout(db, blackout.id)
+        assert _available(db) == 2
@@ -0,0 +1,96 @@
+# tests/test_availability_cache.py
+import threading
+import time
+from datetime import datetime
+
+from app.services.availability_cache import AvailabilityCache
+
+JAN_1, JAN_3, JAN_5, JAN_9 = (datetime(2030, 1, d) for d in (1, 3, 5, 9))
+
+
+def _key(room_type="Deluxe", check_in=JAN_1, check_out=JAN_3):
+    return ("main", room_type, check_in, check_out)
+
+
+def test_answer_is_reused_until_invalidated():
+    cache = AvailabilityCache(ttl_seconds=60, max_entries=100)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"available": True}
+
+    assert cache.get_or_compute(_key(), compute) == {"available": True}
+    assert cache.get_or_compute(_key(), compute) == {"available": True}
+    assert len(calls) == 1
+
+    cache.invalidate("Deluxe", JAN_1, JAN_3, property_code="main")
+    cache.get_or_compute(_key(), compute)
+    assert len(calls) == 2
+
+
+def test_invalidation_during_compute_is_not_cached():
+    cache = AvailabilityCache(ttl_seconds=60, max_entries=100)
+    calls = []
+
+    def compute_racing_a_write():
+        calls.append(1)
+        # A booking for the same room type commits while this answer is computed
+        cache.invalidate("Deluxe", JAN_1, JAN_3, property_code="main")
+        return {"available": True, "stale": True}
+
+    # The caller still gets its answer...
+    assert cache.get_or_compute(_key(), compute_racing_a_write)["stale"]
+    # ...but it is not kept
+    assert cache.get_or_compute(_key(), lambda: {"available": False}) == {"available": False}
+    assert cache.snapshot()["entries"] == 1
+
+
+def test_full_invalidation_during_compute_is_not_cached():
+    cache = AvailabilityCache(ttl_seconds=60, max_entries=100)
+
+    def compute():
+        cache.invalidate()
+        return {"available": True}
+
+    cache.get_or_compute(_key(), compute)
+    assert cache.snapshot()["entries"] == 0
+
+
+def test_invalidation_drops_only_overlapping_dates_of_the_room_type():
+    cache = AvailabilityCache(ttl_seconds=60, max_entries=100)
+    cache.get_or_compute(_key(check_in=JAN_1, check_out=JAN_3), lambda: {"n": 1})
+    cache.get_or_compute(_key(check_in=JAN_5, check_out=JAN_9), lambda: {"n": 2})
+    cache.get_or_compute(_key(room_type="Suite"), lambda: {"n": 3})
+
+    assert cache.invalidate("Deluxe", JAN_1, JAN_5, property_code="main") == 1
+    assert cache.get_or_compute(_key(check_in=JAN_5, check_out=JAN_9), lambda: {"n": 0}) == {"n": 2}
+    assert cache.get_or_compute(_key(room_type="Suite"), lambda: {"n": 0}) == {"n": 3}
+
+
+def test_concurrent_misses_share_one_computation():
+    cache = AvailabilityCache(ttl_seconds=60, max_entries=100)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"available": True}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_compute(_key(), slow_compute)))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(cache.get_or_compute(_key(), slow_compute)))
+    follower.start()
+    deadline = time.monotonic() + 5
+    while cache.coalesced == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"available": True}, {"available": True}]
@@ -0,0 +1,67 @@
+# tests/test_bookings.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from app.models.booking import Booking, BookingArchive
+from app.models.booking_change import BookingChange
+from app.models.room import Room
+from app.schemas.booking import BookingCreate
+from app.services.archive_service import archive_bookings
+from app.services.booking_service import cancel_booking, create_booking
+from app.services.maintenance_service import expire_pending_bookings
+
+FIRST_NIGHT = date.today() + timedelta(days=10)
+
+
+def _expired_booking(db):
+    db.execute(
+        insert(Room).values(
+            name="Deluxe", description="Test room", price=100.0, room_type="Deluxe", image_url="http://x", total_rooms=2
+        )
+    )
+    booking = create_booking(
+        db,
+        BookingCreate(
+            name="Test Guest",
+            email="guest@example.com",
+            phone="0771234567",
+            room_type="Deluxe",
+            check_in=FIRST_NIGHT.isoformat(),
+            check_out=(FIRST_NIGHT + timedelta(days=2)).isoformat(),
+            guests=1,
+        ),
+    )
+    # Stand in for a pending booking that was never confirmed
+    db.execute(
+        update(Booking)
+        .where(Booking.id == booking.id)
+        .values(status="pending", created_at=datetime.utcnow() - timedelta(days=1))
+    )
+    db.commit()
+    assert expire_pending_bookings(db, ttl_minutes=60) == 1
+    return booking.booking_id
+
+
+def _events(db):
+    return db.scalars(select(BookingChange.event).order_by(BookingChange.seq)).all()
+
+
+def test_expired_booking_cannot_be_cancelled(session_factory):
+    with session_factory() as db:
+        booking_id = _expired_booking(db)
+        with pytest.raises(ValueError, match="Expired"):
+            cancel_booking(db, booking_id)
+        db.rollback()
+
+        assert db.scalar(select(Booking.status).where(Booking.booking_id == booking_id)) == "expired"
+        assert _events(db) == ["created", "expired"]
+
+
+def test_expired_bookings_are_archived(session_factory):
+    with session_factory() as db:
+        booking_id = _expired_booking(db)
+        assert archive_bookings(db, older_than_days=-30)["archived"] == 1
+        assert db.scalar(select(func.count()).select_from(Booking)) == 0
+        assert db.scalar(select(BookingArchive.status).where(BookingArchive.booking_id == booking_id)) == "expired"
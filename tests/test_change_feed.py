@@ -0,0 +1,110 @@
+# tests/test_change_feed.py
+import asyncio
+
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.models.booking_change import BookingChange
+from app.services.change_feed import ChangeBroadcaster, list_changes, record_booking_change
+
+
+def _record(session_factory, count):
+    with session_factory() as db:
+        for i in range(count):
+            record_booking_change(db, "created", {"booking_id": f"LUX{i:06d}", "status": "confirmed"})
+        db.commit()
+
+
+def _broadcaster(session_factory, queue_size=16):
+    return ChangeBroadcaster(session_factory, poll_seconds=60, queue_size=queue_size, max_subscribers=10)
+
+
+async def _take(stream, count):
+    return [await asyncio.wait_for(stream.__anext__(), 5) for _ in range(count)]
+
+
+def _event_ids(messages):
+    return [int(m.split("\n", 1)[0].removeprefix("id: ")) for m in messages if m.startswith("id: ")]
+
+
+def test_list_changes_resumes_after_since(session_factory):
+    _record(session_factory, 5)
+    with session_factory() as db:
+        page = list_changes(db, since=2)
+        assert [e["seq"] for e in page["events"]] == [3, 4, 5]
+        assert page["last_seq"] == 5
+        assert not page["reset"]
+
+        assert list_changes(db) == {"events": [], "last_seq": 5, "reset": False}
+
+
+def test_list_changes_resets_when_events_were_purged(session_factory):
+    _record(session_factory, 5)
+    with session_factory() as db:
+        db.execute(delete(BookingChange).where(BookingChange.seq <= 3))
+        db.commit()
+        assert list_changes(db, since=1)["reset"]
+        # Nothing missed: the client had seen everything up to the oldest kept event
+        assert not list_changes(db, since=3)["reset"]
+
+
+def test_stream_replays_from_since_then_follows_live_events(session_factory):
+    _record(session_factory, 5)
+    broadcaster = _broadcaster(session_factory)
+    broadcaster.last_seq = 5
+
+    async def run():
+        stream = broadcaster.stream(since=2)
+        try:
+            first = await _take(stream, 4)
+            assert first[0].startswith("retry: ")
+            assert _event_ids(first) == [3, 4, 5]
+
+            # A live event, plus a duplicate of one already replayed
+            broadcaster._publish(5, "id: 5\nevent: created\ndata: {}\n\n")
+            broadcaster._publish(6, "id: 6\nevent: created\ndata: {}\n\n")
+            assert _event_ids(await _take(stream, 1)) == [6]
+        finally:
+            await stream.aclose()
+        assert not broadcaster._subscribers
+
+    asyncio.run(run())
+
+
+def test_stream_resets_when_too_far_behind(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGE_FEED_PAGE_SIZE", 3)
+    _record(session_factory, 5)
+    broadcaster = _broadcaster(session_factory)
+    broadcaster.last_seq = 5
+
+    async def run():
+        stream = broadcaster.stream(since=0)
+        try:
+            messages = await _take(stream, 2)
+            assert messages[1].startswith("event: reset")
+
+            # After the reset it follows live events from the current seq
+            broadcaster._publish(6, "id: 6\nevent: created\ndata: {}\n\n")
+            assert _event_ids(await _take(stream, 1)) == [6]
+        finally:
+            await stream.aclose()
+
+    asyncio.run(run())
+
+
+def test_slow_subscriber_is_disconnected_on_overflow(session_factory):
+    broadcaster = _broadcaster(session_factory, queue_size=2)
+
+    async def run():
+        stream = broadcaster.stream(since=None)
+        await _take(stream, 1)  # subscribed
+        for seq in range(1, 4):
+            broadcaster._publish(seq, f"id: {seq}\nevent: created\ndata: {{}}\n\n")
+
+        assert broadcaster.dropped_subscribers == 1
+        assert not broadcaster._subscribers
+        # The stream ends; the client reconnects with Last-Event-ID
+        remaining = [message async for message in stream]
+        assert remaining == []
+
+    asyncio.run(run())
@@ -0,0 +1,110 @@
+# tests/test_partitions.py
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.init_db import init_db
+from app.db.partitions import get_property_db, property_router
+from app.db.session import SessionLocal
+from app.models.property import Property
+from app.models.room import Room
+from app.schemas.property import PropertyCreate
+from app.services import write_pipeline
+from app.services.change_feed import change_feed_hub
+from app.services.property_service import create_property
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Re-read the property list on every request
+    monkeypatch.setattr(settings, "PROPERTY_CACHE_TTL_SECONDS", 0)
+    init_db()
+
+    app = FastAPI()
+
+    @app.get("/rooms/count")
+    def count_rooms(db: Session = Depends(get_property_db)):
+        return db.scalar(select(func.count()).select_from(Room))
+
+    @app.post("/rooms")
+    def add_room(db: Session = Depends(get_property_db)):
+        db.execute(
+            insert(Room).values(
+                name="Deluxe", description="Test room", price=100.0, room_type="Deluxe", image_url="http://x"
+            )
+        )
+        db.commit()
+
+    return TestClient(app)
+
+
+def _property(code):
+    with SessionLocal() as db:
+        create_property(db, PropertyCreate(code=code, name=f"Hotel {code}"))
+
+
+def _deactivate(code):
+    with SessionLocal() as db:
+        db.execute(update(Property).where(Property.code == code).values(is_active=False))
+        db.commit()
+
+
+def test_unknown_property_is_404(client):
+    assert client.get("/rooms/count", headers={"X-Property": "no-such-hotel"}).status_code == 404
+    assert client.get("/rooms/count?property=no-such-hotel").status_code == 404
+    assert "no-such-hotel" not in property_router.opened()
+
+
+def test_each_property_has_its_own_rooms(client):
+    _property("north")
+    _property("south")
+
+    assert client.post("/rooms", headers={"X-Property": "north"}).status_code == 200
+    assert client.post("/rooms", headers={"X-Property": "north"}).status_code == 200
+    assert client.post("/rooms?property=south").status_code == 200
+
+    assert client.get("/rooms/count", headers={"X-Property": "north"}).json() == 2
+    assert client.get("/rooms/count", headers={"X-Property": "South "}).json() == 1
+    assert client.get("/rooms/count").json() == 0  # the default property
+
+
+def test_deactivated_property_is_404_and_closed(client):
+    _property("east")
+    assert client.post("/rooms", headers={"X-Property": "east"}).status_code == 200
+    pipeline = write_pipeline.BookingWritePipeline(session_factory=property_router.database("east").SessionLocal)
+    pipeline.start()
+    write_pipeline._pipelines["east"] = pipeline
+
+    try:
+        _deactivate("east")
+        assert client.get("/rooms/count", headers={"X-Property": "east"}).status_code == 404
+        assert "east" not in property_router.opened()
+        # The property's writer went with its database
+        assert "east" not in write_pipeline.booking_pipelines()
+        assert pipeline._closed
+    finally:
+        write_pipeline.stop_booking_pipeline()
+
+
+def test_deactivated_property_stops_its_change_feed(client):
+    _property("west")
+
+    async def run():
+        broadcaster = await change_feed_hub.broadcaster("west")
+        assert broadcaster.running
+        _deactivate("west")
+
+        # Closed from a worker thread, like a request would
+        with pytest.raises(LookupError):
+            await asyncio.to_thread(property_router.database, "west")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert not broadcaster.running
+        assert "west" not in change_feed_hub.snapshot()["properties"]
+
+    asyncio.run(run())
@@ -0,0 +1,150 @@
+# tests/test_pricing.py
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.room import Room
+from app.schemas.rate import RateOverrideCreate, StayDiscountItem, StayDiscountsUpdate, WeekdayMultipliersUpdate
+from app.services import pricing_service
+from app.services.pricing_service import (
+    create_rate_override,
+    invalidate_rate_cache,
+    price_calendar,
+    price_stay,
+    price_stays,
+    set_stay_discounts,
+    set_weekday_multipliers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rate_cache():
+    # Compiled tables are cached per process; every test gets its own database
+    invalidate_rate_cache()
+    yield
+    invalidate_rate_cache()
+
+
+def _room(db, room_type="Deluxe", price=100.0, name=None):
+    room = db.scalars(
+        insert(Room)
+        .values(
+            name=name or room_type, description="Test room", price=price, room_type=room_type,
+            image_url="http://x", total_rooms=5,
+        )
+        .returning(Room)
+    ).one()
+    db.commit()
+    return room
+
+
+def _override(db, start, end, price=None, multiplier=1.0, priority=0, room_type="Deluxe"):
+    create_rate_override(
+        db,
+        RateOverrideCreate(
+            room_type=room_type, start_date=start, end_date=end, price=price, multiplier=multiplier, priority=priority
+        ),
+    )
+
+
+def test_no_rate_plan_charges_the_base_price(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        quote = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 4))
+    assert quote.nightly_rates == [100.0, 100.0, 100.0]
+    assert quote.total_price == 300.0
+    assert quote.discount_percent == 0.0
+
+
+def test_override_covers_inclusive_nights_clipped_to_the_stay(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        # Starts before the stay; only its last night (Jan 1) falls inside
+        _override(db, date(2029, 12, 20), date(2030, 1, 1), price=80.0)
+        # Ends after the stay; Jan 4 is its first night
+        _override(db, date(2030, 1, 4), date(2030, 2, 1), multiplier=1.5)
+        quote = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 6))
+    assert quote.nightly_rates == [80.0, 100.0, 100.0, 150.0, 150.0]
+
+
+def test_higher_priority_override_wins_where_ranges_overlap(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        _override(db, date(2030, 1, 2), date(2030, 1, 4), price=150.0, priority=0)
+        _override(db, date(2030, 1, 3), date(2030, 1, 10), price=200.0, priority=1)
+        # Created last, but lower priority: loses on Jan 3
+        _override(db, date(2030, 1, 3), date(2030, 1, 3), price=50.0, priority=-1)
+        quote = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 6))
+    assert quote.nightly_rates == [100.0, 150.0, 200.0, 200.0, 200.0]
+
+
+def test_weekday_multipliers_follow_the_calendar(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        # Friday x1.5, Saturday x2
+        set_weekday_multipliers(db, WeekdayMultipliersUpdate(room_type="Deluxe", multipliers=[1, 1, 1, 1, 1.5, 2, 1]))
+        # Thursday 2030-01-03, nine nights: wraps into the next week
+        quote = price_stay(db, room, datetime(2030, 1, 3), datetime(2030, 1, 12))
+        calendar = price_calendar(db, room, date(2030, 1, 3), date(2030, 1, 11))
+    assert quote.nightly_rates == [100.0, 150.0, 200.0, 100.0, 100.0, 100.0, 100.0, 100.0, 150.0]
+    assert [d["price"] for d in calendar] == quote.nightly_rates
+
+
+def test_weekday_multiplier_applies_on_top_of_an_override(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        set_weekday_multipliers(db, WeekdayMultipliersUpdate(room_type="Deluxe", multipliers=[1, 1, 1, 1, 1, 2, 1]))
+        _override(db, date(2030, 1, 5), date(2030, 1, 5), price=120.0)  # a Saturday
+        quote = price_stay(db, room, datetime(2030, 1, 5), datetime(2030, 1, 6))
+    assert quote.nightly_rates == [240.0]
+
+
+def test_best_qualifying_stay_discount_applies(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        # Not monotonic: the longer tier has the smaller discount
+        set_stay_discounts(
+            db,
+            StayDiscountsUpdate(
+                room_type="Deluxe",
+                discounts=[
+                    StayDiscountItem(min_nights=3, discount_percent=10),
+                    StayDiscountItem(min_nights=7, discount_percent=5),
+                    StayDiscountItem(min_nights=14, discount_percent=20),
+                ],
+            ),
+        )
+        two = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 3))
+        seven = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 8))
+        fourteen = price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 15))
+    assert two.discount_percent == 0.0
+    assert seven.discount_percent == 10.0
+    assert seven.subtotal == 700.0 and seven.total_price == 630.0
+    assert seven.price_per_night == 90.0
+    assert fourteen.discount_percent == 20.0
+
+
+def test_rate_change_reprices_cached_quotes(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        assert price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 2)).total_price == 100.0
+        _override(db, date(2030, 1, 1), date(2030, 1, 1), price=180.0)
+        assert price_stay(db, room, datetime(2030, 1, 1), datetime(2030, 1, 2)).total_price == 180.0
+
+
+def test_price_stays_looks_up_each_room_type_once(session_factory, monkeypatch):
+    compiled = []
+    compile_rate_table = pricing_service.compile_rate_table
+
+    def counting(db, room_type):
+        compiled.append(room_type)
+        return compile_rate_table(db, room_type)
+
+    monkeypatch.setattr(pricing_service, "compile_rate_table", counting)
+    monkeypatch.setattr(pricing_service.settings, "PRICING_CACHE_TTL_SECONDS", 0)  # no reuse across calls
+    with session_factory() as db:
+        rooms = [_room(db, "Deluxe", name="Deluxe A"), _room(db, "Deluxe", name="Deluxe B"), _room(db, "Suite")]
+        quotes = price_stays(db, rooms, datetime(2030, 1, 1), datetime(2030, 1, 3))
+    assert sorted(compiled) == ["Deluxe", "Suite"]
+    assert [q.total_price for _, q in quotes] == [200.0, 200.0, 200.0]
@@ -0,0 +1,121 @@
+# tests/test_rollups.py
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from app.core.config import settings
+from app.models.booking import Booking
+from app.models.rollup import OccupancyRollup
+from app.models.room import Room
+from app.schemas.booking import BookingCreate
+from app.services.archive_service import archive_bookings
+from app.services.booking_service import cancel_booking, create_booking
+from app.services.rollup_service import UPSERT_BATCH_NIGHTS, check_rollups, occupancy_report, rebuild_rollups
+
+FIRST_NIGHT = date.today() + timedelta(days=10)
+
+
+def _room(db, room_type="Deluxe", total_rooms=2):
+    room = db.scalars(
+        insert(Room)
+        .values(
+            name=room_type, description="Test room", price=100.0, room_type=room_type,
+            image_url="http://x", total_rooms=total_rooms,
+        )
+        .returning(Room)
+    ).one()
+    db.commit()
+    return room
+
+
+def _book(db, nights, room_type="Deluxe", first_night=FIRST_NIGHT):
+    data = BookingCreate(
+        name="Test Guest",
+        email="guest@example.com",
+        phone="0771234567",
+        room_type=room_type,
+        check_in=first_night.isoformat(),
+        check_out=(first_night + timedelta(days=nights)).isoformat(),
+        guests=1,
+    )
+    return create_booking(db, data)
+
+
+def _rollup_nights(db):
+    return db.scalar(select(func.coalesce(func.sum(OccupancyRollup.rooms_sold), 0)))
+
+
+def _sold_nights(db):
+    # A cancel leaves zeroed rows behind; a rebuild does not write them
+    return {
+        (r.day, r.room_id): (r.rooms_sold, r.revenue)
+        for r in db.query(OccupancyRollup).filter(OccupancyRollup.rooms_sold != 0)
+    }
+
+
+def test_incremental_rollups_match_a_rebuild_through_create_cancel_archive(session_factory, monkeypatch):
+    nights = UPSERT_BATCH_NIGHTS + 50  # several upsert statements per booking
+    monkeypatch.setattr(settings, "MAX_STAY_NIGHTS", nights)
+
+    with session_factory() as db:
+        _room(db)
+        long_stay = _book(db, nights)
+        short_stay_price = _book(db, 3).total_price
+        assert _rollup_nights(db) == nights + 3
+        assert check_rollups(db) == []
+
+        cancel_booking(db, long_stay.booking_id)
+        assert _rollup_nights(db) == 3
+        assert check_rollups(db) == []
+
+        # Archived confirmed stays still count (far future cutoff archives everything)
+        assert archive_bookings(db, older_than_days=-(nights + 400))["archived"] == 2
+        assert db.scalar(select(func.count()).select_from(Booking)) == 0
+        assert check_rollups(db) == []
+
+        before = _sold_nights(db)
+        rebuild_rollups(db)
+    with session_factory() as db:
+        after = _sold_nights(db)
+        assert check_rollups(db) == []
+    assert after.keys() == before.keys()
+    for key, (sold, revenue) in before.items():
+        assert after[key][0] == sold
+        assert after[key][1] == pytest.approx(revenue)
+    assert sum(revenue for _, revenue in after.values()) == pytest.approx(short_stay_price)
+
+
+def test_check_rollups_reports_drift(session_factory):
+    with session_factory() as db:
+        room = _room(db)
+        _book(db, 2)
+        db.execute(update(OccupancyRollup).values(rooms_sold=OccupancyRollup.rooms_sold + 1))
+        db.commit()
+
+        mismatches = check_rollups(db)
+        assert [(m["room_id"], m["expected_rooms_sold"], m["actual_rooms_sold"]) for m in mismatches] == [
+            (room.id, 1, 2),
+            (room.id, 1, 2),
+        ]
+        rebuild_rollups(db)
+    with session_factory() as db:
+        assert check_rollups(db) == []
+
+
+def test_occupancy_report_leaves_inactive_rooms_out_of_both_sides(session_factory):
+    with session_factory() as db:
+        _room(db, "Deluxe", total_rooms=2)
+        suite = _room(db, "Suite", total_rooms=1)
+        _book(db, 1, "Deluxe")
+        _book(db, 1, "Suite")
+        db.execute(update(Room).where(Room.id == suite.id).values(is_active=False))
+        db.commit()
+
+        by_type = occupancy_report(db, FIRST_NIGHT, FIRST_NIGHT, "room_type")
+        by_month = occupancy_report(db, FIRST_NIGHT, FIRST_NIGHT, "month")
+
+    assert [(r["key"], r["room_nights_sold"], r["room_nights_available"]) for r in by_type] == [("Deluxe", 1, 2)]
+    assert by_month[0]["room_nights_sold"] == 1
+    assert by_month[0]["room_nights_available"] == 2
+    assert by_month[0]["occupancy_rate"] == 0.5
@@ -0,0 +1,96 @@
+# tests/test_unit_service.py
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from app.services.unit_service import Stay, partition_stays
+
+SEASON_START = datetime(2030, 1, 1)
+
+
+def _day(n):
+    return SEASON_START + timedelta(days=n)
+
+
+def _busiest_night(stays):
+    events = sorted([(s.start, 1) for s in stays] + [(s.end, -1) for s in stays])  # ends sort first
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def _assert_no_overlap(stays, assignments):
+    per_unit = defaultdict(list)
+    for s in stays:
+        per_unit[assignments[s.key]].append((s.start, s.end))
+    for intervals in per_unit.values():
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert end <= start, "two stays share a unit"
+
+
+def _random_stays(rng, n):
+    stays = []
+    for key in range(n):
+        start = rng.randrange(30)
+        stays.append(Stay(key, _day(start), _day(start + rng.randint(1, 7))))
+    return stays
+
+
+def test_partition_uses_exactly_the_busiest_night():
+    rng = random.Random(7)
+    for _ in range(3000):
+        stays = _random_stays(rng, rng.randint(1, 40))
+        peak = _busiest_night(stays)
+        plan = partition_stays(stays, peak)
+
+        assert not plan.unassigned
+        assert plan.units_used == peak
+        _assert_no_overlap(stays, plan.assignments)
+
+
+def test_partition_too_few_units_leaves_stays_unassigned():
+    stays = [Stay(1, _day(0), _day(3)), Stay(2, _day(1), _day(4)), Stay(3, _day(2), _day(5))]
+    plan = partition_stays(stays, 2)
+    assert plan.unassigned == [3]
+    _assert_no_overlap([s for s in stays if s.key in plan.assignments], plan.assignments)
+
+
+def test_in_house_guest_keeps_unit_over_earlier_unassigned_stay():
+    now = _day(5)
+    stays = [
+        Stay(1, _day(1), _day(8)),  # in house, no unit yet
+        Stay(2, _day(3), _day(9), unit=1),  # in house in unit 1
+    ]
+    plan = partition_stays(stays, 2, pin_before=now)
+    assert plan.assignments == {2: 1, 1: 2}
+
+
+def test_partition_with_in_house_guests_never_moves_them():
+    rng = random.Random(11)
+    for _ in range(3000):
+        now = _day(rng.randrange(15))
+        stays = [s for s in _random_stays(rng, rng.randint(1, 40)) if s.end > now]
+        if not stays:
+            continue
+        units = _busiest_night(stays)
+
+        # Most in-house guests already have (distinct) units
+        free_units = list(range(1, units + 1))
+        rng.shuffle(free_units)
+        stays = [
+            Stay(s.key, s.start, s.end, free_units.pop())
+            if s.start < now and free_units and rng.random() < 0.7
+            else s
+            for s in stays
+        ]
+
+        plan = partition_stays(stays, units, pin_before=now)
+        assert not plan.unassigned
+        assert plan.units_used <= units
+        _assert_no_overlap(stays, plan.assignments)
+        for s in stays:
+            if s.start < now and s.unit is not None:
+                assert plan.assignments[s.key] == s.unit
@@ -0,0 +1,105 @@
+# tests/test_write_pipeline.py
+import threading
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.models.room import Room
+from app.services.write_pipeline import BookingWritePipeline, PipelineUnavailable
+
+
+def _add_room(db, name):
+    db.execute(
+        insert(Room).values(
+            name=name, description="Test room", price=100.0, room_type=name, image_url="http://x", total_rooms=1
+        )
+    )
+    return name
+
+
+def _fail_after_insert(db, name):
+    _add_room(db, name)
+    raise ValueError("Room not available for selected dates")
+
+
+def _room_names(db):
+    return set(db.scalars(select(Room.name)))
+
+
+def _names(session_factory):
+    with session_factory() as db:
+        return _room_names(db)
+
+
+def _block_writer(pipeline):
+    """
+    Occupies the writer with a running batch until the returned event is set.
+    """
+    started, release = threading.Event(), threading.Event()
+
+    def block(db):
+        started.set()
+        return release.wait(5)
+
+    fut = pipeline.submit(block)
+    assert started.wait(5)
+    return fut, release
+
+
+def test_failing_item_rolls_back_only_its_savepoint(session_factory):
+    pipeline = BookingWritePipeline(session_factory=session_factory, window_ms=200)
+    # Queued before the writer starts, so all of them land in one batch
+    ok_first = pipeline.submit(_add_room, "first")
+    failing = pipeline.submit(_fail_after_insert, "failing")
+    # Later items see earlier ones of the same batch
+    seen = pipeline.submit(_room_names)
+    ok_last = pipeline.submit(_add_room, "last")
+    pipeline.start()
+    try:
+        assert ok_first.result(timeout=5) == "first"
+        with pytest.raises(ValueError):
+            failing.result(timeout=5)
+        assert seen.result(timeout=5) == {"first"}
+        assert ok_last.result(timeout=5) == "last"
+    finally:
+        pipeline.stop()
+
+    assert pipeline.batches == 1
+    assert _names(session_factory) == {"first", "last"}
+
+
+def test_timed_out_item_is_withdrawn(session_factory):
+    pipeline = BookingWritePipeline(session_factory=session_factory, window_ms=0)
+    pipeline.start()
+    try:
+        blocker, release = _block_writer(pipeline)
+        with pytest.raises(PipelineUnavailable):
+            pipeline.execute(_add_room, "late", timeout=0.05)
+        release.set()
+        blocker.result(timeout=5)
+        # The next batch runs, but the withdrawn item is skipped
+        assert pipeline.execute(_add_room, "after") == "after"
+    finally:
+        pipeline.stop()
+
+    assert _names(session_factory) == {"after"}
+
+
+def test_stop_fails_queued_items(session_factory):
+    pipeline = BookingWritePipeline(session_factory=session_factory, window_ms=0)
+    pipeline.start()
+    blocker, release = _block_writer(pipeline)
+    queued = [pipeline.submit(_add_room, f"queued-{i}") for i in range(3)]
+
+    # The writer is still busy when the join gives up
+    pipeline.stop(timeout=0.05)
+    for fut in queued:
+        with pytest.raises(PipelineUnavailable):
+            fut.result(timeout=1)
+    with pytest.raises(PipelineUnavailable):
+        pipeline.submit(_add_room, "too-late").result(timeout=1)
+
+    release.set()
+    blocker.result(timeout=5)
+    with session_factory() as db:
+        assert db.scalar(select(func.count()).select_from(Room)) == 0